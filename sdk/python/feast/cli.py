@@ -562,6 +562,35 @@ def registry_dump_command(ctx: click.Context):
     click.echo(registry_dump(repo_config, repo_path=repo))
 
 
+@cli.group(name="registry")
+def registry_cmd():
+    """
+    Manage the metadata registry
+    """
+    pass
+
+
+@registry_cmd.command("snapshot")
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.pass_context
+def registry_snapshot_command(ctx: click.Context, output_path: str):
+    """
+    Write a snapshot of the metadata registry to OUTPUT_PATH
+
+    The snapshot can be served with `registry_type: snapshot`, which opens it without
+    loading the whole registry.
+    """
+    from feast.infra.registry.snapshot import write_registry_snapshot
+
+    repo = ctx.obj["CHDIR"]
+    fs_yaml_file = ctx.obj["FS_YAML_FILE"]
+    cli_check_repo(repo, fs_yaml_file)
+    store = FeatureStore(repo_path=str(repo), fs_yaml_file=fs_yaml_file)
+
+    write_registry_snapshot(store.registry.proto(), output_path)
+    click.echo(f"Wrote registry snapshot to {output_path}")
+
+
 @cli.command("materialize")
 @click.argument("start_ts")
 @click.argument("end_ts")
@@ -622,6 +651,55 @@ def materialize_incremental_command(ctx: click.Context, end_ts: str, views: List
     )
 
 
+@cli.command("mysql-migrate-to-wide-layout")
+@click.option(
+    "--views",
+    "-v",
+    help="Feature views to migrate",
+    multiple=True,
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Number of entities copied per transaction",
+)
+@click.pass_context
+def mysql_migrate_to_wide_layout_command(
+    ctx: click.Context, views: List[str], batch_size: Optional[int]
+):
+    """
+    Backfill the wide-row tables of the MySQL online store from the existing per-feature tables. Run this
+    while writes are paused and before setting `table_layout: wide`. If you don't specify feature view
+    names using --views, all registered Feature Views will be migrated.
+    """
+    from feast.infra.online_stores.contrib.mysql_online_store.mysql import (
+        MySQLOnlineStore,
+    )
+
+    repo = ctx.obj["CHDIR"]
+    fs_yaml_file = ctx.obj["FS_YAML_FILE"]
+    cli_check_repo(repo, fs_yaml_file)
+    store = FeatureStore(repo_path=str(repo), fs_yaml_file=fs_yaml_file)
+    online_store = store._get_provider().online_store
+    if not isinstance(online_store, MySQLOnlineStore):
+        raise click.UsageError("The configured online store is not a MySQL online store.")
+
+    feature_views = (
+        [store.get_feature_view(name) for name in views]
+        if views
+        else store.list_feature_views()
+    )
+    for feature_view in feature_views:
+        num_entities = online_store.migrate_to_wide_layout(
+            store.config, feature_view, batch_size=batch_size
+        )
+        click.echo(
+            f"Migrated {Style.BRIGHT + Fore.GREEN}{num_entities}{Style.RESET_ALL} entities of "
+            f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}"
+        )
+
+
 @cli.command("init")
 @click.argument("PROJECT_DIRECTORY", required=False)
 @click.option(
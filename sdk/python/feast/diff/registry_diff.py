@@ -1,13 +1,10 @@
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, cast
 
-from feast.base_feature_view import BaseFeatureView
-from feast.data_source import DataSource
 from feast.diff.property_diff import PropertyDiff, TransitionType
-from feast.entity import Entity
 from feast.feast_object import FeastObject, FeastObjectSpecProto
-from feast.feature_service import FeatureService
 from feast.feature_view import DUMMY_ENTITY_NAME
+from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry import FEAST_OBJECT_TYPES, FeastObjectType
 from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
@@ -118,12 +115,27 @@ FeastObjectProto = TypeVar(
 
 FIELDS_TO_IGNORE = {"project"}
 
+# Registry kind, as passed to `BaseRegistry.get_object_fingerprints`, of each object type.
+_FEAST_OBJECT_TYPE_KINDS = {
+    FeastObjectType.DATA_SOURCE: proto_registry_utils.DATA_SOURCES,
+    FeastObjectType.ENTITY: proto_registry_utils.ENTITIES,
+    FeastObjectType.FEATURE_VIEW: proto_registry_utils.FEATURE_VIEWS,
+    FeastObjectType.ON_DEMAND_FEATURE_VIEW: proto_registry_utils.ON_DEMAND_FEATURE_VIEWS,
+    FeastObjectType.REQUEST_FEATURE_VIEW: proto_registry_utils.REQUEST_FEATURE_VIEWS,
+    FeastObjectType.STREAM_FEATURE_VIEW: proto_registry_utils.STREAM_FEATURE_VIEWS,
+    FeastObjectType.FEATURE_SERVICE: proto_registry_utils.FEATURE_SERVICES,
+}
+
 
 def diff_registry_objects(
-    current: FeastObject, new: FeastObject, object_type: FeastObjectType
+    current: FeastObject,
+    new: FeastObject,
+    object_type: FeastObjectType,
+    new_proto: Optional[Any] = None,
 ) -> FeastObjectDiff:
     current_proto = current.to_proto()
-    new_proto = new.to_proto()
+    if new_proto is None:
+        new_proto = new.to_proto()
     assert current_proto.DESCRIPTOR.full_name == new_proto.DESCRIPTOR.full_name
     property_diffs = []
     transition: TransitionType = TransitionType.UNCHANGED
@@ -246,52 +258,106 @@ def diff_between(
     """
     diff = RegistryDiff()
 
-    (
-        objs_to_keep,
-        objs_to_delete,
-        objs_to_update,
-        objs_to_add,
-    ) = extract_objects_for_keep_delete_update_add(
-        registry, current_project, desired_repo_contents
+    desired_object_type_to_objects = FeastObjectType.get_objects_from_repo_contents(
+        desired_repo_contents
     )
 
     for object_type in FEAST_OBJECT_TYPES:
-        objects_to_keep = objs_to_keep[object_type]
-        objects_to_delete = objs_to_delete[object_type]
-        objects_to_update = objs_to_update[object_type]
-        objects_to_add = objs_to_add[object_type]
-
-        for e in objects_to_add:
-            diff.add_feast_object_diff(
-                FeastObjectDiff(
-                    name=e.name,
-                    feast_object_type=object_type,
-                    current_feast_object=None,
-                    new_feast_object=e,
-                    feast_object_property_diffs=[],
-                    transition_type=TransitionType.CREATE,
+        # TODO(adchia): Remove the "if X.name" condition when data sources are forced to have names
+        desired_objs = [e for e in desired_object_type_to_objects[object_type] if e.name]
+        desired_obj_names = {e.name for e in desired_objs}
+
+        # Objects whose proto has the same fingerprint as the one stored in the registry are unchanged. When no
+        # stored object is changed or deleted, the stored objects aren't read at all, and the desired objects stand
+        # in for the current ones of unchanged objects.
+        fingerprints = registry.get_object_fingerprints(
+            _FEAST_OBJECT_TYPE_KINDS[object_type], current_project
+        )
+        new_protos: Dict[str, Any] = {}
+        unchanged_obj_names: Set[str] = set()
+        if fingerprints is not None:
+            for e in desired_objs:
+                if e.name in fingerprints:
+                    new_protos[e.name] = e.to_proto()
+                    if fingerprints[e.name] == proto_registry_utils.fingerprint(
+                        new_protos[e.name]
+                    ):
+                        unchanged_obj_names.add(e.name)
+        if fingerprints is not None and unchanged_obj_names >= {
+            name for name in fingerprints if name
+        }:
+            existing_objs = {
+                e.name: e for e in desired_objs if e.name in unchanged_obj_names
+            }
+        else:
+            existing_objs = {
+                e.name: e
+                for e in object_type.get_objects_of_type_from_registry(
+                    registry, current_project
                 )
-            )
-        for e in objects_to_delete:
-            diff.add_feast_object_diff(
-                FeastObjectDiff(
-                    name=e.name,
-                    feast_object_type=object_type,
-                    current_feast_object=e,
-                    new_feast_object=None,
-                    feast_object_property_diffs=[],
-                    transition_type=TransitionType.DELETE,
+                if e.name
+            }
+
+        for e in desired_objs:
+            if e.name not in existing_objs:
+                diff.add_feast_object_diff(
+                    FeastObjectDiff(
+                        name=e.name,
+                        feast_object_type=object_type,
+                        current_feast_object=None,
+                        new_feast_object=e,
+                        feast_object_property_diffs=[],
+                        transition_type=TransitionType.CREATE,
+                    )
+                )
+        for name, e in existing_objs.items():
+            if name not in desired_obj_names:
+                diff.add_feast_object_diff(
+                    FeastObjectDiff(
+                        name=e.name,
+                        feast_object_type=object_type,
+                        current_feast_object=e,
+                        new_feast_object=None,
+                        feast_object_property_diffs=[],
+                        transition_type=TransitionType.DELETE,
+                    )
+                )
+        for e in desired_objs:
+            if e.name not in existing_objs:
+                continue
+            current_obj = existing_objs[e.name]
+            if e.name in unchanged_obj_names:
+                diff.add_feast_object_diff(
+                    FeastObjectDiff(
+                        name=e.name,
+                        feast_object_type=object_type,
+                        current_feast_object=current_obj,
+                        new_feast_object=e,
+                        feast_object_property_diffs=[],
+                        transition_type=TransitionType.UNCHANGED,
+                    )
+                )
+            else:
+                diff.add_feast_object_diff(
+                    diff_registry_objects(
+                        current_obj, e, object_type, new_protos.get(e.name)
+                    )
                 )
-            )
-        for e in objects_to_update:
-            current_obj = [_e for _e in objects_to_keep if _e.name == e.name][0]
-            diff.add_feast_object_diff(
-                diff_registry_objects(current_obj, e, object_type)
-            )
 
     return diff
 
 
+_APPLIED_FEAST_OBJECT_TYPES = {
+    FeastObjectType.DATA_SOURCE,
+    FeastObjectType.ENTITY,
+    FeastObjectType.FEATURE_SERVICE,
+    FeastObjectType.FEATURE_VIEW,
+    FeastObjectType.ON_DEMAND_FEATURE_VIEW,
+    FeastObjectType.REQUEST_FEATURE_VIEW,
+    FeastObjectType.STREAM_FEATURE_VIEW,
+}
+
+
 def apply_diff_to_registry(
     registry: BaseRegistry,
     registry_diff: RegistryDiff,
@@ -307,75 +373,22 @@ def apply_diff_to_registry(
         project: Feast project to be updated.
         commit: Whether the change should be persisted immediately
     """
+    objects_to_delete = []
+    objects_to_apply = []
     for feast_object_diff in registry_diff.feast_object_diffs:
+        if feast_object_diff.feast_object_type not in _APPLIED_FEAST_OBJECT_TYPES:
+            continue
         # There is no need to delete the object on an update, since applying the new object
         # will automatically delete the existing object.
         if feast_object_diff.transition_type == TransitionType.DELETE:
-            if feast_object_diff.feast_object_type == FeastObjectType.ENTITY:
-                entity_obj = cast(Entity, feast_object_diff.current_feast_object)
-                registry.delete_entity(entity_obj.name, project, commit=False)
-            elif feast_object_diff.feast_object_type == FeastObjectType.FEATURE_SERVICE:
-                feature_service_obj = cast(
-                    FeatureService, feast_object_diff.current_feast_object
-                )
-                registry.delete_feature_service(
-                    feature_service_obj.name, project, commit=False
-                )
-            elif feast_object_diff.feast_object_type in [
-                FeastObjectType.FEATURE_VIEW,
-                FeastObjectType.ON_DEMAND_FEATURE_VIEW,
-                FeastObjectType.REQUEST_FEATURE_VIEW,
-                FeastObjectType.STREAM_FEATURE_VIEW,
-            ]:
-                feature_view_obj = cast(
-                    BaseFeatureView, feast_object_diff.current_feast_object
-                )
-                registry.delete_feature_view(
-                    feature_view_obj.name,
-                    project,
-                    commit=False,
-                )
-            elif feast_object_diff.feast_object_type == FeastObjectType.DATA_SOURCE:
-                ds_obj = cast(DataSource, feast_object_diff.current_feast_object)
-                registry.delete_data_source(
-                    ds_obj.name,
-                    project,
-                    commit=False,
-                )
-
-        if feast_object_diff.transition_type in [
+            objects_to_delete.append(feast_object_diff.current_feast_object)
+        elif feast_object_diff.transition_type in [
             TransitionType.CREATE,
             TransitionType.UPDATE,
         ]:
-            if feast_object_diff.feast_object_type == FeastObjectType.DATA_SOURCE:
-                registry.apply_data_source(
-                    cast(DataSource, feast_object_diff.new_feast_object),
-                    project,
-                    commit=False,
-                )
-            if feast_object_diff.feast_object_type == FeastObjectType.ENTITY:
-                registry.apply_entity(
-                    cast(Entity, feast_object_diff.new_feast_object),
-                    project,
-                    commit=False,
-                )
-            elif feast_object_diff.feast_object_type == FeastObjectType.FEATURE_SERVICE:
-                registry.apply_feature_service(
-                    cast(FeatureService, feast_object_diff.new_feast_object),
-                    project,
-                    commit=False,
-                )
-            elif feast_object_diff.feast_object_type in [
-                FeastObjectType.FEATURE_VIEW,
-                FeastObjectType.ON_DEMAND_FEATURE_VIEW,
-                FeastObjectType.REQUEST_FEATURE_VIEW,
-                FeastObjectType.STREAM_FEATURE_VIEW,
-            ]:
-                registry.apply_feature_view(
-                    cast(BaseFeatureView, feast_object_diff.new_feast_object),
-                    project,
-                    commit=False,
-                )
+            objects_to_apply.append(feast_object_diff.new_feast_object)
+
+    registry.apply_objects(
+        project, objects_to_apply, objects_to_delete=objects_to_delete, commit=commit
+    )
 
-    if commit:
-        registry.commit()
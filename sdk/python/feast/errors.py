@@ -308,6 +308,13 @@ class RegistryNotBuiltException(Exception):
         super(RegistryNotBuiltException, self).__init__(f"Registry {registry_name} must be built before being queried.")
 
 
+class ReadOnlyRegistryException(Exception):
+    def __init__(self, registry_name: str, operation: str) -> None:
+        super(ReadOnlyRegistryException, self).__init__(
+            f"Registry {registry_name} is read-only, {operation} is not supported."
+        )
+
+
 class BigQueryJobStillRunning(Exception):
     def __init__(self, job_id):
         super().__init__(f"The BigQuery job with ID '{job_id}' is still running.")
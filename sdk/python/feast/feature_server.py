@@ -5,6 +5,7 @@ import warnings
 import pandas as pd
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.logger import logger
 from fastapi.params import Depends
 from google.protobuf.json_format import MessageToDict, Parse
@@ -40,7 +41,7 @@ def get_app(store: "feast.FeatureStore"):
         return await request.body()
 
     @app.post("/get-online-features")
-    def get_online_features(body=Depends(get_body)):
+    async def get_online_features(body=Depends(get_body)):
         try:
             # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
             request_proto = GetOnlineFeaturesRequest()
@@ -48,8 +49,10 @@ def get_app(store: "feast.FeatureStore"):
 
             # Initialize parameters for FeatureStore.get_online_features(...) call
             if request_proto.HasField("feature_service"):
-                features = store.get_feature_service(
-                    request_proto.feature_service, allow_cache=True
+                features = await run_in_threadpool(
+                    store.get_feature_service,
+                    request_proto.feature_service,
+                    allow_cache=True,
                 )
             else:
                 features = list(request_proto.features.val)
@@ -61,16 +64,20 @@ def get_app(store: "feast.FeatureStore"):
             if any(batch_size != num_entities for batch_size in batch_sizes):
                 raise HTTPException(status_code=500, detail="Uneven number of columns")
 
-            response_proto = store._get_online_features(
+            # Only the online store reads run on the event loop; the synchronous work around them, like
+            # registry refreshes and on demand transformations, runs in worker threads.
+            response = await store._get_online_features_async(
                 features=features,
                 entity_values=request_proto.entities,
                 full_feature_names=full_feature_names,
                 native_entity_values=False,
-            ).proto
+            )
 
             # Convert the Protobuf object to JSON and return it
-            return MessageToDict(  # type: ignore
-                response_proto, preserving_proto_field_name=True, float_precision=18
+            return await run_in_threadpool(
+                lambda: MessageToDict(  # type: ignore
+                    response.proto, preserving_proto_field_name=True, float_precision=18
+                )
             )
         except Exception as e:
             # Print the original exception on the server side
@@ -11,18 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import copy
 import itertools
 import os
+import threading
+import time
 import warnings
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -30,6 +36,7 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -82,12 +89,10 @@ from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry import Registry
 from feast.infra.registry.sql import SqlRegistry
 from feast.infra.registry.memory import InMemoryRegistry
+from feast.infra.registry.snapshot import SnapshotRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
-from feast.online_response import OnlineResponse
-from feast.protos.feast.serving.ServingService_pb2 import (
-    FieldStatus,
-    GetOnlineFeaturesResponse,
-)
+from feast.online_response import OnlineFeatureColumn, OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import FieldStatus
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import RepeatedValue, Value
 from feast.repo_config import RepoConfig, load_repo_config
@@ -102,6 +107,9 @@ from feast.version import get_version
 
 warnings.simplefilter("once", DeprecationWarning)
 
+# The number of compiled online request plans kept per FeatureStore.
+_ONLINE_REQUEST_PLAN_CACHE_SIZE = 128
+
 
 # decorator needed to use lru_cache with list arguments in `FeatureStore._get_feature_views_to_use()`
 def featuresListToTuple(function):
@@ -112,6 +120,46 @@ def featuresListToTuple(function):
     return wrapper
 
 
+@dataclass(frozen=True)
+class _OnlineRequestPlan:
+    """
+    The part of an online features request that only depends on the requested features and the registry.
+    Plans are shared between concurrent requests and must not be mutated.
+    """
+
+    feature_refs: List[str]
+    grouped_refs: List[Tuple[FeatureView, List[str]]]
+    grouped_odfv_refs: List[Tuple[OnDemandFeatureView, List[str]]]
+    has_request_feature_views: bool
+    requested_on_demand_feature_views: List[OnDemandFeatureView]
+    entity_name_to_join_key_map: Dict[str, str]
+    entity_type_map: Dict[str, ValueType]
+    join_keys_set: Set[str]
+    requested_result_row_names: FrozenSet[str]
+    needed_request_data: Set[str]
+    needed_request_fv_features: Set[str]
+    entityless_case: bool
+
+
+@dataclass
+class _OnlineFeaturesRequest:
+    """The registry-resolved state of a single online features request."""
+
+    feature_refs: List[str]
+    full_feature_names: bool
+    grouped_refs: List[Tuple[FeatureView, List[str]]]
+    grouped_odfv_refs: List[Tuple[OnDemandFeatureView, List[str]]]
+    requested_on_demand_feature_views: List[OnDemandFeatureView]
+    entity_name_to_join_key_map: Dict[str, str]
+    join_key_values: Dict[str, List[Value]]
+    requested_result_row_names: Set[str]
+    columns: List[Tuple[str, OnlineFeatureColumn]]
+    read_latencies: Dict[str, float] = field(default_factory=dict)
+    unique_entities: Dict[Any, Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]] = field(
+        default_factory=dict
+    )
+
+
 class FeatureStore:
     """
     A FeatureStore object is used to define, create, and retrieve features.
@@ -180,11 +228,20 @@ class FeatureStore:
             if not is_feast_apply:
                 from feast.repo_operations import apply_total
                 apply_total(repo_config=self.config, repo_path=self.repo_path, skip_source_validation=False, store=self)
+        elif registry_config.registry_type == "snapshot":
+            self._registry = SnapshotRegistry(registry_config, self.repo_path)
         else:
             r = Registry(registry_config, repo_path=self.repo_path)
             r._initialize_registry(self.config.project)
             self._registry = r
 
+        self._online_read_executor: Optional[ThreadPoolExecutor] = None
+        self._online_read_executor_lock = threading.Lock()
+
+        # Compiled online request plans, valid for the registry and cache version they were compiled against.
+        self._online_request_plans: "OrderedDict[Tuple[Any, ...], _OnlineRequestPlan]" = OrderedDict()
+        self._online_request_plans_version: Optional[Tuple[BaseRegistry, int]] = None
+        self._online_request_plans_lock = threading.Lock()
 
     @log_exceptions
     def version(self) -> str:
@@ -226,6 +283,9 @@ class FeatureStore:
         registry = Registry(registry_config, repo_path=self.repo_path)
         registry.refresh(self.config.project)
         self._registry = registry
+        with self._online_request_plans_lock:
+            self._online_request_plans.clear()
+            self._online_request_plans_version = None
 
     @log_exceptions_and_usage
     def list_entities(self, allow_cache: bool = False) -> List[Entity]:
@@ -301,9 +361,8 @@ class FeatureStore:
         for fv in self._registry.list_feature_views(
             self.project, allow_cache=allow_cache
         ):
-            if hide_dummy_entity and fv.entities[0] == DUMMY_ENTITY_NAME:
-                fv.entities = []
-                fv.entity_columns = []
+            if hide_dummy_entity:
+                fv = _hide_dummy_entity(fv, hide_entity_columns=True)
             feature_views.append(fv)
         return feature_views
 
@@ -316,9 +375,8 @@ class FeatureStore:
         for sfv in self._registry.list_stream_feature_views(
             self.project, allow_cache=allow_cache
         ):
-            if hide_dummy_entity and sfv.entities[0] == DUMMY_ENTITY_NAME:
-                sfv.entities = []
-                sfv.entity_columns = []
+            if hide_dummy_entity:
+                sfv = _hide_dummy_entity(sfv, hide_entity_columns=True)
             stream_feature_views.append(sfv)
         return stream_feature_views
 
@@ -427,8 +485,8 @@ class FeatureStore:
         feature_view = self._registry.get_feature_view(
             name, self.project, allow_cache=allow_registry_cache
         )
-        if hide_dummy_entity and feature_view.entities[0] == DUMMY_ENTITY_NAME:
-            feature_view.entities = []
+        if hide_dummy_entity:
+            feature_view = _hide_dummy_entity(feature_view)
         return feature_view
 
     @log_exceptions_and_usage
@@ -461,8 +519,8 @@ class FeatureStore:
         stream_feature_view = self._registry.get_stream_feature_view(
             name, self.project, allow_cache=allow_registry_cache
         )
-        if hide_dummy_entity and stream_feature_view.entities[0] == DUMMY_ENTITY_NAME:
-            stream_feature_view.entities = []
+        if hide_dummy_entity:
+            stream_feature_view = _hide_dummy_entity(stream_feature_view)
         return stream_feature_view
 
     @log_exceptions_and_usage
@@ -607,25 +665,22 @@ class FeatureStore:
         feature_services_to_update: List[FeatureService],
     ):
         """Makes inferences for entities, feature views, odfvs, and feature services."""
+        # Inferred in a single call each, so that all data sources and all feature views are inferred concurrently.
         update_data_sources_with_inferred_event_timestamp_col(
-            data_sources_to_update, self.config
-        )
-
-        update_data_sources_with_inferred_event_timestamp_col(
-            [view.batch_source for view in views_to_update], self.config
-        )
-
-        update_data_sources_with_inferred_event_timestamp_col(
-            [view.batch_source for view in sfvs_to_update], self.config
+            [
+                *data_sources_to_update,
+                *[view.batch_source for view in views_to_update],
+                *[view.batch_source for view in sfvs_to_update],
+            ],
+            self.config,
         )
 
         # New feature views may reference previously applied entities.
         entities = self._list_entities()
         update_feature_views_with_inferred_features_and_entities(
-            views_to_update, entities + entities_to_update, self.config
-        )
-        update_feature_views_with_inferred_features_and_entities(
-            sfvs_to_update, entities + entities_to_update, self.config
+            [*views_to_update, *sfvs_to_update],
+            entities + entities_to_update,
+            self.config,
         )
         # TODO(kevjumba): Update schema inferrence
         for sfv in sfvs_to_update:
@@ -923,27 +978,10 @@ x
             services_to_update,
         )
 
-        # Add all objects to the registry and update the provider's infrastructure.
-        for ds in data_sources_to_update:
-            self._registry.apply_data_source(ds, project=self.project, commit=False)
-        for view in itertools.chain(
-            views_to_update, odfvs_to_update, request_views_to_update, sfvs_to_update
-        ):
-            self._registry.apply_feature_view(view, project=self.project, commit=False)
-        for ent in entities_to_update:
-            self._registry.apply_entity(ent, project=self.project, commit=False)
-        for feature_service in services_to_update:
-            self._registry.apply_feature_service(
-                feature_service, project=self.project, commit=False
-            )
-        for validation_references in validation_references_to_update:
-            self._registry.apply_validation_reference(
-                validation_references, project=self.project, commit=False
-            )
-
         entities_to_delete = []
         views_to_delete = []
         sfvs_to_delete = []
+        registry_objects_to_delete: List[FeastObject] = []
         if not partial:
             # Delete all registry objects that should not exist.
             entities_to_delete = [
@@ -957,57 +995,40 @@ x
                     and not isinstance(ob, StreamFeatureView)
                 )
             ]
-            request_views_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, RequestFeatureView)
-            ]
-            odfvs_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, OnDemandFeatureView)
-            ]
             sfvs_to_delete = [
                 ob for ob in objects_to_delete if isinstance(ob, StreamFeatureView)
             ]
-            services_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, FeatureService)
-            ]
-            data_sources_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, DataSource)
-            ]
-            validation_references_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, ValidationReference)
+            registry_objects_to_delete = [
+                ob
+                for ob in objects_to_delete
+                if isinstance(
+                    ob,
+                    (
+                        DataSource,
+                        Entity,
+                        BaseFeatureView,
+                        FeatureService,
+                        ValidationReference,
+                    ),
+                )
             ]
 
-            for data_source in data_sources_to_delete:
-                self._registry.delete_data_source(
-                    data_source.name, project=self.project, commit=False
-                )
-            for entity in entities_to_delete:
-                self._registry.delete_entity(
-                    entity.name, project=self.project, commit=False
-                )
-            for view in views_to_delete:
-                self._registry.delete_feature_view(
-                    view.name, project=self.project, commit=False
-                )
-            for request_view in request_views_to_delete:
-                self._registry.delete_feature_view(
-                    request_view.name, project=self.project, commit=False
-                )
-            for odfv in odfvs_to_delete:
-                self._registry.delete_feature_view(
-                    odfv.name, project=self.project, commit=False
-                )
-            for sfv in sfvs_to_delete:
-                self._registry.delete_feature_view(
-                    sfv.name, project=self.project, commit=False
-                )
-            for service in services_to_delete:
-                self._registry.delete_feature_service(
-                    service.name, project=self.project, commit=False
-                )
-            for validation_references in validation_references_to_delete:
-                self._registry.delete_validation_reference(
-                    validation_references.name, project=self.project, commit=False
-                )
+        # Add all objects to the registry at once and update the provider's infrastructure.
+        self._registry.apply_objects(
+            self.project,
+            [
+                *data_sources_to_update,
+                *views_to_update,
+                *odfvs_to_update,
+                *request_views_to_update,
+                *sfvs_to_update,
+                *entities_to_update,
+                *services_to_update,
+                *validation_references_to_update,
+            ],
+            objects_to_delete=registry_objects_to_delete,
+            commit=False,
+        )
 
         tables_to_delete: List[FeatureView] = views_to_delete + sfvs_to_delete if not partial else []  # type: ignore
         tables_to_keep: List[FeatureView] = views_to_update + sfvs_to_update  # type: ignore
@@ -1037,6 +1058,17 @@ x
         if not self.config.ignore_infra_changes:
             self._get_provider().teardown_infra(self.project, tables, entities)
         self._registry.teardown()
+        self.close()
+
+    def close(self):
+        """
+        Stops the threads used to read feature views concurrently. The feature store stays usable, and the
+        threads are started again by the next online read that needs them.
+        """
+        with self._online_read_executor_lock:
+            executor, self._online_read_executor = self._online_read_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     @log_exceptions_and_usage
     def get_historical_features(
@@ -1618,6 +1650,50 @@ x
             allow_registry_cache=allow_registry_cache,
         )
 
+    async def get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: List[Dict[str, Any]],
+        full_feature_names: bool = False,
+        allow_registry_cache: bool = True,
+    ) -> OnlineResponse:
+        """
+        Asynchronously retrieves the latest online feature data.
+
+        This behaves like `get_online_features`, except that the feature views are read from the online
+        store concurrently through `OnlineStore.online_read_async`, without blocking the event loop.
+
+        Args:
+            features: The list of features that should be retrieved from the online store. These features can be
+                specified either as a list of string feature references or as a feature service. String feature
+                references must have format "feature_view:feature", e.g. "customer_fv:daily_transactions".
+            entity_rows: A list of dictionaries where each key-value is an entity-name, entity-value pair.
+            full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
+                changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
+                changes to "customer_fv__daily_transactions").
+
+        Returns:
+            OnlineResponse containing the feature data in records.
+
+        Raises:
+            Exception: No entity with the specified name exists.
+        """
+        columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
+        for entity_row in entity_rows:
+            for key, value in entity_row.items():
+                try:
+                    columnar[key].append(value)
+                except KeyError as e:
+                    raise ValueError("All entity_rows must have the same keys.") from e
+
+        return await self._get_online_features_async(
+            features=features,
+            entity_values=columnar,
+            full_feature_names=full_feature_names,
+            native_entity_values=True,
+            allow_registry_cache=allow_registry_cache,
+        )
+
     def _get_online_features(
         self,
         features: Union[List[str], FeatureService],
@@ -1628,12 +1704,256 @@ x
         native_entity_values: bool = True,
         allow_registry_cache: bool = True,
     ):
-        # Extract Sequence from RepeatedValue Protobuf.
-        entity_value_lists: Dict[str, Union[List[Any], List[Value]]] = {
-            k: list(v) if isinstance(v, Sequence) else list(v.val)
-            for k, v in entity_values.items()
-        }
+        request = self._prepare_online_features_request(
+            features=features,
+            entity_values=entity_values,
+            full_feature_names=full_feature_names,
+            native_entity_values=native_entity_values,
+            allow_registry_cache=allow_registry_cache,
+        )
+        grouped_refs = request.grouped_refs
+        join_key_values = request.join_key_values
+        entity_name_to_join_key_map = request.entity_name_to_join_key_map
+        online_features_columns = request.columns
+
+        def unzip(grouped):
+            return zip(*grouped)
+
+        provider = self._get_provider()
+        if not 'mysql' in str(provider.online_store):
+
+            def read_table(table: FeatureView, requested_features: List[str]):
+                start = time.perf_counter()
+                # Get the correct set of entity values with the correct join keys.
+                table_entity_values, idxs = self._get_unique_entities(
+                    table,
+                    join_key_values,
+                    entity_name_to_join_key_map,
+                    request.unique_entities,
+                )
+
+                # Fetch feature data for the minimum set of Entities.
+                feature_data = self._read_from_online_store(
+                    table_entity_values,
+                    provider,
+                    requested_features,
+                    table,
+                )
+                return feature_data, idxs, time.perf_counter() - start
+
+            # Results come back in the order of `grouped_refs` regardless of which read finishes first, so the
+            # response is populated deterministically.
+            results = self._map_online_reads(read_table, grouped_refs)
+            for (table, requested_features), (feature_data, idxs, latency) in zip(
+                grouped_refs, results
+            ):
+                request.read_latencies[table.projection.name_to_use()] = latency
+
+                # Populate the result_rows with the Features from the OnlineStore inplace.
+                self._populate_response_from_feature_data(
+                    feature_data,
+                    idxs,
+                    online_features_columns,
+                    full_feature_names,
+                    requested_features,
+                    table,
+                )
+        elif grouped_refs:
+            # same as above except read_from_online_store is combined into one query
+            table_list, requested_features_list = unzip(grouped_refs)
+            table_entity_values_list, idxs_list = unzip([self._get_unique_entities(
+                    table,
+                    join_key_values,
+                    entity_name_to_join_key_map,
+                    request.unique_entities,
+                ) for table in table_list])
+
+            start = time.perf_counter()
+            feature_data_list = self._read_from_online_store_many(
+                table_entity_values_list,
+                provider,
+                requested_features_list,
+                table_list,
+            )
+            # All feature views are read in a single round trip, so they share its latency.
+            latency = time.perf_counter() - start
+            for table in table_list:
+                request.read_latencies[table.projection.name_to_use()] = latency
+
+            for feature_data, idxs, requested_features, table in zip(feature_data_list, idxs_list, requested_features_list, table_list):
+                self._populate_response_from_feature_data(
+                    feature_data,
+                    idxs,
+                    online_features_columns,
+                    full_feature_names,
+                    requested_features,
+                    table,
+                )
+
+        return self._finalize_online_features_response(request)
+
+    async def _get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool = False,
+        native_entity_values: bool = True,
+        allow_registry_cache: bool = True,
+    ) -> OnlineResponse:
+        # Only the online store reads are awaited on the event loop. Preparing the request (which may refresh
+        # the registry) and finalizing the response (which runs on demand transformations) are synchronous, so
+        # they run in the default executor to avoid stalling every other coroutine on the loop.
+        loop = asyncio.get_running_loop()
+        request = await loop.run_in_executor(
+            None,
+            partial(
+                self._prepare_online_features_request,
+                features=features,
+                entity_values=entity_values,
+                full_feature_names=full_feature_names,
+                native_entity_values=native_entity_values,
+                allow_registry_cache=allow_registry_cache,
+            ),
+        )
+        provider = self._get_provider()
+
+        async def read_table(table: FeatureView, requested_features: List[str]):
+            start = time.perf_counter()
+            table_entity_values, idxs = self._get_unique_entities(
+                table,
+                request.join_key_values,
+                request.entity_name_to_join_key_map,
+                request.unique_entities,
+            )
+            feature_data = await self._read_from_online_store_async(
+                table_entity_values,
+                provider,
+                requested_features,
+                table,
+            )
+            return feature_data, idxs, time.perf_counter() - start
+
+        # Read all feature views concurrently, then populate the response in the order of
+        # `grouped_refs` so that the result does not depend on which read finishes first.
+        results = await asyncio.gather(
+            *[
+                read_table(table, requested_features)
+                for table, requested_features in request.grouped_refs
+            ]
+        )
+
+        def populate_and_finalize() -> OnlineResponse:
+            for (table, requested_features), (feature_data, idxs, latency) in zip(
+                request.grouped_refs, results
+            ):
+                request.read_latencies[table.projection.name_to_use()] = latency
+                self._populate_response_from_feature_data(
+                    feature_data,
+                    idxs,
+                    request.columns,
+                    request.full_feature_names,
+                    requested_features,
+                    table,
+                )
+            return self._finalize_online_features_response(request)
+
+        return await loop.run_in_executor(None, populate_and_finalize)
+
+    def _map_online_reads(
+        self,
+        read_table: Callable[[FeatureView, List[str]], Any],
+        grouped_refs: List[Tuple[FeatureView, List[str]]],
+    ) -> List[Any]:
+        """
+        Calls `read_table` for every feature view in `grouped_refs` and returns the results in the same order.
+
+        The reads are spread over a thread pool bounded by `online_read_max_workers`, which is shared by all
+        requests served by this feature store until `close` is called.
+        """
+        max_workers = self.config.online_read_max_workers
+        if max_workers <= 1 or len(grouped_refs) <= 1:
+            return [read_table(table, features) for table, features in grouped_refs]
+
+        with self._online_read_executor_lock:
+            if self._online_read_executor is None:
+                self._online_read_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="feast_online_read"
+                )
+        futures = [
+            self._online_read_executor.submit(read_table, table, features)
+            for table, features in grouped_refs
+        ]
+        return [future.result() for future in futures]
 
+    def _finalize_online_features_response(
+        self, request: "_OnlineFeaturesRequest"
+    ) -> OnlineResponse:
+        """Applies on demand transformations and drops the columns that were not requested."""
+        if request.grouped_odfv_refs:
+            self._augment_response_with_on_demand_transforms(
+                request.columns,
+                request.feature_refs,
+                request.requested_on_demand_feature_views,
+                request.full_feature_names,
+            )
+
+        self._drop_unneeded_columns(
+            request.columns, request.requested_result_row_names
+        )
+        return OnlineResponse(
+            columns=request.columns, read_latencies=request.read_latencies
+        )
+
+    def _get_online_request_plan(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+        allow_registry_cache: bool,
+    ) -> "_OnlineRequestPlan":
+        """
+        Returns the registry-derived part of an online request, reusing a previously compiled plan while the
+        registry cache has not changed. Plans are never reused when `allow_registry_cache` is False.
+        """
+        version = self._registry.cache_version(self.project) if allow_registry_cache else None
+        if version is None:
+            return self._compile_online_request_plan(
+                features, full_feature_names, allow_registry_cache
+            )
+
+        if isinstance(features, FeatureService):
+            # FeatureServices hash by name and compare by value, so edited services get their own plan.
+            key: Tuple[Any, ...] = ("service", features, full_feature_names)
+        else:
+            key = ("refs", tuple(features), full_feature_names)
+
+        with self._online_request_plans_lock:
+            if self._online_request_plans_version != (self._registry, version):
+                self._online_request_plans.clear()
+                self._online_request_plans_version = (self._registry, version)
+            plan = self._online_request_plans.get(key)
+            if plan is not None:
+                self._online_request_plans.move_to_end(key)
+                return plan
+
+        plan = self._compile_online_request_plan(
+            features, full_feature_names, allow_registry_cache
+        )
+        with self._online_request_plans_lock:
+            if self._online_request_plans_version == (self._registry, version):
+                self._online_request_plans[key] = plan
+                if len(self._online_request_plans) > _ONLINE_REQUEST_PLAN_CACHE_SIZE:
+                    self._online_request_plans.popitem(last=False)
+        return plan
+
+    def _compile_online_request_plan(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+        allow_registry_cache: bool,
+    ) -> "_OnlineRequestPlan":
+        """Resolves the requested features against the registry, independently of the entity values."""
         _feature_refs = self._get_features(features, allow_cache=allow_registry_cache)
         (
             requested_feature_views,
@@ -1656,19 +1976,6 @@ x
             join_keys_set,
         ) = self._get_entity_maps(requested_feature_views, allow_registry_cache)
 
-        entity_proto_values: Dict[str, List[Value]]
-        if native_entity_values:
-            # Convert values to Protobuf once.
-            entity_proto_values = {
-                k: python_values_to_proto_values(
-                    v, entity_type_map.get(k, ValueType.UNKNOWN)
-                )
-                for k, v in entity_value_lists.items()
-            }
-        else:
-            entity_proto_values = entity_value_lists
-
-        num_rows = _validate_entity_values(entity_proto_values)
         _validate_feature_refs(_feature_refs, full_feature_names)
         (
             grouped_refs,
@@ -1681,8 +1988,6 @@ x
             requested_request_feature_views,
             requested_on_demand_feature_views,
         )
-        set_usage_attribute("odfv", bool(grouped_odfv_refs))
-        set_usage_attribute("request_fv", bool(grouped_request_fv_refs))
 
         # All requested features should be present in the result.
         requested_result_row_names = {
@@ -1693,12 +1998,77 @@ x
                 name.partition("__")[-1] for name in requested_result_row_names
             }
 
-        feature_views = list(view for view, _ in grouped_refs)
-
         needed_request_data, needed_request_fv_features = self.get_needed_request_data(
             grouped_odfv_refs, grouped_request_fv_refs
         )
 
+        return _OnlineRequestPlan(
+            feature_refs=list(_feature_refs),
+            grouped_refs=grouped_refs,
+            grouped_odfv_refs=grouped_odfv_refs,
+            has_request_feature_views=bool(grouped_request_fv_refs),
+            requested_on_demand_feature_views=requested_on_demand_feature_views,
+            entity_name_to_join_key_map=entity_name_to_join_key_map,
+            entity_type_map=entity_type_map,
+            join_keys_set=join_keys_set,
+            requested_result_row_names=frozenset(requested_result_row_names),
+            needed_request_data=needed_request_data,
+            needed_request_fv_features=needed_request_fv_features,
+            entityless_case=DUMMY_ENTITY_NAME
+            in [
+                entity_name
+                for feature_view, _ in grouped_refs
+                for entity_name in feature_view.entities
+            ],
+        )
+
+    def _prepare_online_features_request(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool = False,
+        native_entity_values: bool = True,
+        allow_registry_cache: bool = True,
+    ) -> "_OnlineFeaturesRequest":
+        """
+        Resolves the requested features against the registry and validates the entity values. The returned
+        request holds a response already populated with the join keys and request data, ready for the
+        feature values read from the online store.
+        """
+        # Extract Sequence from RepeatedValue Protobuf.
+        entity_value_lists: Dict[str, Union[List[Any], List[Value]]] = {
+            k: list(v) if isinstance(v, Sequence) else list(v.val)
+            for k, v in entity_values.items()
+        }
+
+        plan = self._get_online_request_plan(
+            features, full_feature_names, allow_registry_cache
+        )
+        entity_name_to_join_key_map = plan.entity_name_to_join_key_map
+        needed_request_data = plan.needed_request_data
+        needed_request_fv_features = plan.needed_request_fv_features
+        set_usage_attribute("odfv", bool(plan.grouped_odfv_refs))
+        set_usage_attribute("request_fv", plan.has_request_feature_views)
+
+        entity_proto_values: Dict[str, List[Value]]
+        if native_entity_values:
+            # Convert values to Protobuf once.
+            entity_proto_values = {
+                k: python_values_to_proto_values(
+                    v, plan.entity_type_map.get(k, ValueType.UNKNOWN)
+                )
+                for k, v in entity_value_lists.items()
+            }
+        else:
+            entity_proto_values = entity_value_lists
+
+        num_rows = _validate_entity_values(entity_proto_values)
+
+        # The plan is shared between requests, so add this request's columns to a copy.
+        requested_result_row_names = set(plan.requested_result_row_names)
+
         join_key_values: Dict[str, List[Value]] = {}
         request_data_features: Dict[str, List[Value]] = {}
         # Entity rows may be either entities or request data.
@@ -1714,7 +2084,7 @@ x
                     requested_result_row_names.add(join_key_or_entity_name)
                 request_data_features[join_key_or_entity_name] = values
             else:
-                if join_key_or_entity_name in join_keys_set:
+                if join_key_or_entity_name in plan.join_keys_set:
                     join_key = join_key_or_entity_name
                 else:
                     try:
@@ -1736,93 +2106,31 @@ x
             needed_request_data, needed_request_fv_features, request_data_features
         )
 
-        # Populate online features response proto with join keys and request data features
-        online_features_response = GetOnlineFeaturesResponse(results=[])
+        # Populate online features response columns with join keys and request data features
+        online_features_columns: List[Tuple[str, OnlineFeatureColumn]] = []
         self._populate_result_rows_from_columnar(
-            online_features_response=online_features_response,
+            online_features_columns=online_features_columns,
             data=dict(**join_key_values, **request_data_features),
         )
 
         # Add the Entityless case after populating result rows to avoid having to remove
         # it later.
-        entityless_case = DUMMY_ENTITY_NAME in [
-            entity_name
-            for feature_view in feature_views
-            for entity_name in feature_view.entities
-        ]
-        if entityless_case:
+        if plan.entityless_case:
             join_key_values[DUMMY_ENTITY_ID] = python_values_to_proto_values(
                 [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
             )
 
-        def unzip(grouped):
-            return zip(*grouped)
-
-        provider = self._get_provider()
-        if not 'mysql' in str(provider.online_store):
-            for table, requested_features in grouped_refs:
-                # Get the correct set of entity values with the correct join keys.
-                table_entity_values, idxs = self._get_unique_entities(
-                    table,
-                    join_key_values,
-                    entity_name_to_join_key_map,
-                )
-
-                # Fetch feature data for the minimum set of Entities.
-                feature_data = self._read_from_online_store(
-                    table_entity_values,
-                    provider,
-                    requested_features,
-                    table,
-                )
-
-                # Populate the result_rows with the Features from the OnlineStore inplace.
-                self._populate_response_from_feature_data(
-                    feature_data,
-                    idxs,
-                    online_features_response,
-                    full_feature_names,
-                    requested_features,
-                    table,
-                )
-        elif grouped_refs:
-            # same as above except read_from_online_store is combined into one query
-            table_list, requested_features_list = unzip(grouped_refs)
-            table_entity_values_list, idxs_list = unzip([self._get_unique_entities(
-                    table,
-                    join_key_values,
-                    entity_name_to_join_key_map,
-                ) for table in table_list])
-
-            feature_data_list = self._read_from_online_store_many(
-                table_entity_values_list,
-                provider,
-                requested_features_list,
-                table_list,
-            )
-
-            for feature_data, idxs, requested_features, table in zip(feature_data_list, idxs_list, requested_features_list, table_list):
-                self._populate_response_from_feature_data(
-                    feature_data,
-                    idxs,
-                    online_features_response,
-                    full_feature_names,
-                    requested_features,
-                    table,
-                )
-
-        if grouped_odfv_refs:
-            self._augment_response_with_on_demand_transforms(
-                online_features_response,
-                _feature_refs,
-                requested_on_demand_feature_views,
-                full_feature_names,
-            )
-
-        self._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
+        return _OnlineFeaturesRequest(
+            feature_refs=plan.feature_refs,
+            full_feature_names=full_feature_names,
+            grouped_refs=plan.grouped_refs,
+            grouped_odfv_refs=plan.grouped_odfv_refs,
+            requested_on_demand_feature_views=plan.requested_on_demand_feature_views,
+            entity_name_to_join_key_map=entity_name_to_join_key_map,
+            join_key_values=join_key_values,
+            requested_result_row_names=requested_result_row_names,
+            columns=online_features_columns,
         )
-        return OnlineResponse(online_features_response)
 
     @staticmethod
     def _get_columnar_entity_values(
@@ -1908,18 +2216,20 @@ x
 
     @staticmethod
     def _populate_result_rows_from_columnar(
-        online_features_response: GetOnlineFeaturesResponse,
+        online_features_columns: List[Tuple[str, OnlineFeatureColumn]],
         data: Dict[str, List[Value]],
     ):
         timestamp = Timestamp()  # Only initialize this timestamp once.
         # Add more values to the existing result rows
         for feature_name, feature_values in data.items():
-            online_features_response.metadata.feature_names.val.append(feature_name)
-            online_features_response.results.append(
-                GetOnlineFeaturesResponse.FeatureVector(
-                    values=feature_values,
-                    statuses=[FieldStatus.PRESENT] * len(feature_values),
-                    event_timestamps=[timestamp] * len(feature_values),
+            online_features_columns.append(
+                (
+                    feature_name,
+                    OnlineFeatureColumn(
+                        values=feature_values,
+                        statuses=[FieldStatus.PRESENT] * len(feature_values),
+                        event_timestamps=[timestamp] * len(feature_values),
+                    ),
                 )
             )
 
@@ -1963,12 +2273,18 @@ x
         table: FeatureView,
         join_key_values: Dict[str, List[Value]],
         entity_name_to_join_key_map: Dict[str, str],
+        cache: Optional[
+            Dict[Any, Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]]
+        ] = None,
     ) -> Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]:
         """Return the set of unique composite Entities for a Feature View and the indexes at which they appear.
 
         This method allows us to query the OnlineStore for data we need only once
         rather than requesting and processing data for the same combination of
-        Entities multiple times.
+        Entities multiple times. Unique entities are returned in order of first appearance.
+
+        If `cache` is given, the result is shared with other Feature Views of the same request
+        that are keyed on the same entity columns.
         """
         # Get the correct set of entity values with the correct join keys.
         table_entity_values = self._get_table_entity_values(
@@ -1976,28 +2292,38 @@ x
             entity_name_to_join_key_map,
             join_key_values,
         )
+        keys = list(table_entity_values.keys())
+        columns = list(table_entity_values.values())
+
+        # The entity columns are the lists of `join_key_values` itself, so their identity tells us whether
+        # another Feature View of this request already de-duplicated the same entities.
+        cache_key = tuple((key, id(column)) for key, column in zip(keys, columns))
+        if cache is not None and cache_key in cache:
+            return cache[cache_key]
+
+        # Value protos are not hashable, but their serialized form is and, as Entity types cannot
+        # be complex (ie. lists), it is equal exactly when the values are.
+        serialized = [[value.SerializeToString() for value in column] for column in columns]
+        row_keys = serialized[0] if len(serialized) == 1 else list(zip(*serialized))
+
+        positions: Dict[Any, int] = {}
+        unique_entities: List[Dict[str, Value]] = []
+        indexes: List[List[int]] = []
+        for row_idx, row_key in enumerate(row_keys):
+            position = positions.get(row_key)
+            if position is None:
+                positions[row_key] = len(indexes)
+                unique_entities.append(
+                    {key: column[row_idx] for key, column in zip(keys, columns)}
+                )
+                indexes.append([row_idx])
+            else:
+                indexes[position].append(row_idx)
 
-        # Convert back to rowise.
-        keys = table_entity_values.keys()
-        # Sort the rowise data to allow for grouping but keep original index. This lambda is
-        # sufficient as Entity types cannot be complex (ie. lists).
-        rowise = list(enumerate(zip(*table_entity_values.values())))
-        rowise.sort(
-            key=lambda row: tuple(getattr(x, x.WhichOneof("val")) for x in row[1])
-        )
-
-        # Identify unique entities and the indexes at which they occur.
-        unique_entities: Tuple[Dict[str, Value], ...]
-        indexes: Tuple[List[int], ...]
-        unique_entities, indexes = tuple(
-            zip(
-                *[
-                    (dict(zip(keys, k)), [_[0] for _ in g])
-                    for k, g in itertools.groupby(rowise, key=lambda x: x[1])
-                ]
-            )
-        )
-        return unique_entities, indexes
+        result = tuple(unique_entities), tuple(indexes)
+        if cache is not None:
+            cache[cache_key] = result
+        return result
 
     @staticmethod
     def _process_read_rows(
@@ -2068,6 +2394,25 @@ x
 
         return self._process_read_rows(read_rows, requested_features)
 
+    async def _read_from_online_store_async(
+        self,
+        entity_rows: Iterable[Mapping[str, Value]],
+        provider: Provider,
+        requested_features: List[str],
+        table: FeatureView,
+    ) -> List[Tuple[List[Timestamp], List["FieldStatus.ValueType"], List[Value]]]:
+        """Asynchronous version of `_read_from_online_store`."""
+        entity_key_protos = self._instantiate_entity_key_protos(entity_rows)
+
+        read_rows = await provider.online_read_async(
+            config=self.config,
+            table=table,
+            entity_keys=entity_key_protos,
+            requested_features=requested_features,
+        )
+
+        return self._process_read_rows(read_rows, requested_features)
+
     def _read_from_online_store_many(
         self,
         entity_rows_list: List[Iterable[Mapping[str, Value]]],
@@ -2100,13 +2445,16 @@ x
                 Iterable[Timestamp], Iterable["FieldStatus.ValueType"], Iterable[Value]
             ]
         ],
-        indexes: Iterable[List[int]],
-        online_features_response: GetOnlineFeaturesResponse,
+        indexes: Sequence[List[int]],
+        online_features_columns: List[Tuple[str, OnlineFeatureColumn]],
         full_feature_names: bool,
         requested_features: Iterable[str],
         table: FeatureView,
     ):
-        """Populate the GetOnlineFeaturesResponse with feature data.
+        """Populate the online response columns with feature data.
+
+        The values of each unique entity are kept as returned by the OnlineStore, together with
+        `indexes`, so no per-row protos are built here.
 
         This method assumes that `_read_from_online_store` returns data for each
         combination of Entities in `entity_rows` in the same order as they
@@ -2115,8 +2463,8 @@ x
         Args:
             feature_data: A list of data in Protobuf form which was retrieved from the OnlineStore.
             indexes: A list of indexes which should be the same length as `feature_data`. Each list
-                of indexes corresponds to a set of result rows in `online_features_response`.
-            online_features_response: The object to populate.
+                of indexes corresponds to a set of result rows in `online_features_columns`.
+            online_features_columns: The columns to populate.
             full_feature_names: A boolean that provides the option to add the feature view prefixes to the feature names,
                 changing them from the format "feature" to "feature_view__feature" (e.g., "daily_transactions" changes to
                 "customer_fv__daily_transactions").
@@ -2131,41 +2479,41 @@ x
             else feature_name
             for feature_name in requested_features
         ]
-        online_features_response.metadata.feature_names.val.extend(
-            requested_feature_refs
-        )
 
         timestamps, statuses, values = zip(*feature_data)
 
         # Populate the result with data fetched from the OnlineStore
         # which is guaranteed to be aligned with `requested_features`.
-        for (
-            feature_idx,
-            (timestamp_vector, statuses_vector, values_vector),
-        ) in enumerate(zip(zip(*timestamps), zip(*statuses), zip(*values))):
-            online_features_response.results.append(
-                GetOnlineFeaturesResponse.FeatureVector(
-                    values=apply_list_mapping(values_vector, indexes),
-                    statuses=apply_list_mapping(statuses_vector, indexes),
-                    event_timestamps=apply_list_mapping(timestamp_vector, indexes),
+        for feature_ref, timestamp_vector, statuses_vector, values_vector in zip(
+            requested_feature_refs, zip(*timestamps), zip(*statuses), zip(*values)
+        ):
+            online_features_columns.append(
+                (
+                    feature_ref,
+                    OnlineFeatureColumn(
+                        values=values_vector,
+                        statuses=statuses_vector,
+                        event_timestamps=timestamp_vector,
+                        indexes=indexes,
+                    ),
                 )
             )
 
     @staticmethod
     def _augment_response_with_on_demand_transforms(
-        online_features_response: GetOnlineFeaturesResponse,
+        online_features_columns: List[Tuple[str, OnlineFeatureColumn]],
         feature_refs: List[str],
         requested_on_demand_feature_views: List[OnDemandFeatureView],
         full_feature_names: bool,
     ):
         """Computes on demand feature values and adds them to the result rows.
 
-        Assumes that 'online_features_response' already contains the necessary request data and input feature
+        Assumes that 'online_features_columns' already contains the necessary request data and input feature
         views for the on demand feature views. Unneeded feature values such as request data and
-        unrequested input feature views will be removed from 'online_features_response'.
+        unrequested input feature views will be removed from 'online_features_columns'.
 
         Args:
-            online_features_response: Protobuf object to populate
+            online_features_columns: Response columns to populate
             feature_refs: List of all feature references to be returned.
             requested_on_demand_feature_views: List of all odfvs that have been requested.
             full_feature_names: A boolean that provides the option to add the feature view prefixes to the feature names,
@@ -2187,7 +2535,7 @@ x
                     else feature_name
                 )
 
-        initial_response = OnlineResponse(online_features_response)
+        initial_response = OnlineResponse(columns=list(online_features_columns))
 
         # RB: lazy populate df and dict responses
         initial_response_df: Optional[pd.DataFrame] = None
@@ -2230,43 +2578,40 @@ x
 
             odfv_result_names |= set(selected_subset)
 
-            online_features_response.metadata.feature_names.val.extend(selected_subset)
-            for feature_idx in range(len(selected_subset)):
-                online_features_response.results.append(
-                    GetOnlineFeaturesResponse.FeatureVector(
-                        values=proto_values[feature_idx],
-                        statuses=[FieldStatus.PRESENT] * len(proto_values[feature_idx]),
-                        event_timestamps=[Timestamp()] * len(proto_values[feature_idx]),
+            timestamp = Timestamp()
+            for feature, feature_proto_values in zip(selected_subset, proto_values):
+                online_features_columns.append(
+                    (
+                        feature,
+                        OnlineFeatureColumn(
+                            values=feature_proto_values,
+                            statuses=[FieldStatus.PRESENT] * len(feature_proto_values),
+                            event_timestamps=[timestamp] * len(feature_proto_values),
+                        ),
                     )
                 )
 
     @staticmethod
     def _drop_unneeded_columns(
-        online_features_response: GetOnlineFeaturesResponse,
+        online_features_columns: List[Tuple[str, OnlineFeatureColumn]],
         requested_result_row_names: Set[str],
     ):
         """
         Unneeded feature values such as request data and unrequested input feature views will
-        be removed from 'online_features_response'.
+        be removed from 'online_features_columns'.
 
         Args:
-            online_features_response: Protobuf object to populate
+            online_features_columns: Response columns to populate
             requested_result_row_names: Fields from 'result_rows' that have been requested, and
                     therefore should not be dropped.
         """
         # Drop values that aren't needed
-        unneeded_feature_indices = [
-            idx
-            for idx, val in enumerate(
-                online_features_response.metadata.feature_names.val
-            )
-            if val not in requested_result_row_names
+        online_features_columns[:] = [
+            (name, column)
+            for name, column in online_features_columns
+            if name in requested_result_row_names
         ]
 
-        for idx in reversed(unneeded_feature_indices):
-            del online_features_response.metadata.feature_names.val[idx]
-            del online_features_response.results[idx]
-
     @featuresListToTuple
     @lru_cache(maxsize=128)
     def _get_feature_views_to_use(
@@ -2506,6 +2851,25 @@ x
         return ref
 
 
+FeatureViewType = TypeVar("FeatureViewType", bound=FeatureView)
+
+
+def _hide_dummy_entity(
+    feature_view: FeatureViewType, hide_entity_columns: bool = False
+) -> FeatureViewType:
+    """
+    Returns the feature view without its dummy entity, if it has one. Feature views served from the registry
+    cache are shared by all callers, so the dummy entity is removed from a copy rather than from the original.
+    """
+    if feature_view.entities[0] != DUMMY_ENTITY_NAME:
+        return feature_view
+    feature_view = copy.deepcopy(feature_view)
+    feature_view.entities = []
+    if hide_entity_columns:
+        feature_view.entity_columns = []
+    return feature_view
+
+
 def _validate_entity_values(join_key_values: Dict[str, List[Value]]):
     set_of_row_lengths = {len(v) for v in join_key_values.values()}
     if len(set_of_row_lengths) > 1:
@@ -2663,15 +3027,3 @@ def _validate_data_sources(data_sources: List[DataSource]):
             raise DataSourceRepeatNamesException(case_insensitive_ds_name)
         else:
             ds_names.add(case_insensitive_ds_name)
-
-
-def apply_list_mapping(
-    lst: Iterable[Any], mapping_indexes: Iterable[List[int]]
-) -> Iterable[Any]:
-    output_len = sum(len(item) for item in mapping_indexes)
-    output = [None] * output_len
-    for elem, destinations in zip(lst, mapping_indexes):
-        for idx in destinations:
-            output[idx] = elem
-
-    return output
@@ -1,5 +1,6 @@
 import re
-from typing import List, Set, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Set, TypeVar, Union
 
 from feast.data_source import DataSource, PushSource, RequestSource
 from feast.entity import Entity
@@ -18,79 +19,125 @@ from feast.stream_feature_view import StreamFeatureView
 from feast.types import String
 from feast.value_type import ValueType
 
+T = TypeVar("T")
+
+
+def _unique(objects: List[T]) -> List[T]:
+    # returns `objects` without repeated references to the same object, in order
+    unique, ids = [], set()
+    for obj in objects:
+        if id(obj) not in ids:
+            ids.add(id(obj))
+            unique.append(obj)
+    return unique
+
+
+def _run_concurrently(fn: Callable[[T], Any], objects: List[T], config: RepoConfig) -> None:
+    """
+    Calls `fn` on each object, with up to `config.inference_max_workers` calls running at once. If calls fail, the
+    error of the first failing object is raised once all calls are done.
+    """
+    max_workers = min(config.inference_max_workers, len(objects))
+    if max_workers <= 1:
+        for obj in objects:
+            fn(obj)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Results are consumed in order, so that errors are raised in order.
+        for _ in executor.map(fn, objects):
+            pass
+
 
 def update_data_sources_with_inferred_event_timestamp_col(
     data_sources: List[DataSource], config: RepoConfig
 ) -> None:
+    """
+    Infers the timestamp field of each data source that has none and updates it in place. Data sources are
+    inferred concurrently, see `RepoConfig.inference_max_workers`.
+
+    Args:
+        data_sources: The data sources to be updated.
+        config: The config for the current feature store.
+    """
+    data_sources = [
+        data_source.batch_source
+        if isinstance(data_source, PushSource)
+        else data_source
+        for data_source in data_sources
+        if not isinstance(data_source, RequestSource)
+    ]
+    _run_concurrently(
+        lambda data_source: _infer_event_timestamp_col(data_source, config),
+        _unique(data_sources),
+        config,
+    )
+
+
+def _infer_event_timestamp_col(data_source: DataSource, config: RepoConfig) -> None:
     ERROR_MSG_PREFIX = "Unable to infer DataSource timestamp_field"
-    for data_source in data_sources:
-        if isinstance(data_source, RequestSource):
-            continue
-        if isinstance(data_source, PushSource):
-            data_source = data_source.batch_source
-        if data_source.timestamp_field is None or data_source.timestamp_field == "":
-            # prepare right match pattern for data source
-            ts_column_type_regex_pattern: str
-            # TODO(adchia): Move Spark source inference out of this logic
-            if (
-                isinstance(data_source, FileSource)
-                or "SparkSource" == data_source.__class__.__name__
-            ):
-                ts_column_type_regex_pattern = r"^timestamp"
-            elif isinstance(data_source, BigQuerySource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
-            elif isinstance(data_source, RedshiftSource):
-                ts_column_type_regex_pattern = "TIMESTAMP[A-Z]*"
-            elif isinstance(data_source, SnowflakeSource):
-                ts_column_type_regex_pattern = "TIMESTAMP_[A-Z]*"
-            elif isinstance(data_source, MsSqlServerSource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
-            else:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""
-                    DataSource inferencing of timestamp_field is currently only supported
-                    for FileSource, SparkSource, BigQuerySource, RedshiftSource, SnowflakeSource, MsSqlSource.
-                    Attempting to infer from {data_source}.
-                    """,
-                )
-            #  for informing the type checker
-            assert (
-                isinstance(data_source, FileSource)
-                or isinstance(data_source, BigQuerySource)
-                or isinstance(data_source, RedshiftSource)
-                or isinstance(data_source, SnowflakeSource)
-                or isinstance(data_source, MsSqlServerSource)
-                or "SparkSource" == data_source.__class__.__name__
+    if data_source.timestamp_field is None or data_source.timestamp_field == "":
+        # prepare right match pattern for data source
+        ts_column_type_regex_pattern: str
+        # TODO(adchia): Move Spark source inference out of this logic
+        if (
+            isinstance(data_source, FileSource)
+            or "SparkSource" == data_source.__class__.__name__
+        ):
+            ts_column_type_regex_pattern = r"^timestamp"
+        elif isinstance(data_source, BigQuerySource):
+            ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
+        elif isinstance(data_source, RedshiftSource):
+            ts_column_type_regex_pattern = "TIMESTAMP[A-Z]*"
+        elif isinstance(data_source, SnowflakeSource):
+            ts_column_type_regex_pattern = "TIMESTAMP_[A-Z]*"
+        elif isinstance(data_source, MsSqlServerSource):
+            ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
+        else:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""
+                DataSource inferencing of timestamp_field is currently only supported
+                for FileSource, SparkSource, BigQuerySource, RedshiftSource, SnowflakeSource, MsSqlSource.
+                Attempting to infer from {data_source}.
+                """,
             )
+        #  for informing the type checker
+        assert (
+            isinstance(data_source, FileSource)
+            or isinstance(data_source, BigQuerySource)
+            or isinstance(data_source, RedshiftSource)
+            or isinstance(data_source, SnowflakeSource)
+            or isinstance(data_source, MsSqlServerSource)
+            or "SparkSource" == data_source.__class__.__name__
+        )
 
-            # loop through table columns to find singular match
-            timestamp_fields = []
-            for (
-                col_name,
-                col_datatype,
-            ) in data_source.get_table_column_names_and_types(config):
-                if re.match(ts_column_type_regex_pattern, col_datatype):
-                    timestamp_fields.append(col_name)
-
-            if len(timestamp_fields) > 1:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""{ERROR_MSG_PREFIX}; found multiple possible columns of timestamp type.
-                    Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`, columns: {timestamp_fields}""",
-                )
-            elif len(timestamp_fields) == 1:
-                data_source.timestamp_field = timestamp_fields[0]
-            else:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""
-                    {ERROR_MSG_PREFIX}; Found no columns of timestamp type.
-                    Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`.
-                    """,
-                )
+        # loop through table columns to find singular match
+        timestamp_fields = []
+        for (
+            col_name,
+            col_datatype,
+        ) in data_source.get_table_column_names_and_types(config):
+            if re.match(ts_column_type_regex_pattern, col_datatype):
+                timestamp_fields.append(col_name)
+
+        if len(timestamp_fields) > 1:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""{ERROR_MSG_PREFIX}; found multiple possible columns of timestamp type.
+                Data source type: {data_source.__class__.__name__},
+                Timestamp regex: `{ts_column_type_regex_pattern}`, columns: {timestamp_fields}""",
+            )
+        elif len(timestamp_fields) == 1:
+            data_source.timestamp_field = timestamp_fields[0]
+        else:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""
+                {ERROR_MSG_PREFIX}; Found no columns of timestamp type.
+                Data source type: {data_source.__class__.__name__},
+                Timestamp regex: `{ts_column_type_regex_pattern}`.
+                """,
+            )
 
 
 def update_feature_views_with_inferred_features_and_entities(
@@ -109,6 +156,8 @@ def update_feature_views_with_inferred_features_and_entities(
     aggregations) into account. For example, even if a stream feature view has a transformation,
     this method assumes that the batch source contains transformed data with the correct final schema.
 
+    Feature views are inferred concurrently, see `RepoConfig.inference_max_workers`.
+
     Args:
         fvs: The feature views to be updated.
         entities: A list containing entities associated with the feature views.
@@ -117,66 +166,80 @@ def update_feature_views_with_inferred_features_and_entities(
     entity_name_to_entity_map = {e.name: e for e in entities}
     entity_name_to_join_key_map = {e.name: e.join_key for e in entities}
 
-    for fv in fvs:
-        join_keys = set(
-            [entity_name_to_join_key_map[entity_name] for entity_name in fv.entities]
-        )
+    _run_concurrently(
+        lambda fv: _update_feature_view_with_inferred_features_and_entities(
+            fv, entity_name_to_entity_map, entity_name_to_join_key_map, config
+        ),
+        _unique(fvs),
+        config,
+    )
 
-        # Fields whose names match a join key are considered to be entity columns; all
-        # other fields are considered to be feature columns.
-        for field in fv.schema:
-            if field.name in join_keys:
-                # Do not override a preexisting field with the same name.
-                if field.name not in [
-                    entity_column.name for entity_column in fv.entity_columns
-                ]:
-                    fv.entity_columns.append(field)
-            else:
-                if field.name not in [feature.name for feature in fv.features]:
-                    fv.features.append(field)
 
-        # Respect the `value_type` attribute of the entity, if it is specified.
-        for entity_name in fv.entities:
-            entity = entity_name_to_entity_map[entity_name]
-            if (
-                entity.join_key
-                not in [entity_column.name for entity_column in fv.entity_columns]
-                and entity.value_type != ValueType.UNKNOWN
-            ):
-                fv.entity_columns.append(
-                    Field(
-                        name=entity.join_key,
-                        dtype=from_value_type(entity.value_type),
-                    )
-                )
+def _update_feature_view_with_inferred_features_and_entities(
+    fv: FeatureView,
+    entity_name_to_entity_map: Dict[str, Entity],
+    entity_name_to_join_key_map: Dict[str, str],
+    config: RepoConfig,
+) -> None:
+    join_keys = set(
+        [entity_name_to_join_key_map[entity_name] for entity_name in fv.entities]
+    )
 
-        # Infer a dummy entity column for entityless feature views.
+    # Fields whose names match a join key are considered to be entity columns; all
+    # other fields are considered to be feature columns.
+    for field in fv.schema:
+        if field.name in join_keys:
+            # Do not override a preexisting field with the same name.
+            if field.name not in [
+                entity_column.name for entity_column in fv.entity_columns
+            ]:
+                fv.entity_columns.append(field)
+        else:
+            if field.name not in [feature.name for feature in fv.features]:
+                fv.features.append(field)
+
+    # Respect the `value_type` attribute of the entity, if it is specified.
+    for entity_name in fv.entities:
+        entity = entity_name_to_entity_map[entity_name]
         if (
-            len(fv.entities) == 1
-            and fv.entities[0] == DUMMY_ENTITY_NAME
-            and not fv.entity_columns
+            entity.join_key
+            not in [entity_column.name for entity_column in fv.entity_columns]
+            and entity.value_type != ValueType.UNKNOWN
         ):
-            fv.entity_columns.append(Field(name=DUMMY_ENTITY_ID, dtype=String))
+            fv.entity_columns.append(
+                Field(
+                    name=entity.join_key,
+                    dtype=from_value_type(entity.value_type),
+                )
+            )
 
-        # Run inference for entity columns if there are fewer entity fields than expected.
-        run_inference_for_entities = len(fv.entity_columns) < len(join_keys)
+    # Infer a dummy entity column for entityless feature views.
+    if (
+        len(fv.entities) == 1
+        and fv.entities[0] == DUMMY_ENTITY_NAME
+        and not fv.entity_columns
+    ):
+        fv.entity_columns.append(Field(name=DUMMY_ENTITY_ID, dtype=String))
 
-        # Run inference for feature columns if there are no feature fields.
-        run_inference_for_features = len(fv.features) == 0
+    # Run inference for entity columns if there are fewer entity fields than expected.
+    run_inference_for_entities = len(fv.entity_columns) < len(join_keys)
 
-        if run_inference_for_entities or run_inference_for_features:
-            _infer_features_and_entities(
-                fv,
-                join_keys,
-                run_inference_for_features,
-                config,
-            )
+    # Run inference for feature columns if there are no feature fields.
+    run_inference_for_features = len(fv.features) == 0
 
-            if not fv.features:
-                raise RegistryInferenceFailure(
-                    "FeatureView",
-                    f"Could not infer Features for the FeatureView named {fv.name}.",
-                )
+    if run_inference_for_entities or run_inference_for_features:
+        _infer_features_and_entities(
+            fv,
+            join_keys,
+            run_inference_for_features,
+            config,
+        )
+
+        if not fv.features:
+            raise RegistryInferenceFailure(
+                "FeatureView",
+                f"Could not infer Features for the FeatureView named {fv.name}.",
+            )
 
 
 def _infer_features_and_entities(
@@ -408,6 +408,24 @@ class AthenaRetrievalJob(RetrievalJob):
                 temp_table_name,
             )
 
+    @log_exceptions_and_usage
+    def _to_arrow_batches_internal(self, batch_size: int) -> Iterator[pa.RecordBatch]:
+        with self._query_generator() as query:
+            temp_table_name = "_" + str(uuid.uuid4()).replace("-", "")
+            temp_external_location = self.get_temp_s3_path()
+            yield from aws_utils.unload_athena_query_to_arrow_batches(
+                self._athena_client,
+                self._config.offline_store.data_source,
+                self._config.offline_store.database,
+                self._config.offline_store.workgroup,
+                self._s3_resource,
+                temp_external_location,
+                self.get_temp_table_dml_header(temp_table_name, temp_external_location)
+                + query,
+                temp_table_name,
+                batch_size,
+            )
+
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
         return self._metadata
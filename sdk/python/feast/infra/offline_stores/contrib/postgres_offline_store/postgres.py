@@ -1,4 +1,5 @@
 import contextlib
+import uuid
 from dataclasses import asdict
 from datetime import datetime
 from typing import (
@@ -298,6 +299,36 @@ class PostgreSQLRetrievalJob(RetrievalJob):
                 )
                 return table
 
+    def _to_arrow_batches_internal(self, batch_size: int) -> Iterator[pa.RecordBatch]:
+        with self._query_generator() as query:
+            with _get_conn(self.config.offline_store) as conn:
+                conn.set_session(readonly=True)
+                # A named cursor is a server-side cursor: the result stays on the server
+                # and is only fetched batch_size rows at a time
+                with conn.cursor(name=f"feast_{uuid.uuid4().hex}") as cur:
+                    cur.itersize = batch_size
+                    cur.execute(query)
+                    schema = None
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        # The description of a named cursor is only known after the first fetch
+                        if schema is None:
+                            schema = pa.schema(
+                                [
+                                    (c.name, pg_type_code_to_arrow(c.type_code))
+                                    for c in cur.description
+                                ]
+                            )
+                        yield pa.RecordBatch.from_arrays(
+                            [
+                                pa.array(column, type=field.type)
+                                for column, field in zip(zip(*rows), schema)
+                            ],
+                            schema=schema,
+                        )
+
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
         return self._metadata
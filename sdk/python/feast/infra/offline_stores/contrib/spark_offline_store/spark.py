@@ -1,9 +1,10 @@
+import itertools
 import os
 import tempfile
 import uuid
 import warnings
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas
@@ -345,6 +346,22 @@ class SparkRetrievalJob(RetrievalJob):
         """Return dataset as pyarrow Table synchronously"""
         return pyarrow.Table.from_pandas(self._to_df_internal())
 
+    def _to_arrow_batches_internal(
+        self, batch_size: int
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """Stream dataset as pyarrow record batches, pulling one partition at a time to the driver"""
+        spark_df = self.to_spark_df()
+        rows = spark_df.toLocalIterator(prefetchPartitions=True)
+        while True:
+            batch_rows = list(itertools.islice(rows, batch_size))
+            if not batch_rows:
+                break
+            # `to_arrow_batches` converts the batches to a common schema.
+            yield pyarrow.RecordBatch.from_pandas(
+                pd.DataFrame.from_records(batch_rows, columns=spark_df.columns),
+                preserve_index=False,
+            )
+
     def persist(self, storage: SavedDatasetStorage, allow_overwrite: bool = False):
         """
         Run the retrieval and persist the results in the same offline store used for read.
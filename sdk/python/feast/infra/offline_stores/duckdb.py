@@ -0,0 +1,659 @@
+import contextlib
+import dataclasses
+import os
+from datetime import datetime
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+from pydantic import StrictInt, StrictStr
+from pydantic.typing import Literal
+
+from feast.data_source import DataSource
+from feast.errors import InvalidEntityType, SavedDatasetLocationAlreadyExists
+from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL, FeatureView
+from feast.infra.offline_stores import offline_utils
+from feast.infra.offline_stores.file import FileOfflineStore, FileOfflineStoreConfig
+from feast.infra.offline_stores.file_source import (
+    FileSource,
+    SavedDatasetFileStorage,
+)
+from feast.infra.offline_stores.offline_store import RetrievalJob, RetrievalMetadata
+from feast.infra.registry.base_registry import BaseRegistry
+from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.repo_config import RepoConfig
+from feast.saved_dataset import SavedDatasetStorage
+from feast.usage import log_exceptions_and_usage
+from feast.utils import to_naive_utc
+
+try:
+    import duckdb
+except ImportError as e:
+    from feast.errors import FeastExtrasDependencyImportError
+
+    raise FeastExtrasDependencyImportError("duckdb", str(e))
+
+
+class DuckDBOfflineStoreConfig(FileOfflineStoreConfig):
+    """Offline store config for file sources queried with an embedded DuckDB engine"""
+
+    type: Literal["duckdb"] = "duckdb"
+    """ Offline store type selector"""
+
+    threads: Optional[StrictInt] = None
+    """ Number of threads DuckDB may use, defaults to the number of cores """
+
+    memory_limit: Optional[StrictStr] = None
+    """ Memory limit of DuckDB (e.g. "8GB"), beyond which it spills to disk """
+
+
+class DuckDBOfflineStore(FileOfflineStore):
+    """
+    An offline store over file sources, like the FileOfflineStore, which runs the
+    point-in-time join of the warehouse stores on an in-process DuckDB database.
+
+    Writing logged features and batches is inherited from the FileOfflineStore.
+    """
+
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def pull_latest_from_table_or_query(
+        config: RepoConfig,
+        data_source: DataSource,
+        join_key_columns: List[str],
+        feature_name_columns: List[str],
+        timestamp_field: str,
+        created_timestamp_column: Optional[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RetrievalJob:
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+        assert isinstance(data_source, FileSource)
+        from_expression = _get_table_query_string(data_source)
+
+        partition_by_join_key_string = ", ".join(_quote(join_key_columns))
+        if partition_by_join_key_string != "":
+            partition_by_join_key_string = (
+                "PARTITION BY " + partition_by_join_key_string
+            )
+        timestamps = [timestamp_field]
+        if created_timestamp_column:
+            timestamps.append(created_timestamp_column)
+        timestamp_desc_string = " DESC, ".join(_quote(timestamps)) + " DESC"
+        field_string = ", ".join(
+            _quote(join_key_columns + feature_name_columns + timestamps)
+        )
+
+        query = f"""
+            SELECT
+                {field_string}
+                {f", {repr(DUMMY_ENTITY_VAL)} AS {DUMMY_ENTITY_ID}" if not join_key_columns else ""}
+            FROM (
+                SELECT {field_string},
+                ROW_NUMBER() OVER({partition_by_join_key_string} ORDER BY {timestamp_desc_string}) AS _feast_row
+                FROM {from_expression}
+                WHERE {_timestamp_range_condition(timestamp_field, start_date, end_date)}
+            )
+            WHERE _feast_row = 1
+            """
+
+        # When materializing a single feature view, we don't need full feature names. On demand transforms aren't materialized
+        return DuckDBRetrievalJob(
+            query=query,
+            config=config,
+            data_sources=[data_source],
+            full_feature_names=False,
+        )
+
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def get_historical_features(
+        config: RepoConfig,
+        feature_views: List[FeatureView],
+        feature_refs: List[str],
+        entity_df: Union[pd.DataFrame, str],
+        registry: BaseRegistry,
+        project: str,
+        full_feature_names: bool = False,
+    ) -> RetrievalJob:
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+        for fv in feature_views:
+            assert isinstance(fv.batch_source, FileSource)
+        data_sources = [fv.batch_source for fv in feature_views]
+
+        with contextlib.closing(
+            _get_connection(config.offline_store, data_sources)
+        ) as connection:
+            entity_schema = _get_entity_schema(connection, entity_df)
+
+            entity_df_event_timestamp_col = (
+                offline_utils.infer_event_timestamp_from_entity_df(entity_schema)
+            )
+
+            entity_df_event_timestamp_range = _get_entity_df_event_timestamp_range(
+                connection, entity_df, entity_df_event_timestamp_col
+            )
+
+        @contextlib.contextmanager
+        def query_generator(connection: duckdb.DuckDBPyConnection) -> Iterator[str]:
+            table_name = offline_utils.get_temp_entity_table_name()
+
+            # The connection, and with it the entity table, only lives as long as the job execution
+            _upload_entity_df(connection, entity_df, table_name)
+
+            expected_join_keys = offline_utils.get_expected_join_keys(
+                project, feature_views, registry
+            )
+
+            offline_utils.assert_expected_columns_in_entity_df(
+                entity_schema, expected_join_keys, entity_df_event_timestamp_col
+            )
+
+            query_context = offline_utils.get_feature_view_query_context(
+                feature_refs,
+                feature_views,
+                registry,
+                project,
+                entity_df_event_timestamp_range,
+                # File sources have no table to query, so read their files instead
+                get_table_query_string=_get_table_query_string,
+            )
+
+            query_context = [
+                dataclasses.replace(
+                    context,
+                    entity_selections=[
+                        '"' + entity_selection.replace(" AS ", '" AS "') + '"'
+                        for entity_selection in context.entity_selections
+                    ],
+                )
+                for context in query_context
+            ]
+
+            yield offline_utils.build_point_in_time_query(
+                query_context,
+                left_table_query_string=table_name,
+                entity_df_event_timestamp_col=entity_df_event_timestamp_col,
+                entity_df_columns=entity_schema.keys(),
+                query_template=MULTIPLE_FEATURE_VIEW_POINT_IN_TIME_JOIN,
+                full_feature_names=full_feature_names,
+            )
+
+        return DuckDBRetrievalJob(
+            query=query_generator,
+            config=config,
+            data_sources=data_sources,
+            full_feature_names=full_feature_names,
+            on_demand_feature_views=OnDemandFeatureView.get_requested_odfvs(
+                feature_refs, project, registry
+            ),
+            metadata=RetrievalMetadata(
+                features=feature_refs,
+                keys=list(entity_schema.keys() - {entity_df_event_timestamp_col}),
+                min_event_timestamp=entity_df_event_timestamp_range[0],
+                max_event_timestamp=entity_df_event_timestamp_range[1],
+            ),
+        )
+
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def pull_all_from_table_or_query(
+        config: RepoConfig,
+        data_source: DataSource,
+        join_key_columns: List[str],
+        feature_name_columns: List[str],
+        timestamp_field: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RetrievalJob:
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+        assert isinstance(data_source, FileSource)
+        from_expression = _get_table_query_string(data_source)
+
+        field_string = ", ".join(
+            _quote(join_key_columns + feature_name_columns + [timestamp_field])
+        )
+
+        query = f"""
+            SELECT {field_string}
+            FROM {from_expression}
+            WHERE {_timestamp_range_condition(timestamp_field, start_date, end_date)}
+        """
+
+        return DuckDBRetrievalJob(
+            query=query,
+            config=config,
+            data_sources=[data_source],
+            full_feature_names=False,
+        )
+
+
+class DuckDBRetrievalJob(RetrievalJob):
+    def __init__(
+        self,
+        query: Union[str, Callable[[duckdb.DuckDBPyConnection], ContextManager[str]]],
+        config: RepoConfig,
+        data_sources: List[FileSource],
+        full_feature_names: bool,
+        on_demand_feature_views: Optional[List[OnDemandFeatureView]] = None,
+        metadata: Optional[RetrievalMetadata] = None,
+    ):
+        """Initialize a lazy DuckDB retrieval job.
+
+        Args:
+            query: DuckDB SQL query to execute. Either a string, or a generator function that
+                prepares the given connection (e.g. registers the entity dataframe) for the query.
+            config: Feast repo config
+            data_sources: The file sources read by the query
+            full_feature_names: Whether to add the feature view prefixes to the feature names
+            on_demand_feature_views (optional): A list of on demand transforms to apply at retrieval time
+            metadata (optional): Metadata about the retrieval job
+        """
+        if not isinstance(query, str):
+            self._query_generator = query
+        else:
+
+            @contextlib.contextmanager
+            def query_generator(
+                connection: duckdb.DuckDBPyConnection,
+            ) -> Iterator[str]:
+                assert isinstance(query, str)
+                yield query
+
+            self._query_generator = query_generator
+        self._config = config
+        self._data_sources = data_sources
+        self._full_feature_names = full_feature_names
+        self._on_demand_feature_views = on_demand_feature_views or []
+        self._metadata = metadata
+
+    @property
+    def full_feature_names(self) -> bool:
+        return self._full_feature_names
+
+    @property
+    def on_demand_feature_views(self) -> List[OnDemandFeatureView]:
+        return self._on_demand_feature_views
+
+    @contextlib.contextmanager
+    def _connection_and_query(
+        self,
+    ) -> Iterator[Tuple[duckdb.DuckDBPyConnection, str]]:
+        with contextlib.closing(
+            _get_connection(self._config.offline_store, self._data_sources)
+        ) as connection, self._query_generator(connection) as query:
+            yield connection, query
+
+    @log_exceptions_and_usage
+    def _to_df_internal(self) -> pd.DataFrame:
+        with self._connection_and_query() as (connection, query):
+            return connection.execute(query).df()
+
+    @log_exceptions_and_usage
+    def _to_arrow_internal(self) -> pyarrow.Table:
+        # DuckDB hands over its result as arrow without converting it
+        with self._connection_and_query() as (connection, query):
+            return connection.execute(query).fetch_arrow_table()
+
+    def _to_arrow_batches_internal(
+        self, batch_size: int
+    ) -> Iterator[pyarrow.RecordBatch]:
+        with self._connection_and_query() as (connection, query):
+            yield from connection.execute(query).fetch_record_batch(batch_size)
+
+    def to_sql(self) -> str:
+        with self._connection_and_query() as (_, query):
+            return query
+
+    def persist(self, storage: SavedDatasetStorage, allow_overwrite: bool = False):
+        assert isinstance(storage, SavedDatasetFileStorage)
+
+        # Check if the specified location already exists.
+        if not allow_overwrite and os.path.exists(storage.file_options.uri):
+            raise SavedDatasetLocationAlreadyExists(location=storage.file_options.uri)
+
+        if storage.file_options.uri.endswith(".parquet"):
+            # Let DuckDB write the file, without pulling the result into python
+            with self._connection_and_query() as (connection, query):
+                connection.execute(
+                    f"COPY ({query}) TO {_quote_literal(storage.file_options.uri)} (FORMAT PARQUET)"
+                )
+        else:
+            # otherwise assume destination is directory
+            filesystem, path = FileSource.create_filesystem_and_path(
+                storage.file_options.uri,
+                storage.file_options.s3_endpoint_override,
+            )
+            pyarrow.parquet.write_to_dataset(
+                self.to_arrow(), root_path=path, filesystem=filesystem
+            )
+
+    @property
+    def metadata(self) -> Optional[RetrievalMetadata]:
+        return self._metadata
+
+    def supports_remote_storage_export(self) -> bool:
+        return False
+
+
+def _get_connection(
+    offline_store_config: DuckDBOfflineStoreConfig, data_sources: List[FileSource]
+) -> duckdb.DuckDBPyConnection:
+    connection = duckdb.connect(database=":memory:")
+    # Compare tz-naive and tz-aware timestamps as UTC, like the rest of Feast does
+    connection.execute("SET TimeZone = 'UTC'")
+    if offline_store_config.threads:
+        connection.execute(f"SET threads = {offline_store_config.threads}")
+    if offline_store_config.memory_limit:
+        connection.execute(
+            f"SET memory_limit = {_quote_literal(offline_store_config.memory_limit)}"
+        )
+
+    s3_sources = [
+        data_source
+        for data_source in data_sources
+        if data_source.path.startswith("s3://")
+    ]
+    if s3_sources:
+        connection.execute("INSTALL httpfs")
+        connection.execute("LOAD httpfs")
+        for setting, variable in _S3_SETTINGS_FROM_ENV.items():
+            if os.environ.get(variable):
+                connection.execute(
+                    f"SET {setting} = {_quote_literal(os.environ[variable])}"
+                )
+        # DuckDB has a single s3 endpoint per connection
+        endpoint_overrides = [
+            data_source.file_options.s3_endpoint_override
+            for data_source in s3_sources
+            if data_source.file_options.s3_endpoint_override
+        ]
+        if endpoint_overrides:
+            endpoint = urlparse(endpoint_overrides[0])
+            connection.execute(f"SET s3_endpoint = {_quote_literal(endpoint.netloc)}")
+            connection.execute(f"SET s3_use_ssl = {endpoint.scheme == 'https'}")
+            connection.execute("SET s3_url_style = 'path'")
+
+    return connection
+
+
+_S3_SETTINGS_FROM_ENV = {
+    "s3_region": "AWS_DEFAULT_REGION",
+    "s3_access_key_id": "AWS_ACCESS_KEY_ID",
+    "s3_secret_access_key": "AWS_SECRET_ACCESS_KEY",
+    "s3_session_token": "AWS_SESSION_TOKEN",
+}
+
+
+def _get_table_query_string(data_source: FileSource) -> str:
+    path = data_source.path
+    if path.endswith(".parquet") or (
+        not path.startswith("s3://") and os.path.isfile(path)
+    ):
+        return f"read_parquet({_quote_literal(path)})"
+
+    # Otherwise the source is a directory of parquet files, possibly hive partitioned
+    return f"read_parquet({_quote_literal(path.rstrip('/') + '/**/*.parquet')}, hive_partitioning=true)"
+
+
+def _timestamp_range_condition(
+    timestamp_field: str, start_date: datetime, end_date: datetime
+) -> str:
+    start_date = to_naive_utc(start_date)
+    end_date = to_naive_utc(end_date)
+    return (
+        f"\"{timestamp_field}\" >= TIMESTAMP '{start_date}' "
+        f"AND \"{timestamp_field}\" < TIMESTAMP '{end_date}'"
+    )
+
+
+def _quote(field_names: List[str]) -> List[str]:
+    return [f'"{field_name}"' for field_name in field_names]
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _upload_entity_df(
+    connection: duckdb.DuckDBPyConnection,
+    entity_df: Union[pd.DataFrame, str],
+    table_name: str,
+):
+    if isinstance(entity_df, pd.DataFrame):
+        # If the entity_df is a pandas dataframe, let DuckDB scan it in place
+        connection.register(table_name, entity_df)
+    elif isinstance(entity_df, str):
+        # If the entity_df is a string (SQL query), create a view out of it
+        connection.execute(f"CREATE TEMP VIEW {table_name} AS ({entity_df})")
+    else:
+        raise InvalidEntityType(type(entity_df))
+
+
+def _get_entity_schema(
+    connection: duckdb.DuckDBPyConnection,
+    entity_df: Union[pd.DataFrame, str],
+) -> Dict[str, np.dtype]:
+    if isinstance(entity_df, pd.DataFrame):
+        return dict(zip(entity_df.columns, entity_df.dtypes))
+    elif isinstance(entity_df, str):
+        entity_df_sample = connection.execute(
+            f"SELECT * FROM ({entity_df}) LIMIT 0"
+        ).df()
+        return dict(zip(entity_df_sample.columns, entity_df_sample.dtypes))
+    else:
+        raise InvalidEntityType(type(entity_df))
+
+
+def _get_entity_df_event_timestamp_range(
+    connection: duckdb.DuckDBPyConnection,
+    entity_df: Union[pd.DataFrame, str],
+    entity_df_event_timestamp_col: str,
+) -> Tuple[datetime, datetime]:
+    if isinstance(entity_df, pd.DataFrame):
+        entity_df_event_timestamp = entity_df.loc[
+            :, entity_df_event_timestamp_col
+        ].infer_objects()
+        if pd.api.types.is_string_dtype(entity_df_event_timestamp):
+            entity_df_event_timestamp = pd.to_datetime(
+                entity_df_event_timestamp, utc=True
+            )
+        return (
+            entity_df_event_timestamp.min().to_pydatetime(),
+            entity_df_event_timestamp.max().to_pydatetime(),
+        )
+    elif isinstance(entity_df, str):
+        # If the entity_df is a string (SQL query), determine range from the query
+        min_event_timestamp, max_event_timestamp = connection.execute(
+            f'SELECT MIN("{entity_df_event_timestamp_col}"), MAX("{entity_df_event_timestamp_col}") FROM ({entity_df})'
+        ).fetchone()
+        return min_event_timestamp, max_event_timestamp
+    else:
+        raise InvalidEntityType(type(entity_df))
+
+
+# Copied from the Feast Redshift offline store implementation, with TTL intervals
+# written as DuckDB interval literals, and entity values separated in the entity row
+# ids so that different combinations of values can't produce the same id.
+# Note: Keep this in sync with sdk/python/feast/infra/offline_stores/redshift.py:
+# MULTIPLE_FEATURE_VIEW_POINT_IN_TIME_JOIN
+
+MULTIPLE_FEATURE_VIEW_POINT_IN_TIME_JOIN = """
+/*
+ Compute a deterministic hash for the `left_table_query_string` that will be used throughout
+ all the logic as the field to GROUP BY the data
+*/
+WITH entity_dataframe AS (
+    SELECT *,
+        {{entity_df_event_timestamp_col}} AS entity_timestamp
+        {% for featureview in featureviews %}
+            {% if featureview.entities %}
+            ,(
+                {% for entity in featureview.entities %}
+                    CAST("{{entity}}" as VARCHAR) || chr(31) ||
+                {% endfor %}
+                CAST("{{entity_df_event_timestamp_col}}" AS VARCHAR)
+            ) AS "{{featureview.name}}__entity_row_unique_id"
+            {% else %}
+            ,CAST("{{entity_df_event_timestamp_col}}" AS VARCHAR) AS "{{featureview.name}}__entity_row_unique_id"
+            {% endif %}
+        {% endfor %}
+    FROM {{ left_table_query_string }}
+),
+
+{% for featureview in featureviews %}
+
+"{{ featureview.name }}__entity_dataframe" AS (
+    SELECT
+        {% if featureview.entities %}"{{ featureview.entities | join('", "') }}",{% endif %}
+        entity_timestamp,
+        "{{featureview.name}}__entity_row_unique_id"
+    FROM entity_dataframe
+    GROUP BY
+        {% if featureview.entities %}"{{ featureview.entities | join('", "')}}",{% endif %}
+        entity_timestamp,
+        "{{featureview.name}}__entity_row_unique_id"
+),
+
+/*
+ This query template performs the point-in-time correctness join for a single feature set table
+ to the provided entity table.
+
+ 1. We first join the current feature_view to the entity dataframe that has been passed.
+ This JOIN has the following logic:
+    - For each row of the entity dataframe, only keep the rows where the `timestamp_field`
+    is less than the one provided in the entity dataframe
+    - If there a TTL for the current feature_view, also keep the rows where the `timestamp_field`
+    is higher the the one provided minus the TTL
+    - For each row, Join on the entity key and retrieve the `entity_row_unique_id` that has been
+    computed previously
+
+ The output of this CTE will contain all the necessary information and already filtered out most
+ of the data that is not relevant.
+*/
+
+"{{ featureview.name }}__subquery" AS (
+    SELECT
+        "{{ featureview.timestamp_field }}" as event_timestamp,
+        {{ '"' ~ featureview.created_timestamp_column ~ '" as created_timestamp,' if featureview.created_timestamp_column else '' }}
+        {{ featureview.entity_selections | join(', ')}}{% if featureview.entity_selections %},{% else %}{% endif %}
+        {% for feature in featureview.features %}
+            "{{ feature }}" as {% if full_feature_names %}"{{ featureview.name }}__{{featureview.field_mapping.get(feature, feature)}}"{% else %}"{{ featureview.field_mapping.get(feature, feature) }}"{% endif %}{% if loop.last %}{% else %}, {% endif %}
+        {% endfor %}
+    FROM {{ featureview.table_subquery }} AS sub
+    WHERE "{{ featureview.timestamp_field }}" <= (SELECT MAX(entity_timestamp) FROM entity_dataframe)
+    {% if featureview.ttl == 0 %}{% else %}
+    AND "{{ featureview.timestamp_field }}" >= (SELECT MIN(entity_timestamp) FROM entity_dataframe) - INTERVAL '{{ featureview.ttl }} seconds'
+    {% endif %}
+),
+
+"{{ featureview.name }}__base" AS (
+    SELECT
+        subquery.*,
+        entity_dataframe.entity_timestamp,
+        entity_dataframe."{{featureview.name}}__entity_row_unique_id"
+    FROM "{{ featureview.name }}__subquery" AS subquery
+    INNER JOIN "{{ featureview.name }}__entity_dataframe" AS entity_dataframe
+    ON TRUE
+        AND subquery.event_timestamp <= entity_dataframe.entity_timestamp
+
+        {% if featureview.ttl == 0 %}{% else %}
+        AND subquery.event_timestamp >= entity_dataframe.entity_timestamp - INTERVAL '{{ featureview.ttl }} seconds'
+        {% endif %}
+
+        {% for entity in featureview.entities %}
+        AND subquery."{{ entity }}" = entity_dataframe."{{ entity }}"
+        {% endfor %}
+),
+
+/*
+ 2. If the `created_timestamp_column` has been set, we need to
+ deduplicate the data first. This is done by calculating the
+ `MAX(created_at_timestamp)` for each event_timestamp.
+ We then join the data on the next CTE
+*/
+{% if featureview.created_timestamp_column %}
+"{{ featureview.name }}__dedup" AS (
+    SELECT
+        "{{featureview.name}}__entity_row_unique_id",
+        event_timestamp,
+        MAX(created_timestamp) as created_timestamp
+    FROM "{{ featureview.name }}__base"
+    GROUP BY "{{featureview.name}}__entity_row_unique_id", event_timestamp
+),
+{% endif %}
+
+/*
+ 3. The data has been filtered during the first CTE "*__base"
+ Thus we only need to compute the latest timestamp of each feature.
+*/
+"{{ featureview.name }}__latest" AS (
+    SELECT
+        event_timestamp,
+        {% if featureview.created_timestamp_column %}created_timestamp,{% endif %}
+        "{{featureview.name}}__entity_row_unique_id"
+    FROM
+    (
+        SELECT *,
+            ROW_NUMBER() OVER(
+                PARTITION BY "{{featureview.name}}__entity_row_unique_id"
+                ORDER BY event_timestamp DESC{% if featureview.created_timestamp_column %},created_timestamp DESC{% endif %}
+            ) AS row_number
+        FROM "{{ featureview.name }}__base"
+        {% if featureview.created_timestamp_column %}
+            INNER JOIN "{{ featureview.name }}__dedup"
+            USING ("{{featureview.name}}__entity_row_unique_id", event_timestamp, created_timestamp)
+        {% endif %}
+    ) AS sub
+    WHERE row_number = 1
+),
+
+/*
+ 4. Once we know the latest value of each feature for a given timestamp,
+ we can join again the data back to the original "base" dataset
+*/
+"{{ featureview.name }}__cleaned" AS (
+    SELECT base.*
+    FROM "{{ featureview.name }}__base" as base
+    INNER JOIN "{{ featureview.name }}__latest"
+    USING(
+        "{{featureview.name}}__entity_row_unique_id",
+        event_timestamp
+        {% if featureview.created_timestamp_column %}
+            ,created_timestamp
+        {% endif %}
+    )
+){% if loop.last %}{% else %}, {% endif %}
+
+
+{% endfor %}
+/*
+ Joins the outputs of multiple time travel joins to a single table.
+ The entity_dataframe dataset being our source of truth here.
+ */
+
+SELECT "{{ final_output_feature_names | join('", "')}}"
+FROM entity_dataframe
+{% for featureview in featureviews %}
+LEFT JOIN (
+    SELECT
+        "{{featureview.name}}__entity_row_unique_id"
+        {% for feature in featureview.features %}
+            ,"{% if full_feature_names %}{{ featureview.name }}__{{featureview.field_mapping.get(feature, feature)}}{% else %}{{ featureview.field_mapping.get(feature, feature) }}{% endif %}"
+        {% endfor %}
+    FROM "{{ featureview.name }}__cleaned"
+) AS "{{featureview.name}}" USING ("{{featureview.name}}__entity_row_unique_id")
+{% endfor %}
+"""
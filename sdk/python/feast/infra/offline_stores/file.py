@@ -1,8 +1,9 @@
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 import dask.dataframe as dd
 import pandas as pd
@@ -38,10 +39,17 @@ from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 from feast.saved_dataset import SavedDatasetStorage
 from feast.usage import log_exceptions_and_usage
-from feast.utils import (
-    _get_requested_feature_views_to_features_dict,
-    _run_dask_field_mapping,
-)
+from feast.utils import _get_requested_feature_views_to_features_dict
+
+# Private column names for the feature side of the point-in-time join
+_FEATURE_TIMESTAMP_COL = "__feast_feature_timestamp"
+_CREATED_TIMESTAMP_COL = "__feast_created_timestamp"
+
+# Upper bound on the number of feature views joined concurrently. Each join holds the
+# rows of its feature view's source within the entity timestamp range (widened by the
+# TTL) in memory, so peak memory grows with the largest sources joined at once; lower
+# this to bound it.
+MAX_JOIN_WORKERS = 8
 
 
 class FileOfflineStoreConfig(FeastConfigBaseModel):
@@ -88,6 +96,22 @@ class FileRetrievalJob(RetrievalJob):
         df = self.evaluation_function().compute()
         return pyarrow.Table.from_pandas(df)
 
+    def _to_arrow_batches_internal(
+        self, batch_size: int
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Computes and converts one partition of the result at a time, `to_arrow_batches` then
+        converts the batches to a common schema. Jobs reading a source directly keep its
+        partitions, but the point-in-time join of `get_historical_features` is computed in
+        memory as a single partition, so its result is not streamed.
+        """
+        df = self.evaluation_function()
+        for i in range(df.npartitions):
+            table = pyarrow.Table.from_pandas(
+                df.get_partition(i).compute(), preserve_index=False
+            )
+            yield from table.to_batches(max_chunksize=batch_size)
+
     def persist(self, storage: SavedDatasetStorage, allow_overwrite: bool = False):
         assert isinstance(storage, SavedDatasetFileStorage)
 
@@ -133,6 +157,11 @@ class FileOfflineStore(OfflineStore):
         assert isinstance(config.offline_store, FileOfflineStoreConfig)
         for fv in feature_views:
             assert isinstance(fv.batch_source, FileSource)
+            if not fv.batch_source.timestamp_field:
+                raise ValueError(
+                    f"The source of feature view {fv.name} has no timestamp_field, "
+                    f"which the point-in-time join of historical features requires."
+                )
 
         if not isinstance(entity_df, pd.DataFrame) and not isinstance(
             entity_df, dd.DataFrame
@@ -171,109 +200,45 @@ class FileOfflineStore(OfflineStore):
         def evaluate_historical_retrieval():
 
             # Create a copy of entity_df to prevent modifying the original
-            entity_df_with_features = entity_df.copy()
-
-            entity_df_event_timestamp_col_type = entity_df_with_features.dtypes[
-                entity_df_event_timestamp_col
-            ]
-            if (
-                not hasattr(entity_df_event_timestamp_col_type, "tz")
-                or entity_df_event_timestamp_col_type.tz != pytz.UTC
-            ):
-                # Make sure all event timestamp fields are tz-aware. We default tz-naive fields to UTC
-                entity_df_with_features[
-                    entity_df_event_timestamp_col
-                ] = entity_df_with_features[entity_df_event_timestamp_col].apply(
-                    lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc)
-                )
+            if isinstance(entity_df, dd.DataFrame):
+                entity_df_with_features = entity_df.compute()
+            else:
+                entity_df_with_features = entity_df.copy()
 
-                # Convert event timestamp column to datetime and normalize time zone to UTC
-                # This is necessary to avoid issues with pd.merge_asof
-                if isinstance(entity_df_with_features, dd.DataFrame):
-                    entity_df_with_features[
-                        entity_df_event_timestamp_col
-                    ] = dd.to_datetime(
-                        entity_df_with_features[entity_df_event_timestamp_col], utc=True
-                    )
-                else:
-                    entity_df_with_features[
-                        entity_df_event_timestamp_col
-                    ] = pd.to_datetime(
-                        entity_df_with_features[entity_df_event_timestamp_col], utc=True
-                    )
-
-            # Sort event timestamp values
-            entity_df_with_features = entity_df_with_features.sort_values(
-                entity_df_event_timestamp_col
+            # Make sure all event timestamps are tz-aware and in UTC. We default tz-naive timestamps to UTC.
+            # The as-of join needs the entity rows sorted by their event timestamp.
+            entity_df_with_features[entity_df_event_timestamp_col] = pd.to_datetime(
+                entity_df_with_features[entity_df_event_timestamp_col], utc=True
             )
+            entity_df_with_features = entity_df_with_features.sort_values(
+                entity_df_event_timestamp_col, kind="mergesort"
+            ).reset_index(drop=True)
 
-            all_join_keys = []
-
-            # Load feature view data from sources and join them incrementally
-            for feature_view, features in feature_views_to_features.items():
-                timestamp_field = feature_view.batch_source.timestamp_field
-                created_timestamp_column = (
-                    feature_view.batch_source.created_timestamp_column
-                )
-
-                # Build a list of entity columns to join on (from the right table)
-                join_keys = []
-
-                for entity_column in feature_view.entity_columns:
-                    join_key = feature_view.projection.join_key_map.get(
-                        entity_column.name, entity_column.name
-                    )
-                    join_keys.append(join_key)
-
-                right_entity_key_columns = [
-                    timestamp_field,
-                    created_timestamp_column,
-                ] + join_keys
-                right_entity_key_columns = [c for c in right_entity_key_columns if c]
-
-                all_join_keys = list(set(all_join_keys + join_keys))
-
-                df_to_join = _read_datasource(feature_view.batch_source)
-
-                df_to_join, timestamp_field = _field_mapping(
-                    df_to_join,
+            def join_feature_view(item: Tuple[FeatureView, List[str]]) -> pd.DataFrame:
+                feature_view, features = item
+                return _point_in_time_join(
+                    entity_df_with_features,
+                    entity_df_event_timestamp_col,
                     feature_view,
                     features,
-                    right_entity_key_columns,
-                    entity_df_event_timestamp_col,
-                    timestamp_field,
+                    entity_df_event_timestamp_range,
                     full_feature_names,
                 )
 
-                df_to_join = _merge(entity_df_with_features, df_to_join, join_keys)
-
-                df_to_join = _normalize_timestamp(
-                    df_to_join, timestamp_field, created_timestamp_column
-                )
-
-                df_to_join = _filter_ttl(
-                    df_to_join,
-                    feature_view,
-                    entity_df_event_timestamp_col,
-                    timestamp_field,
-                )
-
-                df_to_join = _drop_duplicates(
-                    df_to_join,
-                    all_join_keys,
-                    timestamp_field,
-                    created_timestamp_column,
-                    entity_df_event_timestamp_col,
+            # Feature views are joined independently of each other, so they can be read and joined in parallel
+            with ThreadPoolExecutor(
+                max_workers=max(
+                    1, min(len(feature_views_to_features), MAX_JOIN_WORKERS)
                 )
-
-                entity_df_with_features = _drop_columns(
-                    df_to_join, features, timestamp_field, created_timestamp_column
+            ) as executor:
+                joined_features = list(
+                    executor.map(join_feature_view, feature_views_to_features.items())
                 )
 
-                # Ensure that we delete dataframes to free up memory
-                del df_to_join
-
-            return entity_df_with_features.persist()
+            entity_df_with_features = pd.concat(
+                [entity_df_with_features] + joined_features, axis=1
+            )
+            return dd.from_pandas(entity_df_with_features, npartitions=1)
 
         job = FileRetrievalJob(
             evaluation_function=evaluate_historical_retrieval,
@@ -307,7 +272,15 @@ class FileOfflineStore(OfflineStore):
 
         # Create lazy function that is only called from the RetrievalJob object
         def evaluate_offline_job():
-            source_df = _read_datasource(data_source)
+            source_df = _read_datasource(
+                data_source,
+                columns=join_key_columns
+                + feature_name_columns
+                + [timestamp_field, created_timestamp_column],
+                timestamp_field=timestamp_field,
+                start_date=start_date,
+                end_date=end_date,
+            )
 
             source_df = _normalize_timestamp(
                 source_df, timestamp_field, created_timestamp_column
@@ -324,47 +297,27 @@ class FileOfflineStore(OfflineStore):
                 if created_timestamp_column
                 else [timestamp_field]
             )
-            # try-catch block is added to deal with this issue https://github.com/dask/dask/issues/8939.
-            # TODO(kevjumba): remove try catch when fix is merged upstream in Dask.
-            try:
-                if created_timestamp_column:
-                    source_df = source_df.sort_values(
-                        by=created_timestamp_column,
-                    )
-
-                source_df = source_df.sort_values(by=timestamp_field)
-
-            except ZeroDivisionError:
-                # Use 1 partition to get around case where everything in timestamp column is the same so the partition algorithm doesn't
-                # try to divide by zero.
-                if created_timestamp_column:
-                    source_df = source_df.sort_values(
-                        by=created_timestamp_column, npartitions=1
-                    )
-
-                source_df = source_df.sort_values(by=timestamp_field, npartitions=1)
 
             source_df = source_df[
                 (source_df[timestamp_field] >= start_date)
                 & (source_df[timestamp_field] < end_date)
             ]
 
-            source_df = source_df.persist()
-
             columns_to_extract = set(
                 join_key_columns + feature_name_columns + ts_columns
             )
-            if join_key_columns:
-                source_df = source_df.drop_duplicates(
-                    join_key_columns, keep="last", ignore_index=True
-                )
-            else:
+            if not join_key_columns:
                 source_df[DUMMY_ENTITY_ID] = DUMMY_ENTITY_VAL
                 columns_to_extract.add(DUMMY_ENTITY_ID)
 
-            source_df = source_df.persist()
+            source_df = _latest_per_key(
+                source_df[list(columns_to_extract)],
+                join_key_columns or [DUMMY_ENTITY_ID],
+                timestamp_field,
+                created_timestamp_column,
+            )
 
-            return source_df[list(columns_to_extract)].persist()
+            return source_df.persist()
 
         # When materializing a single feature view, we don't need full feature names. On demand transforms aren't materialized
         return FileRetrievalJob(
@@ -485,7 +438,22 @@ def _get_entity_df_event_timestamp_range(
     )
 
 
-def _read_datasource(data_source) -> dd.DataFrame:
+def _read_datasource(
+    data_source: FileSource,
+    columns: Optional[List[str]] = None,
+    timestamp_field: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> dd.DataFrame:
+    """
+    Reads a file source into a dask dataframe, pushing the column selection and
+    the event timestamp range down into the parquet reader.
+
+    Requested columns that are missing from the source are ignored here, so that
+    the callers keep raising their own errors for them. The timestamp range is
+    pushed down as row-group filters, which may return rows outside the range;
+    callers still have to filter the rows themselves.
+    """
     storage_options = (
         {
             "client_kwargs": {
@@ -496,251 +464,229 @@ def _read_datasource(data_source) -> dd.DataFrame:
         else None
     )
 
+    read_columns = None
+    filters = None
+    if columns is not None or (timestamp_field and (start_date or end_date)):
+        schema = _get_datasource_schema(data_source)
+        if columns is not None:
+            read_columns = [
+                column
+                for column in dict.fromkeys(columns)
+                if column and column in schema.names
+            ]
+        if timestamp_field and timestamp_field in schema.names:
+            filters = _get_timestamp_filters(
+                timestamp_field,
+                schema.field(timestamp_field).type,
+                start_date,
+                end_date,
+            )
+
     return dd.read_parquet(
         data_source.path,
+        columns=read_columns or None,
+        filters=filters,
         storage_options=storage_options,
     )
 
 
-def _field_mapping(
-    df_to_join: dd.DataFrame,
-    feature_view: FeatureView,
-    features: List[str],
-    right_entity_key_columns: List[str],
-    entity_df_event_timestamp_col: str,
-    timestamp_field: str,
-    full_feature_names: bool,
-) -> Tuple[dd.DataFrame, str]:
-    # Rename columns by the field mapping dictionary if it exists
-    if feature_view.batch_source.field_mapping:
-        df_to_join = _run_dask_field_mapping(
-            df_to_join, feature_view.batch_source.field_mapping
-        )
-    # Rename entity columns by the join_key_map dictionary if it exists
-    if feature_view.projection.join_key_map:
-        df_to_join = _run_dask_field_mapping(
-            df_to_join, feature_view.projection.join_key_map
-        )
-
-    # Build a list of all the features we should select from this source
-    feature_names = []
-    columns_map = {}
-    for feature in features:
-        # Modify the separator for feature refs in column names to double underscore. We are using
-        # double underscore as separator for consistency with other databases like BigQuery,
-        # where there are very few characters available for use as separators
-        if full_feature_names:
-            formatted_feature_name = (
-                f"{feature_view.projection.name_to_use()}__{feature}"
-            )
-        else:
-            formatted_feature_name = feature
-        # Add the feature name to the list of columns
-        feature_names.append(formatted_feature_name)
-        columns_map[feature] = formatted_feature_name
-
-    # Ensure that the source dataframe feature column includes the feature view name as a prefix
-    df_to_join = _run_dask_field_mapping(df_to_join, columns_map)
-
-    # Select only the columns we need to join from the feature dataframe
-    df_to_join = df_to_join[right_entity_key_columns + feature_names]
-    df_to_join = df_to_join.persist()
-
-    # Make sure to not have duplicated columns
-    if entity_df_event_timestamp_col == timestamp_field:
-        df_to_join = _run_dask_field_mapping(
-            df_to_join,
-            {timestamp_field: f"__{timestamp_field}"},
-        )
-        timestamp_field = f"__{timestamp_field}"
-
-    return df_to_join.persist(), timestamp_field
-
-
-def _merge(
-    entity_df_with_features: dd.DataFrame,
-    df_to_join: dd.DataFrame,
-    join_keys: List[str],
-) -> dd.DataFrame:
-    # tmp join keys needed for cross join with null join table view
-    tmp_join_keys = []
-    if not join_keys:
-        entity_df_with_features["__tmp"] = 1
-        df_to_join["__tmp"] = 1
-        tmp_join_keys = ["__tmp"]
-
-    # Get only data with requested entities
-    df_to_join = dd.merge(
-        entity_df_with_features,
-        df_to_join,
-        left_on=join_keys or tmp_join_keys,
-        right_on=join_keys or tmp_join_keys,
-        suffixes=("", "__"),
-        how="left",
+def _get_datasource_schema(data_source: FileSource) -> pyarrow.Schema:
+    filesystem, path = FileSource.create_filesystem_and_path(
+        data_source.path, data_source.file_options.s3_endpoint_override
     )
+    return pyarrow.dataset.dataset(
+        path, filesystem=filesystem, format="parquet", partitioning="hive"
+    ).schema
 
-    if tmp_join_keys:
-        df_to_join = df_to_join.drop(tmp_join_keys, axis=1).persist()
-    else:
-        df_to_join = df_to_join.persist()
 
-    return df_to_join
-
-
-def _normalize_timestamp(
-    df_to_join: dd.DataFrame,
+def _get_timestamp_filters(
     timestamp_field: str,
-    created_timestamp_column: str,
+    timestamp_type: pyarrow.DataType,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> Optional[List[Tuple[str, str, pd.Timestamp]]]:
+    # Only native timestamp columns have row-group statistics we can compare against
+    if not pyarrow.types.is_timestamp(timestamp_type):
+        return None
+
+    def to_column_tz(value: datetime) -> pd.Timestamp:
+        # Naive timestamps are treated as UTC, like everywhere else in this store
+        value = pd.Timestamp(value)
+        if value.tzinfo is None:
+            value = value.tz_localize(pytz.utc)
+        value = value.tz_convert(pytz.utc)
+        return value if timestamp_type.tz else value.tz_localize(None)
+
+    filters = []
+    if start_date:
+        filters.append((timestamp_field, ">=", to_column_tz(start_date)))
+    if end_date:
+        filters.append((timestamp_field, "<=", to_column_tz(end_date)))
+    return filters or None
+
+
+def _source_columns(data_source: FileSource, columns: List[str]) -> List[str]:
+    # Map column names back through the field mapping, to the names in the files
+    reverse_field_mapping = {v: k for k, v in data_source.field_mapping.items()}
+    return [reverse_field_mapping.get(column, column) for column in columns if column]
+
+
+def _latest_per_key(
+    df: dd.DataFrame,
+    join_keys: List[str],
+    timestamp_field: str,
+    created_timestamp_column: Optional[str],
 ) -> dd.DataFrame:
-    df_to_join_types = df_to_join.dtypes
-    timestamp_field_type = df_to_join_types[timestamp_field]
-
-    if created_timestamp_column:
-        created_timestamp_column_type = df_to_join_types[created_timestamp_column]
-
-    if not hasattr(timestamp_field_type, "tz") or timestamp_field_type.tz != pytz.UTC:
-        # if you are querying for the event timestamp field, we have to deduplicate
-        if len(df_to_join[timestamp_field].shape) > 1:
-            df_to_join, dups = _df_column_uniquify(df_to_join)
-            df_to_join = df_to_join.drop(columns=dups)
-
-        # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
-        df_to_join[timestamp_field] = df_to_join[timestamp_field].apply(
-            lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc),
-            meta=(timestamp_field, "datetime64[ns, UTC]"),
-        )
-
-    if created_timestamp_column and (
-        not hasattr(created_timestamp_column_type, "tz")
-        or created_timestamp_column_type.tz != pytz.UTC
-    ):
-        if len(df_to_join[created_timestamp_column].shape) > 1:
-            # if you are querying for the created timestamp field, we have to deduplicate
-            df_to_join, dups = _df_column_uniquify(df_to_join)
-            df_to_join = df_to_join.drop(columns=dups)
-
-        df_to_join[created_timestamp_column] = df_to_join[
-            created_timestamp_column
-        ].apply(
-            lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc),
-            meta=(timestamp_field, "datetime64[ns, UTC]"),
+    """
+    Keeps the newest row per join key, by event timestamp and then created timestamp.
+
+    Each partition is first reduced on its own, the reduced rows are then hash
+    partitioned on the join keys so that all candidates for a key meet in a single
+    partition, and reduced again. Unlike sorting, this never needs a global order.
+    """
+    meta = df._meta
+    df = df.map_partitions(
+        _latest_per_key_in_partition,
+        join_keys,
+        timestamp_field,
+        created_timestamp_column,
+        meta=meta,
+    )
+    if df.npartitions > 1:
+        df = df.shuffle(on=join_keys).map_partitions(
+            _latest_per_key_in_partition,
+            join_keys,
+            timestamp_field,
+            created_timestamp_column,
+            meta=meta,
         )
-
-    return df_to_join.persist()
+    return df
 
 
-def _filter_ttl(
-    df_to_join: dd.DataFrame,
-    feature_view: FeatureView,
-    entity_df_event_timestamp_col: str,
+def _latest_per_key_in_partition(
+    df: pd.DataFrame,
+    join_keys: List[str],
     timestamp_field: str,
-) -> dd.DataFrame:
-    # Filter rows by defined timestamp tolerance
-    if feature_view.ttl and feature_view.ttl.total_seconds() != 0:
-        df_to_join = df_to_join[
-            # do not drop entity rows if one of the sources returns NaNs
-            df_to_join[timestamp_field].isna()
-            | (
-                (
-                    df_to_join[timestamp_field]
-                    >= df_to_join[entity_df_event_timestamp_col] - feature_view.ttl
-                )
-                & (
-                    df_to_join[timestamp_field]
-                    <= df_to_join[entity_df_event_timestamp_col]
-                )
-            )
-        ]
-
-        df_to_join = df_to_join.persist()
-    else:
-        df_to_join = df_to_join[
-            # do not drop entity rows if one of the sources returns NaNs
-            df_to_join[timestamp_field].isna()
-            | (df_to_join[timestamp_field] <= df_to_join[entity_df_event_timestamp_col])
-        ]
-
-        df_to_join = df_to_join.persist()
-
-    return df_to_join
+    created_timestamp_column: Optional[str],
+) -> pd.DataFrame:
+    for column in [timestamp_field, created_timestamp_column]:
+        if not column or df.empty:
+            continue
+        # Keep the rows holding the per key maximum; a key whose values are all
+        # null keeps all of its rows for the next tie breaker
+        latest = df.groupby(join_keys, sort=False, dropna=False)[column].transform(
+            "max"
+        )
+        df = df[(df[column] == latest) | latest.isna()]
+    return df.drop_duplicates(join_keys, keep="last", ignore_index=True)
 
 
-def _drop_duplicates(
-    df_to_join: dd.DataFrame,
-    all_join_keys: List[str],
-    timestamp_field: str,
-    created_timestamp_column: str,
+def _point_in_time_join(
+    entity_df: pd.DataFrame,
     entity_df_event_timestamp_col: str,
-) -> dd.DataFrame:
-    column_order = df_to_join.columns
-
-    # try-catch block is added to deal with this issue https://github.com/dask/dask/issues/8939.
-    # TODO(kevjumba): remove try catch when fix is merged upstream in Dask.
-    try:
-        if created_timestamp_column:
-            df_to_join = df_to_join.sort_values(
-                by=created_timestamp_column, na_position="first"
-            )
-            df_to_join = df_to_join.persist()
+    feature_view: FeatureView,
+    features: List[str],
+    entity_df_event_timestamp_range: Tuple[datetime, datetime],
+    full_feature_names: bool,
+) -> pd.DataFrame:
+    """
+    Looks up the features of a single feature view as of every entity row.
+
+    For every row of entity_df, which must be sorted by its event timestamp, the
+    feature row with the same join keys and the latest event timestamp (and then
+    created timestamp) not after the entity timestamp is picked, as long as it is
+    within the feature view TTL. Returns the feature columns, aligned with the
+    index of entity_df.
+    """
+    data_source = feature_view.batch_source
+    timestamp_field = data_source.timestamp_field
+    created_timestamp_column = data_source.created_timestamp_column
+    join_keys = [
+        feature_view.projection.join_key_map.get(column.name, column.name)
+        for column in feature_view.entity_columns
+    ]
 
-        df_to_join = df_to_join.sort_values(by=timestamp_field, na_position="first")
-        df_to_join = df_to_join.persist()
+    source_df = _read_datasource(
+        data_source,
+        columns=_source_columns(
+            data_source,
+            [timestamp_field, created_timestamp_column]
+            + [column.name for column in feature_view.entity_columns]
+            + features,
+        ),
+        timestamp_field=_source_columns(data_source, [timestamp_field])[0],
+        start_date=(
+            entity_df_event_timestamp_range[0] - feature_view.ttl
+            if feature_view.ttl
+            else None
+        ),
+        end_date=entity_df_event_timestamp_range[1],
+    ).compute()
+
+    # Rename columns by the field mapping, then entity columns by the join_key_map
+    source_df = source_df.rename(columns=data_source.field_mapping).rename(
+        columns=feature_view.projection.join_key_map
+    )
 
-    except ZeroDivisionError:
-        # Use 1 partition to get around case where everything in timestamp column is the same so the partition algorithm doesn't
-        # try to divide by zero.
-        if created_timestamp_column:
-            df_to_join = df_to_join[column_order].sort_values(
-                by=created_timestamp_column, na_position="first", npartitions=1
+    # Build the right side of the join out of the columns we need, under names that
+    # can't clash with the entity dataframe. Use double underscore as separator for
+    # full feature names, for consistency with other databases like BigQuery.
+    feature_df = pd.DataFrame(index=source_df.index)
+    for join_key in join_keys:
+        feature_df[join_key] = source_df[join_key]
+        if feature_df[join_key].dtype != entity_df[join_key].dtype:
+            feature_df[join_key] = feature_df[join_key].astype(
+                entity_df[join_key].dtype
             )
-            df_to_join = df_to_join.persist()
-
-        df_to_join = df_to_join[column_order].sort_values(
-            by=timestamp_field, na_position="first", npartitions=1
+    sort_columns = [_FEATURE_TIMESTAMP_COL]
+    feature_df[_FEATURE_TIMESTAMP_COL] = pd.to_datetime(
+        source_df[timestamp_field], utc=True
+    )
+    if created_timestamp_column:
+        sort_columns.append(_CREATED_TIMESTAMP_COL)
+        feature_df[_CREATED_TIMESTAMP_COL] = pd.to_datetime(
+            source_df[created_timestamp_column], utc=True
         )
-        df_to_join = df_to_join.persist()
+    feature_names = []
+    for feature in features:
+        feature_name = (
+            f"{feature_view.projection.name_to_use()}__{feature}"
+            if full_feature_names
+            else feature
+        )
+        feature_df[feature_name] = source_df[feature]
+        feature_names.append(feature_name)
+    del source_df
+
+    # A backward as-of search picks the last matching row, so sorting by the created
+    # timestamp as well breaks ties between rows with the same event timestamp
+    feature_df = feature_df.dropna(subset=[_FEATURE_TIMESTAMP_COL]).sort_values(
+        sort_columns, kind="mergesort", na_position="first"
+    )
 
-    df_to_join = df_to_join.drop_duplicates(
-        all_join_keys + [entity_df_event_timestamp_col],
-        keep="last",
-        ignore_index=True,
+    joined_df = pd.merge_asof(
+        entity_df[join_keys + [entity_df_event_timestamp_col]],
+        feature_df,
+        left_on=entity_df_event_timestamp_col,
+        right_on=_FEATURE_TIMESTAMP_COL,
+        by=join_keys or None,
+        direction="backward",
+        tolerance=feature_view.ttl if feature_view.ttl else None,
     )
 
-    return df_to_join.persist()
+    joined_df = joined_df[feature_names]
+    joined_df.index = entity_df.index
+    return joined_df
 
 
-def _drop_columns(
-    df_to_join: dd.DataFrame,
-    features: List[str],
+def _normalize_timestamp(
+    df: dd.DataFrame,
     timestamp_field: str,
-    created_timestamp_column: str,
+    created_timestamp_column: Optional[str],
 ) -> dd.DataFrame:
-    entity_df_with_features = df_to_join
-    timestamp_columns = [
-        timestamp_field,
-        created_timestamp_column,
-    ]
-    for column in timestamp_columns:
-        if column and column not in features:
-            entity_df_with_features = entity_df_with_features.drop(
-                [column], axis=1
-            ).persist()
-
-    return entity_df_with_features
-
-
-def _df_column_uniquify(df: dd.DataFrame) -> Tuple[dd.DataFrame, List[str]]:
-    df_columns = df.columns
-    new_columns = []
-    duplicate_cols = []
-    for item in df_columns:
-        counter = 0
-        newitem = item
-        while newitem in new_columns:
-            counter += 1
-            newitem = "{}_{}".format(item, counter)
-            if counter > 0:
-                duplicate_cols.append(newitem)
-        new_columns.append(newitem)
-    df.columns = new_columns
-    return df, duplicate_cols
+    # Make sure all timestamp fields are tz-aware and in UTC. We default tz-naive fields to UTC
+    for column in [timestamp_field, created_timestamp_column]:
+        if column and getattr(df.dtypes[column], "tz", None) != pytz.UTC:
+            df[column] = dd.to_datetime(df[column], utc=True)
+
+    return df
@@ -15,7 +15,7 @@ import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Union
 
 import pandas as pd
 import pyarrow
@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 warnings.simplefilter("once", RuntimeWarning)
 
+DEFAULT_ARROW_BATCH_SIZE = 65536
+
 
 class RetrievalMetadata:
     min_event_timestamp: Optional[datetime]
@@ -58,6 +60,24 @@ class RetrievalMetadata:
         self.max_event_timestamp = max_event_timestamp
 
 
+def _fill_null_types(schema: pyarrow.Schema, other: pyarrow.Schema) -> pyarrow.Schema:
+    # Gives the fields of `schema` typed null the type of the same field in `other`
+    for i, field in enumerate(schema):
+        if pyarrow.types.is_null(field.type):
+            j = other.get_field_index(field.name)
+            if j >= 0 and not pyarrow.types.is_null(other.field(j).type):
+                schema = schema.set(i, field.with_type(other.field(j).type))
+    return schema
+
+
+def _cast_batch(
+    batch: pyarrow.RecordBatch, schema: pyarrow.Schema
+) -> pyarrow.RecordBatch:
+    if batch.schema.equals(schema):
+        return batch
+    return pyarrow.Table.from_batches([batch]).cast(schema).to_batches()[0]
+
+
 class RetrievalJob(ABC):
     """A RetrievalJob manages the execution of a query to retrieve data from the offline store."""
 
@@ -75,17 +95,8 @@ class RetrievalJob(ABC):
         """
         features_df = self._to_df_internal()
 
-        if self.on_demand_feature_views:
-            # TODO(adchia): Fix requirement to specify dependent feature views in feature_refs
-            for odfv in self.on_demand_feature_views:
-                if odfv.mode != 'pandas':
-                    raise Exception(f'OnDemandFeatureView mode "{odfv.mode}" not supported for offline processing.')
-                features_df = features_df.join(
-                    odfv.get_transformed_features_df(
-                        features_df,
-                        self.full_feature_names,
-                    )
-                )
+        # TODO(adchia): Fix requirement to specify dependent feature views in feature_refs
+        features_df = self._apply_on_demand_feature_views(features_df)
 
         if validation_reference:
             if not flags_helper.is_test():
@@ -118,16 +129,7 @@ class RetrievalJob(ABC):
             return self._to_arrow_internal()
 
         features_df = self._to_df_internal()
-        if self.on_demand_feature_views:
-            for odfv in self.on_demand_feature_views:
-                if odfv.mode != 'pandas':
-                    raise Exception(f'OnDemandFeatureView mode "{odfv.mode}" not supported for offline processing.')
-                features_df = features_df.join(
-                    odfv.get_transformed_features_df(
-                        features_df,
-                        self.full_feature_names,
-                    )
-                )
+        features_df = self._apply_on_demand_feature_views(features_df)
 
         if validation_reference:
             if not flags_helper.is_test():
@@ -144,6 +146,61 @@ class RetrievalJob(ABC):
 
         return pyarrow.Table.from_pandas(features_df)
 
+    def to_arrow_batches(
+        self, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Executes the underlying query and streams the result as arrow record batches of at most
+        `batch_size` rows, so that results larger than memory can be consumed.
+
+        On demand transformations will be executed on every batch. Offline stores without a native
+        implementation execute the whole query with `to_arrow` and split the result.
+
+        Args:
+            batch_size: The maximum number of rows per record batch.
+        """
+        # Types inferred from a single batch may differ between batches (e.g. an int column with a
+        # missing value becomes a float column), so every batch is converted to the schema of the first.
+        # Columns with only nulls so far have no type yet: batches are held back until a later batch
+        # gives them one, and only then converted and yielded.
+        schema: Optional[pyarrow.Schema] = None
+        pending: List[pyarrow.RecordBatch] = []
+        for batch in self._to_arrow_batches_internal(batch_size):
+            for offset in range(0, batch.num_rows, batch_size):
+                sliced_batch = batch.slice(offset, batch_size)
+                if self.on_demand_feature_views:
+                    features_df = self._apply_on_demand_feature_views(
+                        sliced_batch.to_pandas()
+                    )
+                    sliced_batch = pyarrow.RecordBatch.from_pandas(
+                        features_df, preserve_index=False
+                    )
+                schema = (
+                    sliced_batch.schema
+                    if schema is None
+                    else _fill_null_types(schema, sliced_batch.schema)
+                )
+                pending.append(sliced_batch)
+                if not any(pyarrow.types.is_null(field.type) for field in schema):
+                    yield from (_cast_batch(b, schema) for b in pending)
+                    pending = []
+        if schema is not None:
+            yield from (_cast_batch(b, schema) for b in pending)
+
+    def _apply_on_demand_feature_views(self, features_df: pd.DataFrame) -> pd.DataFrame:
+        for odfv in self.on_demand_feature_views:
+            if odfv.mode != "pandas":
+                raise Exception(
+                    f'OnDemandFeatureView mode "{odfv.mode}" not supported for offline processing.'
+                )
+            features_df = features_df.join(
+                odfv.get_transformed_features_df(
+                    features_df,
+                    self.full_feature_names,
+                )
+            )
+        return features_df
+
     def to_sql(self) -> str:
         """
         Return RetrievalJob generated SQL statement if applicable.
@@ -170,6 +227,17 @@ class RetrievalJob(ABC):
         """
         pass
 
+    def _to_arrow_batches_internal(
+        self, batch_size: int
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Executes the underlying query and yields the result as arrow record batches. Batches may
+        be larger than `batch_size`, in which case they will be split.
+
+        Does not handle on demand transformations. For that, `to_arrow_batches` should be used.
+        """
+        yield from self._to_arrow_internal().to_batches(max_chunksize=batch_size)
+
     @property
     @abstractmethod
     def full_feature_names(self) -> bool:
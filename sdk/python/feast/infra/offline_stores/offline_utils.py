@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, KeysView, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, KeysView, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -104,10 +104,14 @@ def get_feature_view_query_context(
     registry: BaseRegistry,
     project: str,
     entity_df_timestamp_range: Tuple[datetime, datetime],
+    get_table_query_string: Optional[Callable[[DataSource], str]] = None,
 ) -> List[FeatureViewQueryContext]:
     """
     Build a query context containing all information required to template a BigQuery and
     Redshift point-in-time SQL query
+
+    `get_table_query_string` returns the table to query for a batch source, and defaults to the
+    source's own `get_table_query_string`.
     """
     (
         feature_views_to_feature_map,
@@ -166,7 +170,11 @@ def get_feature_view_query_context(
             timestamp_field=timestamp_field,
             created_timestamp_column=created_timestamp_column,
             # TODO: Make created column optional and not hardcoded
-            table_subquery=feature_view.batch_source.get_table_query_string(),
+            table_subquery=(
+                get_table_query_string(feature_view.batch_source)
+                if get_table_query_string
+                else feature_view.batch_source.get_table_query_string()
+            ),
             entity_selections=entity_selections,
             min_event_timestamp=min_event_timestamp,
             max_event_timestamp=max_event_timestamp,
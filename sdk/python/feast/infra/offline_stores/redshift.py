@@ -427,6 +427,21 @@ class RedshiftRetrievalJob(RetrievalJob):
                 query,
             )
 
+    @log_exceptions_and_usage
+    def _to_arrow_batches_internal(self, batch_size: int) -> Iterator[pa.RecordBatch]:
+        with self._query_generator() as query:
+            yield from aws_utils.unload_redshift_query_to_arrow_batches(
+                self._redshift_client,
+                self._config.offline_store.cluster_id,
+                self._config.offline_store.database,
+                self._config.offline_store.user,
+                self._s3_resource,
+                self._s3_path,
+                self._config.offline_store.iam_role,
+                query,
+                batch_size,
+            )
+
     @log_exceptions_and_usage
     def to_s3(self) -> str:
         """Export dataset to S3 in Parquet format and return path"""
@@ -436,6 +436,16 @@ class SnowflakeRetrievalJob(RetrievalJob):
                     pd.DataFrame(columns=[md.name for md in empty_result.description])
                 )
 
+    def _to_arrow_batches_internal(
+        self, batch_size: int
+    ) -> Iterator[pyarrow.RecordBatch]:
+        with self._query_generator() as query:
+            # Snowflake decides on the size of the result chunks it returns
+            for pa_table in execute_snowflake_statement(
+                self.snowflake_conn, query
+            ).fetch_arrow_batches():
+                yield from pa_table.to_batches(max_chunksize=batch_size)
+
     def to_snowflake(self, table_name: str, temporary=False) -> None:
         """Save dataset as a new Snowflake table"""
         if self.on_demand_feature_views:
@@ -0,0 +1,234 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bit set in `Connection.server_status` by the server while a transaction is open.
+SERVER_STATUS_IN_TRANS = 1
+
+
+class ConnectionPoolTimeout(Exception):
+    def __init__(self, timeout: float):
+        super().__init__(
+            f"Timed out after {timeout} seconds waiting for a MySQL connection from the pool"
+        )
+
+
+class ConnectionPoolClosed(Exception):
+    def __init__(self):
+        super().__init__("Cannot check out a MySQL connection from a closed pool")
+
+
+@dataclass
+class PooledConnection:
+    """A connection owned by a `MySQLConnectionPool`, plus the bookkeeping the pool needs to recycle it."""
+
+    raw_conn: Any
+    dbapi_conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Counters describing the lifetime behaviour of a `MySQLConnectionPool`."""
+
+    max_size: int
+    idle: int = 0
+    in_use: int = 0
+    created: int = 0
+    recycled: int = 0
+    discarded: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+
+
+class MySQLConnectionPool:
+    """
+    A bounded, thread-safe pool of MySQL connections.
+
+    A connection is checked out by exactly one thread at a time and is returned to the pool on release
+    instead of being closed, so steady-state requests skip the TCP and authentication handshake.
+    Connections older than `max_lifetime_seconds` are recycled on checkout, and connections that have
+    been idle longer than `health_check_interval_seconds` are pinged before being handed out.
+
+    Args:
+        connect: Opens a new connection. Returns the object to close and the DBAPI connection to use,
+            which are the same object for raw pymysql connections.
+        max_size: The maximum number of connections (idle and checked out) held by the pool.
+        max_lifetime_seconds: Connections older than this are closed and replaced. 0 disables recycling.
+        checkout_timeout_seconds: How long `checkout` blocks waiting for a free connection.
+        health_check_interval_seconds: Idle time after which a connection is pinged before reuse.
+            0 pings on every checkout, None disables pings.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int,
+        max_lifetime_seconds: int = 0,
+        checkout_timeout_seconds: float = 30.0,
+        health_check_interval_seconds: Optional[float] = None,
+    ):
+        if max_size < 1:
+            raise ValueError(f"MySQL connection pool size must be positive, got {max_size}")
+        self._connect = connect
+        self._max_size = max_size
+        self._max_lifetime_seconds = max_lifetime_seconds
+        self._checkout_timeout_seconds = checkout_timeout_seconds
+        self._health_check_interval_seconds = health_check_interval_seconds
+
+        self._idle: List[PooledConnection] = []
+        self._num_open = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._stats = ConnectionPoolStats(max_size=max_size)
+        self._closed = False
+
+    def checkout(self) -> PooledConnection:
+        """
+        Returns a healthy connection for exclusive use by the calling thread until `release` is called.
+        Raises `ConnectionPoolClosed` once the pool has been closed.
+        """
+        start = time.monotonic()
+        deadline = start + self._checkout_timeout_seconds
+        while True:
+            pooled = self._acquire_slot(deadline)
+            if pooled is None:
+                try:
+                    pooled = self._open()
+                except Exception:
+                    self._free_slot()
+                    raise
+            elif not self._is_usable(pooled):
+                self._close(pooled)
+                with self._cond:
+                    self._stats.discarded += 1
+                    self._num_open -= 1
+                continue
+
+            with self._cond:
+                closed = self._closed
+                if not closed:
+                    self._stats.checkouts += 1
+                    self._stats.total_wait_seconds += time.monotonic() - start
+            if closed:
+                # The pool was closed while this connection was being opened or health checked.
+                self.release(pooled, discard=True)
+                raise ConnectionPoolClosed()
+            return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool. Any transaction left open by the caller is rolled back so the
+        next borrower never observes a stale snapshot. Broken connections should be released with
+        `discard=True` so that they are closed instead of reused.
+        """
+        if not discard:
+            try:
+                _end_open_transaction(pooled.dbapi_conn)
+            except Exception as e:
+                logger.warning(f"Discarding MySQL connection that failed to reset: {e}")
+                discard = True
+
+        if discard or self._closed:
+            self._close(pooled)
+            with self._cond:
+                self._stats.discarded += 1
+                self._num_open -= 1
+                self._cond.notify()
+            return
+
+        pooled.last_used_at = time.monotonic()
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Closes all idle connections. Connections still checked out are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._num_open -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close(pooled)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the pool metrics."""
+        with self._cond:
+            self._stats.idle = len(self._idle)
+            self._stats.in_use = self._num_open - len(self._idle)
+            return dict(self._stats.__dict__)
+
+    def _acquire_slot(self, deadline: float) -> Optional[PooledConnection]:
+        """Pops an idle connection, or reserves room for a new one (returning None), blocking while full."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ConnectionPoolClosed()
+                if self._idle:
+                    # LIFO keeps the hot connections hot and lets cold ones age out.
+                    return self._idle.pop()
+                if self._num_open < self._max_size:
+                    self._num_open += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats.timeouts += 1
+                    raise ConnectionPoolTimeout(self._checkout_timeout_seconds)
+                self._cond.wait(remaining)
+
+    def _free_slot(self) -> None:
+        with self._cond:
+            self._num_open -= 1
+            self._cond.notify()
+
+    def _open(self) -> PooledConnection:
+        raw_conn, dbapi_conn = self._connect()
+        with self._cond:
+            self._stats.created += 1
+        return PooledConnection(raw_conn=raw_conn, dbapi_conn=dbapi_conn)
+
+    def _is_usable(self, pooled: PooledConnection) -> bool:
+        now = time.monotonic()
+        if self._max_lifetime_seconds and now - pooled.created_at > self._max_lifetime_seconds:
+            with self._cond:
+                self._stats.recycled += 1
+            return False
+        if (
+            self._health_check_interval_seconds is not None
+            and now - pooled.last_used_at >= self._health_check_interval_seconds
+        ):
+            return _ping(pooled.dbapi_conn)
+        return True
+
+    @staticmethod
+    def _close(pooled: PooledConnection) -> None:
+        try:
+            pooled.raw_conn.close()
+        except Exception:
+            pass
+
+
+def _ping(dbapi_conn: Any) -> bool:
+    try:
+        with dbapi_conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            cur.fetchall()
+        _end_open_transaction(dbapi_conn)
+        return True
+    except Exception as e:
+        logger.info(f"Discarding MySQL connection that failed its health check: {e}")
+        return False
+
+
+def _end_open_transaction(dbapi_conn: Any) -> None:
+    server_status = getattr(dbapi_conn, "server_status", None)
+    # pymysql tracks whether a transaction is open, which lets us skip the round trip; other drivers
+    # (e.g. mysqlclient behind SQLAlchemy) always get an explicit rollback.
+    if server_status is None or server_status & SERVER_STATUS_IN_TRANS:
+        dbapi_conn.rollback()
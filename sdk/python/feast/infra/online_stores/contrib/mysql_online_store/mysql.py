@@ -1,35 +1,56 @@
 from __future__ import absolute_import
+import asyncio
 import logging
+import struct
+import threading
 import time
 
-from enum import Enum
+from collections import defaultdict
+from contextlib import contextmanager
 from importlib import import_module
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import pymysql
 import pytz
-from pydantic import StrictStr
+from pydantic import StrictInt, StrictStr
+from pydantic.typing import Literal
 from pymysql.connections import Connection
 from pymysql.cursors import Cursor
 
 from feast import Entity, FeatureView, RepoConfig
 from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.contrib.mysql_online_store.connection_pool import (
+    MySQLConnectionPool,
+)
+from feast.infra.online_stores.helpers import _close_on_loop
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel
 
+try:
+    import aiomysql
+except ImportError:
+    # Optional: without it, `online_read_async` reads through the connection pool in a worker thread.
+    aiomysql = None
+
 logger = logging.getLogger(__name__)
 
 MYSQL_DEADLOCK_ERR = 1213
 MYSQL_WRITE_RETRIES = 3
 MYSQL_READ_RETRIES = 3
 
+# Formatting and timestamp bytes added to an upsert statement per row, on top of the key, name and value.
+_UPSERT_ROW_OVERHEAD_BYTES = 64
 
-class ConnectionType(Enum):
-    RAW = 0
-    SESSION = 1
+# Wide-row blobs start with (format version, event timestamp in microseconds since epoch, feature count),
+# followed by a (name length, name, value length, serialized ValueProto) record per feature.
+_WIDE_ROW_FORMAT_VERSION = 1
+_WIDE_ROW_HEADER = struct.Struct("<BqI")
+_WIDE_ROW_NAME_LEN = struct.Struct("<H")
+_WIDE_ROW_VALUE_LEN = struct.Struct("<I")
+_EPOCH = datetime(1970, 1, 1)
 
 
 class MySQLOnlineStoreConfig(FeastConfigBaseModel):
@@ -47,6 +68,38 @@ class MySQLOnlineStoreConfig(FeastConfigBaseModel):
     port: Optional[int] = None
     session_manager_module: Optional[StrictStr] = None
 
+    pool_size: StrictInt = 8
+    """Maximum number of connections held per pool (one pool for reads and one for writes)."""
+
+    pool_max_lifetime_seconds: StrictInt = 3600
+    """Connections older than this are closed and replaced on checkout. 0 disables recycling."""
+
+    pool_checkout_timeout_seconds: float = 30.0
+    """How long a thread waits for a free connection before raising `ConnectionPoolTimeout`."""
+
+    pool_health_check_interval_seconds: Optional[float] = 30.0
+    """Connections idle for longer than this are pinged before reuse. None disables pings."""
+
+    read_batch_size: StrictInt = 500
+    """Maximum number of entity keys looked up by a single `WHERE entity_key IN (...)` query."""
+
+    read_many_max_keys: StrictInt = 10000
+    """Maximum number of entity keys, across all feature views, fetched by a single `online_read_many` statement."""
+
+    table_layout: Literal["narrow", "wide"] = "narrow"
+    """
+    "narrow" stores one row per (entity, feature) keyed by the hex-encoded entity key. "wide" stores one row
+    per entity in a separate `<table>_wide` table, keyed by the binary entity key and holding all feature
+    values and the event timestamp in a single packed blob. Use `feast mysql-migrate-to-wide-layout` to
+    backfill the wide tables before switching.
+    """
+
+    write_batch_max_rows: StrictInt = 5000
+    """Maximum number of (entity, feature) rows upserted, and committed, by a single statement."""
+
+    write_batch_max_bytes: StrictInt = 4 * 1024 * 1024
+    """Approximate size budget of a single upsert statement; must stay below the server's `max_allowed_packet`."""
+
 
 class MySQLOnlineStore(OnlineStore):
     """
@@ -56,13 +109,18 @@ class MySQLOnlineStore(OnlineStore):
 
     """
     RB: Connections should not be shared between threads: https://stackoverflow.com/questions/45636492/can-mysqldb-connection-and-cursor-objects-be-safely-used-from-with-multiple-thre
+    Each call checks out a connection from a `MySQLConnectionPool`, which hands it to exactly one thread
+    at a time and keeps it open for reuse once the call is done.
     """
 
-    conn: Optional[Connection] = None
-
     def __init__(self) -> None:
         self.dbsession = None
         self.ro_dbsession = None
+        self._pools: Dict[bool, MySQLConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+        self._async_pool = None
+        self._async_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_pool_lock: Optional[asyncio.Lock] = None
 
     def _get_conn_session_manager(self, session_manager_module: str, readonly: bool = False) -> Connection:
         dbsession = self.ro_dbsession if readonly else self.dbsession
@@ -75,54 +133,125 @@ class MySQLOnlineStore(OnlineStore):
                 self.dbsession = dbsession
         return dbsession.get_bind(0).contextual_connect(close_with_result=False)
 
-    def _get_conn(self, config: RepoConfig, readonly: bool = False) -> Union[Connection, ConnectionType]:
-        online_store_config = config.online_store
-        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
-
+    def _connect(self, online_store_config: MySQLOnlineStoreConfig, readonly: bool) -> Tuple[Any, Connection]:
         if online_store_config.session_manager_module:
-            return (
-                self._get_conn_session_manager(
-                    session_manager_module=online_store_config.session_manager_module,
-                    readonly=readonly
-                ),
-                ConnectionType.SESSION
-            )
-        elif self.conn is None or not self.conn.open:
-            self.conn = pymysql.connect(
-                host=online_store_config.host or "127.0.0.1",
-                user=online_store_config.user or "test",
-                password=online_store_config.password or "test",
-                database=online_store_config.database or "feast",
-                port=online_store_config.port or 3306,
-                autocommit=False,
+            raw_conn = self._get_conn_session_manager(
+                session_manager_module=online_store_config.session_manager_module,
+                readonly=readonly
             )
-            assert self.conn.get_autocommit() is False
-        return self.conn, ConnectionType.RAW
+            return raw_conn, raw_conn.connection
+
+        # Reads run in autocommit mode so that they never hold a transaction (and its snapshot) open
+        # and don't need a COMMIT round trip.
+        conn = pymysql.connect(
+            host=online_store_config.host or "127.0.0.1",
+            user=online_store_config.user or "test",
+            password=online_store_config.password or "test",
+            database=online_store_config.database or "feast",
+            port=online_store_config.port or 3306,
+            autocommit=readonly,
+        )
+        assert conn.get_autocommit() is readonly
+        return conn, conn
+
+    def _get_pool(self, config: RepoConfig, readonly: bool = False) -> MySQLConnectionPool:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
 
-    def _close_conn(self, conn: Connection, conn_type: ConnectionType) -> None:
-        if conn_type == ConnectionType.SESSION:
-            try:
-                conn.close()
-            except Exception as exc:
-                if str(exc) != 'Already closed':
-                    raise exc
-        else:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        # Reads and writes use separate pools so that a burst of one can't starve the other.
+        pool = self._pools.get(readonly)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(readonly)
+                if pool is None:
+                    pool = MySQLConnectionPool(
+                        connect=lambda: self._connect(online_store_config, readonly=readonly),
+                        max_size=online_store_config.pool_size,
+                        max_lifetime_seconds=online_store_config.pool_max_lifetime_seconds,
+                        checkout_timeout_seconds=online_store_config.pool_checkout_timeout_seconds,
+                        health_check_interval_seconds=online_store_config.pool_health_check_interval_seconds,
+                    )
+                    self._pools[readonly] = pool
+        return pool
+
+    @contextmanager
+    def _get_conn(self, config: RepoConfig, readonly: bool = False) -> Iterator[Connection]:
+        """Checks out a pooled DBAPI connection for the duration of the block."""
+        pool = self._get_pool(config, readonly=readonly)
+        pooled = pool.checkout()
+        discard = False
+        try:
+            yield pooled.dbapi_conn
+        except (pymysql.OperationalError, pymysql.InterfaceError):
+            # The connection itself is likely broken; don't hand it to the next caller.
+            discard = True
+            raise
+        finally:
+            pool.release(pooled, discard=discard)
+
+    def pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the metrics of every connection pool, keyed by "read" and "write"."""
+        return {
+            "read" if readonly else "write": pool.stats()
+            for readonly, pool in self._pools.items()
+        }
+
+    async def _get_async_pool(self, online_store_config: MySQLOnlineStoreConfig):
+        """Returns the aiomysql read pool of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._async_pool_loop is not loop:
+            # The connections of a pool are bound to the loop that opened them, so they can't be reused here.
+            self._close_async_pool()
+            self._async_pool_loop = loop
+            self._async_pool_lock = asyncio.Lock()
+        assert self._async_pool_lock is not None
+        async with self._async_pool_lock:
+            if self._async_pool is None:
+                self._async_pool = await aiomysql.create_pool(
+                    host=online_store_config.host or "127.0.0.1",
+                    user=online_store_config.user or "test",
+                    password=online_store_config.password or "test",
+                    db=online_store_config.database or "feast",
+                    port=online_store_config.port or 3306,
+                    maxsize=online_store_config.pool_size,
+                    pool_recycle=online_store_config.pool_max_lifetime_seconds or -1,
+                    autocommit=True,
+                )
+        return self._async_pool
+
+    def _close_async_pool(self) -> None:
+        pool, self._async_pool = self._async_pool, None
+        if pool is None:
+            return
+
+        async def close() -> None:
+            pool.close()
+            await pool.wait_closed()
+
+        assert self._async_pool_loop is not None
+        _close_on_loop(self._async_pool_loop, close)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        with self._pools_lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.close()
+        self._close_async_pool()
 
     def _execute_query_with_retry(self, cur: Cursor,
                                         conn: Connection,
                                         query: str,
                                         values: Union[List, Tuple],
                                         retries: int,
-                                        progress=None
+                                        progress=None,
+                                        commit: bool = True,
     ) -> bool:
         for _ in range(retries):
             try:
                 cur.execute(query, values)
-                conn.commit()
+                if commit:
+                    conn.commit()
                 if progress:
                     progress(1)
                 return True
@@ -145,39 +274,48 @@ class MySQLOnlineStore(OnlineStore):
             ],
             progress: Optional[Callable[[int], Any]],
     ) -> None:
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
-            project = config.project
-
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=2,
-                ).hex()
-                timestamp = _to_naive_utc(timestamp)
-                if created_ts is not None:
-                    created_ts = _to_naive_utc(created_ts)
-
-                rows_to_insert = [(entity_key_bin, feature_name, val.SerializeToString(), timestamp, created_ts)
-                                  for feature_name, val in values.items()]
-                value_formatters = ', '.join(['(%s, %s, %s, %s, %s)'] * len(rows_to_insert))
-                query = f"""
-                        INSERT INTO {_table_id(project, table)}
-                        (entity_key, feature_name, value, event_ts, created_ts)
-                        VALUES {value_formatters}
-                        ON DUPLICATE KEY UPDATE 
-                        value = VALUES(value),
-                        event_ts = VALUES(event_ts),
-                        created_ts = VALUES(created_ts)
-                        """
-                query_values = [item for row in rows_to_insert for item in row]
-                self._execute_query_with_retry(cur=cur,
-                                               conn=conn,
-                                               query=query,
-                                               values=query_values,
-                                               retries=MYSQL_WRITE_RETRIES)
-        self._close_conn(raw_conn, conn_type)
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+        self._upsert(
+            config,
+            table,
+            data,
+            progress,
+            max_rows=online_store_config.write_batch_max_rows,
+            max_bytes=online_store_config.write_batch_max_bytes,
+        )
+
+    def _upsert(
+            self,
+            config: RepoConfig,
+            table: FeatureView,
+            data: List[
+                Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+            ],
+            progress: Optional[Callable[[int], Any]],
+            max_rows: int,
+            max_bytes: int,
+    ) -> None:
+        """
+        Coalesces the rows of many entities into multi-row upserts of at most `max_rows` rows and roughly
+        `max_bytes` bytes. Each upsert is committed on its own, retried on deadlock and reported to
+        `progress` with the number of entities it contains.
+        """
+        wide = _is_wide(config)
+        table_name = _table_id(config.project, table, wide)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            for rows, num_entities in _chunk_rows_to_upsert(data, max_rows, max_bytes, wide):
+                query = _build_upsert_query(table_name, len(rows), wide)
+                query_values = [item for row in rows for item in row]
+                if self._execute_query_with_retry(cur=cur,
+                                                  conn=conn,
+                                                  query=query,
+                                                  values=query_values,
+                                                  retries=MYSQL_WRITE_RETRIES):
+                    if progress:
+                        progress(num_entities)
+                else:
+                    logger.error(f'Skipping write of {num_entities} entities to table {table_name}')
 
     def online_write_batch_occ(
             self,
@@ -189,23 +327,18 @@ class MySQLOnlineStore(OnlineStore):
             progress: Optional[Callable[[int], Any]],
     ) -> None:
         logger.info("Using the OCC write function in mysql store")
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
-            project = config.project
-
+        wide = _is_wide(config)
+        table_name = _table_id(config.project, table, wide)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
             for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=2,
-                ).hex()
+                entity_key_bin = _entity_key_bin(entity_key, wide)
                 timestamp = _to_naive_utc(timestamp)
                 if created_ts is not None:
                     created_ts = _to_naive_utc(created_ts)
 
                 for i in range(MYSQL_WRITE_RETRIES):
                     try:
-                        select_query = f"SELECT version FROM {_table_id(project, table)} WHERE entity_key = %s"
+                        select_query = f"SELECT version FROM {table_name} WHERE entity_key = %s"
                         cur.execute(select_query, (entity_key_bin,))
                         result = cur.fetchone()
 
@@ -214,30 +347,14 @@ class MySQLOnlineStore(OnlineStore):
                         else:
                             current_version = -1
 
-                        updated_version = current_version + 1
-                        rows_to_insert = [
-                            (entity_key_bin, feature_name, val.SerializeToString(), timestamp, created_ts,
-                             updated_version)
-                            for feature_name, val in values.items()]
-                        value_formatters = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(rows_to_insert))
-                        query = f"""
-                              INSERT INTO {_table_id(project, table)}
-                              (entity_key, feature_name, value, event_ts, created_ts, version)
-                              VALUES {value_formatters}
-                              ON DUPLICATE KEY UPDATE
-                              value = IF(version = %s, VALUES(value), value),
-                              event_ts = IF(version = %s, VALUES(event_ts), event_ts),
-                              created_ts = IF(version = %s, VALUES(created_ts), created_ts),
-                              version = IF(version = %s, VALUES(version), version)
-                              """
-                        query_values = [item for row in rows_to_insert for item in row] + [current_version] * 4
-
+                        query, query_values = _build_occ_upsert_query(
+                            table_name, entity_key_bin, values, timestamp, created_ts, current_version, wide
+                        )
                         cur.execute(query, query_values)
                         affected_rows = cur.rowcount
                         if affected_rows > 0:
                             conn.commit()
-                            self._close_conn(raw_conn, conn_type)
-                            return
+                            break
                         else:
                             logger.warning(f"0 rows updated potentially due to version conflict. Try {i}.")
                             conn.rollback()
@@ -263,79 +380,82 @@ class MySQLOnlineStore(OnlineStore):
             ],
             batch_size: int = 10000
     ) -> None:
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-
-        with conn.cursor() as cur:
-            project = config.project
-            for i in range(0, len(data), batch_size):
-                print(f'Inserting batch {batch} of {batch_size}....')
-                start = time.time()
-                batch = data[i:i + batch_size]
-                rows_to_insert = []
-                for entity_key, values, timestamp, created_ts in batch:
-                    entity_key_bin = serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=2,
-                    ).hex()
-                    timestamp = _to_naive_utc(timestamp)
-                    if created_ts is not None:
-                        created_ts = _to_naive_utc(created_ts)
-
-                    rows_to_insert += [(entity_key_bin, feature_name, val.SerializeToString(), timestamp, created_ts)
-                                      for feature_name, val in values.items()]
-                value_formatters = ', '.join(['(%s, %s, %s, %s, %s)'] * len(rows_to_insert))
-                query = f"""
-                        INSERT INTO {_table_id(project, table)}
-                        (entity_key, feature_name, value, event_ts, created_ts)
-                        VALUES {value_formatters}
-                        """
-                cur.execute(query)
-                conn.commit()
-                end = time.time()
-                print(f'batch elapsed time: {end - start}')
+        """Upserts `data` in statements of at most `batch_size` rows, ignoring the configured row budget."""
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+        self._upsert(
+            config,
+            table,
+            data,
+            progress=None,
+            max_rows=batch_size,
+            max_bytes=online_store_config.write_batch_max_bytes,
+        )
 
     def online_read(
             self,
             config: RepoConfig,
             table: FeatureView,
             entity_keys: List[EntityKeyProto],
-            _: Optional[List[str]] = None,
+            requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        raw_conn, conn_type = self._get_conn(config, readonly=True)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
-            result: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
-            project = config.project
-            for entity_key in entity_keys:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=2,
-                ).hex()
-                query = f"SELECT feature_name, value, event_ts FROM {_table_id(project, table)} WHERE entity_key = %s"
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+
+        wide = _is_wide(config)
+        table_name = _table_id(config.project, table, wide)
+        entity_key_bins = [_entity_key_bin(entity_key, wide) for entity_key in entity_keys]
+        unique_key_bins = list(dict.fromkeys(entity_key_bins))
+
+        rows_by_key: Dict[Union[str, bytes], Tuple[Optional[datetime], Dict[str, ValueProto]]] = {}
+        with self._get_conn(config, readonly=True) as conn, conn.cursor() as cur:
+            for chunk in _chunks(unique_key_bins, online_store_config.read_batch_size):
+                query, values = _build_read_query(table_name, chunk, requested_features, wide=wide)
                 if self._execute_query_with_retry(cur=cur,
                                                   conn=conn,
                                                   query=query,
-                                                  values=(entity_key_bin,),
-                                                  retries=MYSQL_READ_RETRIES):
-                    res = {}
-                    res_ts: Optional[datetime] = None
-                    records = cur.fetchall()
-                    if records:
-                        for feature_name, val_bin, ts in records:
-                            val = ValueProto()
-                            val.ParseFromString(val_bin)
-                            res[feature_name] = val
-                            res_ts = ts
-
-                    if not res:
-                        result.append((None, None))
-                    else:
-                        result.append((res_ts, res))
+                                                  values=values,
+                                                  retries=MYSQL_READ_RETRIES,
+                                                  commit=False):
+                    _collect_rows(cur.fetchall(), rows_by_key, wide, requested_features)
                 else:
-                    logger.error(f'Skipping read for (entity, table)): ({entity_key}, {_table_id(project, table)})')
-        self._close_conn(raw_conn, conn_type)
-        return result
+                    logger.error(f'Skipping read for {len(chunk)} entities in table {table_name}')
+
+        return [rows_by_key.get(entity_key_bin, (None, None)) for entity_key_bin in entity_key_bins]
+
+    async def online_read_async(
+            self,
+            config: RepoConfig,
+            table: FeatureView,
+            entity_keys: List[EntityKeyProto],
+            requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+
+        if aiomysql is None or online_store_config.session_manager_module:
+            # Sessions are created by a synchronous SQLAlchemy session manager, so read in a worker thread.
+            return await super().online_read_async(config, table, entity_keys, requested_features)
+
+        wide = _is_wide(config)
+        table_name = _table_id(config.project, table, wide)
+        entity_key_bins = [_entity_key_bin(entity_key, wide) for entity_key in entity_keys]
+        unique_key_bins = list(dict.fromkeys(entity_key_bins))
+
+        rows_by_key: Dict[Union[str, bytes], Tuple[Optional[datetime], Dict[str, ValueProto]]] = {}
+        pool = await self._get_async_pool(online_store_config)
+        async with pool.acquire() as conn, conn.cursor() as cur:
+            for chunk in _chunks(unique_key_bins, online_store_config.read_batch_size):
+                query, values = _build_read_query(table_name, chunk, requested_features, wide=wide)
+                try:
+                    await cur.execute(query, values)
+                except pymysql.Error as e:
+                    logger.error("Error %d: %s" % (e.args[0], e.args[1]))
+                    logger.error(f'Skipping read for {len(chunk)} entities in table {table_name}')
+                    continue
+                _collect_rows(await cur.fetchall(), rows_by_key, wide, requested_features)
+
+        return [rows_by_key.get(entity_key_bin, (None, None)) for entity_key_bin in entity_key_bins]
 
     def online_delete(
         self,
@@ -343,18 +463,14 @@ class MySQLOnlineStore(OnlineStore):
         table: FeatureView,
         entity_keys: List[EntityKeyProto],
     ) -> bool:
-        raw_conn, conn_type = self._get_conn(config, readonly=True)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
         corresponding_records_deleted = True
 
-        with conn.cursor() as cur:
-            project = config.project
+        wide = _is_wide(config)
+        table_name = _table_id(config.project, table, wide)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
             for entity_key in entity_keys:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=2,
-                ).hex()
-                query = f"DELETE FROM {_table_id(project, table)} WHERE entity_key = %s"
+                entity_key_bin = _entity_key_bin(entity_key, wide)
+                query = f"DELETE FROM {table_name} WHERE entity_key = %s"
                 query_executed = self._execute_query_with_retry(
                     cur=cur,
                     conn=conn,
@@ -364,63 +480,136 @@ class MySQLOnlineStore(OnlineStore):
 
                 if not query_executed:
                     corresponding_records_deleted = False
-                    logger.error(f'Skipping delete for (entity, table)): ({entity_key}, {_table_id(project, table)})')
-        self._close_conn(raw_conn, conn_type)
+                    logger.error(f'Skipping delete for (entity, table)): ({entity_key}, {table_name})')
         return corresponding_records_deleted
 
     def online_read_many(self,
             config: RepoConfig,
             table_list: List[FeatureView],
             entity_keys_list: List[List[EntityKeyProto]],
-            _: Optional[List[Optional[List[str]]]] = None,
+            requested_features_list: Optional[List[Optional[List[str]]]] = None,
     ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
-        output = []
-        raw_conn, conn_type = self._get_conn(config, readonly=True)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        queries = []
-        with conn.cursor() as cur:
-            project = config.project
-            entity_key_bins = []
-            for i, (table, entity_keys) in enumerate(zip(table_list, entity_keys_list)):
-                for entity_key in entity_keys:
-                    entity_key_bins.append(serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=2,
-                    ).hex())
-                    query = f"SELECT feature_name, value, event_ts, {i} as __i__ FROM {_table_id(project, table)} WHERE entity_key = %s"
+        """
+        Reads several feature views at once. The `IN`-list lookups of all feature views are combined with
+        `UNION ALL`, so that up to `read_many_max_keys` entity keys are fetched in a single round trip.
+
+        Returns:
+            One list per feature view, each aligned with the corresponding list of entity keys.
+        """
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+
+        project = config.project
+        wide = _is_wide(config)
+        if requested_features_list is None:
+            requested_features_list = [None] * len(table_list)
+
+        entity_key_bins_list = [
+            [_entity_key_bin(entity_key, wide) for entity_key in entity_keys]
+            for entity_keys in entity_keys_list
+        ]
+
+        # (feature view index, keys) lookups, each of which becomes one sub-select of a union.
+        lookups = [
+            (i, chunk)
+            for i, entity_key_bins in enumerate(entity_key_bins_list)
+            for chunk in _chunks(list(dict.fromkeys(entity_key_bins)), online_store_config.read_batch_size)
+        ]
+
+        rows_by_table: List[Dict[Union[str, bytes], Tuple[Optional[datetime], Dict[str, ValueProto]]]] = [
+            {} for _ in table_list
+        ]
+        with self._get_conn(config, readonly=True) as conn, conn.cursor() as cur:
+            for statement_lookups in _group_lookups(lookups, online_store_config.read_many_max_keys):
+                queries = []
+                values: List[Union[str, bytes]] = []
+                for i, chunk in statement_lookups:
+                    query, query_values = _build_read_query(
+                        _table_id(project, table_list[i], wide), chunk, requested_features_list[i], tag=i, wide=wide
+                    )
                     queries.append(query)
-            union_query = f"{' UNION ALL '.join(queries)}"
-            if self._execute_query_with_retry(cur=cur,
-                                            conn=conn,
-                                            query=union_query,
-                                            values=entity_key_bins,
-                                            retries=MYSQL_READ_RETRIES):
-                res = {}
-                res_ts: Optional[datetime] = None
-                all_records = cur.fetchall()
-                sorted_records = {i:[] for i in range(len(table_list))}
-                for feature_name, val_bin, ts, i in all_records:
-                    sorted_records[i].append((feature_name, val_bin, ts))
-                for i in range(len(table_list)):
-                    result: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
-                    records = sorted_records[i]
-                    if records:
-                        for feature_name, val_bin, ts in records:
-                            val = ValueProto()
-                            val.ParseFromString(val_bin)
-                            res[feature_name] = val
-                            res_ts = ts
-
-                    if not res:
-                        result.append((None, None))
-                    else:
-                        result.append((res_ts, res))
-                    output.append(result)
-            else:
-                for table, entity_keys in zip(table_list, entity_keys_list):
-                    logger.error(f'Skipping read for (table, entities): ({_table_id(project, table)}, {entity_keys})')
-        self._close_conn(raw_conn, conn_type)
-        return output
+                    values += query_values
+
+                if self._execute_query_with_retry(cur=cur,
+                                                  conn=conn,
+                                                  query=' UNION ALL '.join(queries),
+                                                  values=values,
+                                                  retries=MYSQL_READ_RETRIES,
+                                                  commit=False):
+                    records_by_table: Dict[int, List[Tuple[Any, ...]]] = defaultdict(list)
+                    for *record, i in cur.fetchall():
+                        records_by_table[i].append(tuple(record))
+                    for i, records in records_by_table.items():
+                        _collect_rows(records, rows_by_table[i], wide, requested_features_list[i])
+                else:
+                    table_names = {_table_id(project, table_list[i], wide) for i, _ in statement_lookups}
+                    logger.error(f'Skipping read for (tables, entities): ({table_names}, {sum(len(c) for _, c in statement_lookups)})')
+
+        return [
+            [rows_by_table[i].get(entity_key_bin, (None, None)) for entity_key_bin in entity_key_bins]
+            for i, entity_key_bins in enumerate(entity_key_bins_list)
+        ]
+
+    def migrate_to_wide_layout(
+            self,
+            config: RepoConfig,
+            table: FeatureView,
+            batch_size: Optional[int] = None,
+            progress: Optional[Callable[[int], Any]] = None,
+    ) -> int:
+        """
+        Backfills the wide-layout table of `table` from its narrow-layout table, one page of `batch_size`
+        entity keys (default `read_batch_size`) at a time, with one commit per page. Existing wide rows
+        are overwritten, so writes should be paused while migrating and resumed after switching the
+        `table_layout` to "wide".
+
+        Returns:
+            The number of entities copied.
+        """
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, MySQLOnlineStoreConfig)
+
+        batch_size = batch_size or online_store_config.read_batch_size
+        narrow_table_name = _table_id(config.project, table)
+        wide_table_name = _table_id(config.project, table, wide=True)
+        num_entities = 0
+        last_key = ""
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            _create_wide_table(cur, wide_table_name)
+            conn.commit()
+            while True:
+                # Keyset pagination over the primary key prefix, so every page is an index range scan.
+                cur.execute(
+                    f"SELECT DISTINCT entity_key FROM {narrow_table_name} "
+                    f"WHERE entity_key > %s ORDER BY entity_key LIMIT %s",
+                    (last_key, batch_size),
+                )
+                keys = [row[0] for row in cur.fetchall()]
+                if not keys:
+                    break
+
+                query, values = _build_read_query(narrow_table_name, keys)
+                cur.execute(query, values)
+                rows_by_key: Dict[Any, Tuple[Optional[datetime], Dict[str, ValueProto]]] = {}
+                _collect_rows(cur.fetchall(), rows_by_key)
+
+                rows = [
+                    (bytes.fromhex(key), _pack_wide_row(features, ts if ts is not None else _EPOCH))
+                    for key, (ts, features) in rows_by_key.items()
+                ]
+                if not self._execute_query_with_retry(cur=cur,
+                                                      conn=conn,
+                                                      query=_build_upsert_query(wide_table_name, len(rows), wide=True),
+                                                      values=[item for row in rows for item in row],
+                                                      retries=MYSQL_WRITE_RETRIES):
+                    raise RuntimeError(
+                        f"Failed to migrate entities after {last_key!r} from {narrow_table_name} to {wide_table_name}"
+                    )
+                num_entities += len(rows)
+                last_key = keys[-1]
+                if progress:
+                    progress(len(rows))
+        return num_entities
 
     def update(
             self,
@@ -431,12 +620,20 @@ class MySQLOnlineStore(OnlineStore):
             entities_to_keep: Sequence[Entity],
             partial: bool,
     ) -> None:
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
+        wide = _is_wide(config)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
             project = config.project
             # We don't create any special state for the entities in this implementation.
             for table in tables_to_keep:
+                if wide:
+                    try:
+                        _create_wide_table(cur, _table_id(project, table, wide=True))
+                        conn.commit()
+                    except pymysql.Error as e:
+                        conn.rollback()
+                        logger.error("Error %d: %s" % (e.args[0], e.args[1]))
+                    continue
+
                 try:
                     cur.execute(
                         f"""CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key VARCHAR(512),
@@ -467,22 +664,19 @@ class MySQLOnlineStore(OnlineStore):
 
             for table in tables_to_delete:
                 try:
-                    _drop_table_and_index(cur, project, table)
+                    _drop_table_and_index(cur, project, table, wide)
                     conn.commit()
                 except pymysql.Error as e:
                     conn.rollback()
                     logger.error("Error %d: %s" % (e.args[0], e.args[1]))
-        self._close_conn(raw_conn, conn_type)
 
     def clear_table(
             self,
             config: RepoConfig,
             table: FeatureView
     ) -> None:
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
-            table_name = _table_id(config.project, table)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            table_name = _table_id(config.project, table, _is_wide(config))
             try:
                 cur.execute(f"DELETE FROM {table_name};")
                 conn.commit()
@@ -490,7 +684,6 @@ class MySQLOnlineStore(OnlineStore):
                 conn.rollback()
                 logger.error("Error %d: %s"
                               "" % (e.args[0], e.args[1]))
-        self._close_conn(raw_conn, conn_type)
 
     def teardown(
             self,
@@ -498,29 +691,276 @@ class MySQLOnlineStore(OnlineStore):
             tables: Sequence[FeatureView],
             entities: Sequence[Entity],
     ) -> None:
-        raw_conn, conn_type = self._get_conn(config)
-        conn = raw_conn.connection if conn_type == ConnectionType.SESSION else raw_conn
-        with conn.cursor() as cur:
+        wide = _is_wide(config)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
             project = config.project
             for table in tables:
                 try:
-                    _drop_table_and_index(cur, project, table)
+                    _drop_table_and_index(cur, project, table, wide)
                     conn.commit()
                 except pymysql.Error as e:
                     conn.rollback()
                     logger.error("Error %d: %s"
                                   "" % (e.args[0], e.args[1]))
-        self._close_conn(raw_conn, conn_type)
 
 
-def _drop_table_and_index(cur: Cursor, project: str, table: FeatureView) -> None:
-    table_name = _table_id(project, table)
-    cur.execute(f"DROP INDEX {table_name}_ek ON {table_name};")
+def _create_wide_table(cur: Cursor, table_name: str) -> None:
+    cur.execute(
+        f"""CREATE TABLE IF NOT EXISTS {table_name} (entity_key VARBINARY(512) NOT NULL,
+        value MEDIUMBLOB,
+        version BIGINT NOT NULL DEFAULT 0,
+        PRIMARY KEY(entity_key))"""
+    )
+
+
+def _drop_table_and_index(cur: Cursor, project: str, table: FeatureView, wide: bool = False) -> None:
+    table_name = _table_id(project, table, wide)
+    if not wide:
+        cur.execute(f"DROP INDEX {table_name}_ek ON {table_name};")
     cur.execute(f"DROP TABLE IF EXISTS {table_name}")
 
 
-def _table_id(project: str, table: FeatureView) -> str:
-    return f"{project}_{table.name}"
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _chunk_rows_to_upsert(
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        max_rows: int,
+        max_bytes: int,
+        wide: bool = False,
+) -> Iterator[Tuple[List[Tuple[Any, ...]], int]]:
+    """
+    Yields (rows, number of entities) chunks within the row and byte budgets. The rows of one entity are
+    never split across chunks, so every entity is written atomically.
+    """
+    rows: List[Tuple[Any, ...]] = []
+    num_bytes = 0
+    num_entities = 0
+    for entity_key, values, timestamp, created_ts in data:
+        entity_key_bin = _entity_key_bin(entity_key, wide)
+        timestamp = _to_naive_utc(timestamp)
+        if created_ts is not None:
+            created_ts = _to_naive_utc(created_ts)
+
+        entity_rows: List[Tuple[Any, ...]]
+        if wide:
+            entity_rows = [(entity_key_bin, _pack_wide_row(values, timestamp))]
+        else:
+            entity_rows = [(entity_key_bin, feature_name, val.SerializeToString(), timestamp, created_ts)
+                           for feature_name, val in values.items()]
+        # Binary values are escaped in the statement, so count them twice to stay on the safe side.
+        entity_bytes = sum(
+            2 * sum(len(field) for field in row if isinstance(field, (str, bytes))) + _UPSERT_ROW_OVERHEAD_BYTES
+            for row in entity_rows
+        )
+        if rows and (len(rows) + len(entity_rows) > max_rows or num_bytes + entity_bytes > max_bytes):
+            yield rows, num_entities
+            rows, num_bytes, num_entities = [], 0, 0
+
+        rows.extend(entity_rows)
+        num_bytes += entity_bytes
+        num_entities += 1
+
+    if rows:
+        yield rows, num_entities
+
+
+def _build_upsert_query(table_name: str, num_rows: int, wide: bool = False) -> str:
+    if wide:
+        # Bumping the version makes concurrent OCC writers of the same entity retry.
+        return f"""
+                INSERT INTO {table_name}
+                (entity_key, value)
+                VALUES {', '.join(['(%s, %s)'] * num_rows)}
+                ON DUPLICATE KEY UPDATE
+                value = VALUES(value),
+                version = version + 1
+                """
+    return f"""
+            INSERT INTO {table_name}
+            (entity_key, feature_name, value, event_ts, created_ts)
+            VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * num_rows)}
+            ON DUPLICATE KEY UPDATE
+            value = VALUES(value),
+            event_ts = VALUES(event_ts),
+            created_ts = VALUES(created_ts)
+            """
+
+
+def _build_occ_upsert_query(
+        table_name: str,
+        entity_key_bin: Union[str, bytes],
+        values: Dict[str, ValueProto],
+        timestamp: datetime,
+        created_ts: Optional[datetime],
+        current_version: int,
+        wide: bool = False,
+) -> Tuple[str, List[Any]]:
+    """
+    Builds an upsert of one entity that only takes effect if the stored version is still `current_version`
+    (-1 if the entity didn't exist), so that a concurrent write shows up as a statement affecting 0 rows.
+    """
+    updated_version = current_version + 1
+    if wide:
+        query = f"""
+                INSERT INTO {table_name}
+                (entity_key, value, version)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                value = IF(version = %s, VALUES(value), value),
+                version = IF(version = %s, VALUES(version), version)
+                """
+        row = [entity_key_bin, _pack_wide_row(values, timestamp), updated_version]
+        return query, row + [current_version] * 2
+
+    rows_to_insert = [
+        (entity_key_bin, feature_name, val.SerializeToString(), timestamp, created_ts, updated_version)
+        for feature_name, val in values.items()]
+    value_formatters = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(rows_to_insert))
+    query = f"""
+          INSERT INTO {table_name}
+          (entity_key, feature_name, value, event_ts, created_ts, version)
+          VALUES {value_formatters}
+          ON DUPLICATE KEY UPDATE
+          value = IF(version = %s, VALUES(value), value),
+          event_ts = IF(version = %s, VALUES(event_ts), event_ts),
+          created_ts = IF(version = %s, VALUES(created_ts), created_ts),
+          version = IF(version = %s, VALUES(version), version)
+          """
+    return query, [item for row in rows_to_insert for item in row] + [current_version] * 4
+
+
+def _group_lookups(
+        lookups: List[Tuple[int, List[Any]]],
+        max_keys: int,
+) -> Iterator[List[Tuple[int, List[Any]]]]:
+    """Groups (feature view index, keys) lookups into statements of at most `max_keys` keys each."""
+    group: List[Tuple[int, List[Any]]] = []
+    num_keys = 0
+    for i, chunk in lookups:
+        if group and num_keys + len(chunk) > max_keys:
+            yield group
+            group, num_keys = [], 0
+        group.append((i, chunk))
+        num_keys += len(chunk)
+    if group:
+        yield group
+
+
+def _build_read_query(
+        table_name: str,
+        entity_key_bins: List[Any],
+        requested_features: Optional[List[str]] = None,
+        tag: Optional[int] = None,
+        wide: bool = False,
+) -> Tuple[str, List[Any]]:
+    """
+    Builds a query that fetches the given entity keys, restricted to `requested_features` if given. A
+    `tag` is returned as an extra column so that the rows of several unioned queries can be told apart.
+    Wide rows hold all features, so `requested_features` is applied by `_collect_rows` instead.
+    """
+    tag_column = "" if tag is None else f", {int(tag)} AS __i__"
+    if wide:
+        query = (
+            f"SELECT entity_key, value{tag_column} FROM {table_name} "
+            f"WHERE entity_key IN ({', '.join(['%s'] * len(entity_key_bins))})"
+        )
+        return query, list(entity_key_bins)
+
+    query = (
+        f"SELECT entity_key, feature_name, value, event_ts{tag_column} FROM {table_name} "
+        f"WHERE entity_key IN ({', '.join(['%s'] * len(entity_key_bins))})"
+    )
+    values = list(entity_key_bins)
+    if requested_features:
+        query += f" AND feature_name IN ({', '.join(['%s'] * len(requested_features))})"
+        values += requested_features
+    return query, values
+
+
+def _collect_rows(
+        records: Sequence[Tuple[Any, ...]],
+        rows_by_key: Dict[Any, Tuple[Optional[datetime], Dict[str, ValueProto]]],
+        wide: bool = False,
+        requested_features: Optional[List[str]] = None,
+) -> None:
+    """
+    Groups (entity_key, feature_name, value, event_ts) records, or (entity_key, value) records of the wide
+    layout, into per-entity (timestamp, features) rows.
+    """
+    if wide:
+        for entity_key_bin, blob in records:
+            rows_by_key[entity_key_bin] = _unpack_wide_row(blob, requested_features)
+        return
+
+    for entity_key_bin, feature_name, val_bin, ts in records:
+        val = ValueProto()
+        val.ParseFromString(val_bin)
+        row = rows_by_key.get(entity_key_bin)
+        if row is None:
+            rows_by_key[entity_key_bin] = (ts, {feature_name: val})
+        else:
+            row[1][feature_name] = val
+            rows_by_key[entity_key_bin] = (ts, row[1])
+
+
+def _pack_wide_row(values: Dict[str, ValueProto], event_ts: datetime) -> bytes:
+    parts = [
+        _WIDE_ROW_HEADER.pack(
+            _WIDE_ROW_FORMAT_VERSION, (event_ts - _EPOCH) // timedelta(microseconds=1), len(values)
+        )
+    ]
+    for feature_name, val in values.items():
+        name_bin = feature_name.encode("utf8")
+        val_bin = val.SerializeToString()
+        parts += [_WIDE_ROW_NAME_LEN.pack(len(name_bin)), name_bin, _WIDE_ROW_VALUE_LEN.pack(len(val_bin)), val_bin]
+    return b"".join(parts)
+
+
+def _unpack_wide_row(
+        blob: bytes,
+        requested_features: Optional[List[str]] = None,
+) -> Tuple[datetime, Dict[str, ValueProto]]:
+    version, event_ts_micros, num_features = _WIDE_ROW_HEADER.unpack_from(blob, 0)
+    if version != _WIDE_ROW_FORMAT_VERSION:
+        raise ValueError(f"Unsupported MySQL wide row format version {version}")
+
+    wanted = set(requested_features) if requested_features else None
+    res: Dict[str, ValueProto] = {}
+    offset = _WIDE_ROW_HEADER.size
+    for _ in range(num_features):
+        (name_len,) = _WIDE_ROW_NAME_LEN.unpack_from(blob, offset)
+        offset += _WIDE_ROW_NAME_LEN.size
+        feature_name = blob[offset:offset + name_len].decode("utf8")
+        offset += name_len
+        (val_len,) = _WIDE_ROW_VALUE_LEN.unpack_from(blob, offset)
+        offset += _WIDE_ROW_VALUE_LEN.size
+        if wanted is None or feature_name in wanted:
+            val = ValueProto()
+            val.ParseFromString(blob[offset:offset + val_len])
+            res[feature_name] = val
+        offset += val_len
+    return _EPOCH + timedelta(microseconds=event_ts_micros), res
+
+
+def _is_wide(config: RepoConfig) -> bool:
+    return config.online_store.table_layout == "wide"
+
+
+def _entity_key_bin(entity_key: EntityKeyProto, wide: bool = False) -> Union[str, bytes]:
+    entity_key_bin = serialize_entity_key(
+        entity_key,
+        entity_key_serialization_version=2,
+    )
+    return entity_key_bin if wide else entity_key_bin.hex()
+
+
+def _table_id(project: str, table: FeatureView, wide: bool = False) -> str:
+    return f"{project}_{table.name}_wide" if wide else f"{project}_{table.name}"
 
 
 def _to_naive_utc(ts: datetime) -> datetime:
@@ -6,5 +6,7 @@ from tests.integration.feature_repos.universal.online_store.mysql import (
 )
 
 FULL_REPO_CONFIGS = [
-    IntegrationTestRepoConfig(online_store_creator=MySQLOnlineStoreCreator),
+    IntegrationTestRepoConfig(
+        online_store="mysql", online_store_creator=MySQLOnlineStoreCreator
+    ),
 ]
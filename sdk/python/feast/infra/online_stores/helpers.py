@@ -1,5 +1,7 @@
+import asyncio
 import struct
-from typing import Any, List
+import threading
+from typing import Any, Awaitable, Callable, List
 
 import mmh3
 
@@ -62,3 +64,29 @@ def compute_entity_id(
             entity_key_serialization_version=entity_key_serialization_version,
         )
     ).hex()
+
+
+def _close_on_loop(
+    loop: asyncio.AbstractEventLoop, close: Callable[[], Awaitable[Any]]
+) -> None:
+    """
+    Runs the `close` coroutine function on `loop`, the event loop that owns the connections it releases.
+    The connections of a loop that has already been closed can't be shut down gracefully, so they are left
+    to the garbage collector.
+    """
+    if loop.is_closed():
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if loop is running_loop:
+        loop.create_task(close())  # type: ignore[arg-type]
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(close(), loop)  # type: ignore[arg-type]
+    else:
+        # The loop is idle, possibly while another loop runs in this thread, so drive it from a helper thread.
+        thread = threading.Thread(target=loop.run_until_complete, args=(close(),))
+        thread.start()
+        thread.join()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
@@ -81,6 +83,39 @@ class OnlineStore(ABC):
         """
         pass
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys without blocking the event loop.
+
+        Stores with an asyncio client should override this. By default, `online_read` is run in the
+        event loop's default executor, which is what stores with thread-safe blocking clients (e.g.
+        SQLite) rely on.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.online_read, config, table, entity_keys, requested_features
+            ),
+        )
+
     @abstractmethod
     def online_delete(
         self,
@@ -110,6 +145,18 @@ class OnlineStore(ABC):
         requested_features_list: Optional[List[Optional[List[str]]]] = None,
     ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
         """
+        Reads features values for several feature views at once.
+
+        Args:
+            config: The config for the current feature store.
+            table_list: The feature views whose feature values should be read.
+            entity_keys_list: For each feature view, the list of entity keys for which feature values
+                should be read.
+            requested_features_list: For each feature view, the list of features that should be read.
+
+        Returns:
+            A list of the same length as table_list. Each item is the result `online_read` would return
+            for the corresponding feature view and list of entity keys.
         """
         pass
 
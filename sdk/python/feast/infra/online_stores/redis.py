@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -33,7 +34,12 @@ from pydantic import StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, RepoConfig, utils
-from feast.infra.online_stores.helpers import _mmh3, _redis_key, _redis_key_prefix
+from feast.infra.online_stores.helpers import (
+    _close_on_loop,
+    _mmh3,
+    _redis_key,
+    _redis_key_prefix,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -42,6 +48,7 @@ from feast.usage import log_exceptions_and_usage, tracing_span
 
 try:
     from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
     from redis.cluster import ClusterNode, RedisCluster
 except ImportError as e:
     from feast.errors import FeastExtrasDependencyImportError
@@ -82,9 +89,13 @@ class RedisOnlineStore(OnlineStore):
 
     Attributes:
         _client: Redis connection.
+        _async_client: Redis asyncio connection, used by `online_read_async`.
+        _async_client_loop: The event loop that `_async_client` is bound to.
     """
 
     _client: Optional[Union[Redis, RedisCluster]] = None
+    _async_client: Optional[AsyncRedis] = None
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def delete_entity_values(self, config: RepoConfig, join_keys: List[str]):
         client = self._get_client(config.online_store)
@@ -184,6 +195,26 @@ class RedisOnlineStore(OnlineStore):
                 self._client = Redis(**kwargs)
         return self._client
 
+    def _get_async_client(self, online_store_config: RedisOnlineStoreConfig):
+        """
+        Creates the asyncio Redis client of the running event loop. Only supported for the "redis" redis_type.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client and self._async_client_loop is not loop:
+            # The client's connections are bound to the loop that opened them, so they can't be reused here.
+            assert self._async_client_loop is not None
+            _close_on_loop(self._async_client_loop, self._async_client.close)
+            self._async_client = None
+        if not self._async_client:
+            self._async_client_loop = loop
+            startup_nodes, kwargs = self._parse_connection_string(
+                online_store_config.connection_string
+            )
+            kwargs["host"] = startup_nodes[0]["host"]
+            kwargs["port"] = startup_nodes[0]["port"]
+            self._async_client = AsyncRedis(**kwargs)
+        return self._async_client
+
     @log_exceptions_and_usage(online_store="redis")
     def online_write_batch(
         self,
@@ -266,39 +297,78 @@ class RedisOnlineStore(OnlineStore):
         assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
         client = self._get_client(online_store_config)
-        feature_view = table.name
-        project = config.project
+        keys, hset_keys, requested_features = self._prepare_read(
+            config, table, entity_keys, requested_features
+        )
+        with client.pipeline(transaction=False) as pipe:
+            for redis_key_bin in keys:
+                pipe.hmget(redis_key_bin, hset_keys)
+            with tracing_span(name="remote_call"):
+                redis_values = pipe.execute()
+        return [
+            self._get_features_for_entity(values, table.name, requested_features)
+            for values in redis_values
+        ]
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
+        if online_store_config.redis_type == RedisType.redis_cluster:
+            # The pinned redis client has no asyncio cluster support.
+            return await super().online_read_async(
+                config, table, entity_keys, requested_features
+            )
+
+        client = self._get_async_client(online_store_config)
+        keys, hset_keys, requested_features = self._prepare_read(
+            config, table, entity_keys, requested_features
+        )
+        async with client.pipeline(transaction=False) as pipe:
+            for redis_key_bin in keys:
+                pipe.hmget(redis_key_bin, hset_keys)
+            redis_values = await pipe.execute()
+        return [
+            self._get_features_for_entity(values, table.name, requested_features)
+            for values in redis_values
+        ]
+
+    def _prepare_read(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> Tuple[List[bytes], List[Union[bytes, str]], List[str]]:
+        """
+        Returns the redis keys of the entities, the hash fields to read from each of them, and the names
+        of those fields, the last of which is the event timestamp.
+        """
+        feature_view = table.name
         if not requested_features:
             requested_features = [f.name for f in table.features]
 
-        hset_keys = [_mmh3(f"{feature_view}:{k}") for k in requested_features]
-
         ts_key = f"_ts:{feature_view}"
+        hset_keys: List[Union[bytes, str]] = [
+            _mmh3(f"{feature_view}:{k}") for k in requested_features
+        ]
         hset_keys.append(ts_key)
-        requested_features.append(ts_key)
 
-        keys = []
-        for entity_key in entity_keys:
-            redis_key_bin = _redis_key(
-                project,
+        keys = [
+            _redis_key(
+                config.project,
                 entity_key,
                 entity_key_serialization_version=config.entity_key_serialization_version,
             )
-            keys.append(redis_key_bin)
-        with client.pipeline(transaction=False) as pipe:
-            for redis_key_bin in keys:
-                pipe.hmget(redis_key_bin, hset_keys)
-            with tracing_span(name="remote_call"):
-                redis_values = pipe.execute()
-        for values in redis_values:
-            features = self._get_features_for_entity(
-                values, feature_view, requested_features
-            )
-            result.append(features)
-        return result
+            for entity_key in entity_keys
+        ]
+        return keys, hset_keys, [*requested_features, ts_key]
 
     def _get_features_for_entity(
         self,
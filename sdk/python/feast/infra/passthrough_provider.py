@@ -203,6 +203,21 @@ class PassthroughProvider(Provider):
             )
         return result
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        result = []
+        if self.online_store:
+            result = await self.online_store.online_read_async(
+                config, table, entity_keys, requested_features
+            )
+        return result
+
     @log_exceptions_and_usage(sampler=RatioSampler(ratio=0.001))
     def online_delete(
         self,
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -232,6 +234,37 @@ class Provider(ABC):
         """
         pass
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys without blocking the event loop.
+
+        By default this runs `online_read` in the event loop's default executor.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.online_read, config, table, entity_keys, requested_features
+            ),
+        )
+
     @abstractmethod
     def online_delete(
         self,
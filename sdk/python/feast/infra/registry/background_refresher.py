@@ -0,0 +1,83 @@
+import logging
+import random
+import threading
+import weakref
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Refreshes are scheduled up to this fraction of the interval early, so that processes started together
+# don't all hit the registry at the same time.
+REFRESH_JITTER = 0.1
+
+# Delay before the first retry of a failed refresh, doubled on every consecutive failure up to the interval.
+RETRY_BASE_SECONDS = 1.0
+
+
+class BackgroundRefresher:
+    """
+    Calls a registry's refresh method every `interval_seconds` from a daemon thread.
+
+    The registry keeps serving its current cache while the refresh runs, and the refresh swaps the new cache
+    in once it's built. Failed refreshes are retried with exponential backoff, and the registry's
+    `cache_age_seconds` reports how stale the cache being served is meanwhile. The refresher only holds a
+    weak reference to the refresh method's owner, and stops once the owner is garbage collected.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], None],
+        interval_seconds: float,
+        age_seconds: Optional[Callable[[], Optional[float]]] = None,
+    ):
+        """
+        Args:
+            refresh: Bound method refreshing the registry cache.
+            interval_seconds: Seconds between two refreshes.
+            age_seconds: Optional bound method returning the age of the registry cache, logged on failures.
+        """
+        self.interval_seconds = interval_seconds
+        self.consecutive_failures = 0
+        self._refresh = weakref.WeakMethod(refresh)  # type: ignore
+        self._age_seconds = weakref.WeakMethod(age_seconds) if age_seconds else None  # type: ignore
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="feast_registry_refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def next_delay(self) -> float:
+        """Returns the number of seconds to wait before the next refresh."""
+        if self.consecutive_failures:
+            delay = min(
+                RETRY_BASE_SECONDS * 2 ** (self.consecutive_failures - 1),
+                self.interval_seconds,
+            )
+        else:
+            delay = self.interval_seconds
+        return delay * (1 - REFRESH_JITTER * random.random())
+
+    def _run(self):
+        while not self._stopped.wait(self.next_delay()):
+            refresh = self._refresh()
+            if refresh is None:
+                return
+            try:
+                refresh()
+                self.consecutive_failures = 0
+            except Exception:
+                self.consecutive_failures += 1
+                age_seconds = self._age_seconds() if self._age_seconds else None
+                logger.warning(
+                    "Failed to refresh the registry in the background (%s consecutive failures), "
+                    "serving a registry cache of age %s seconds.",
+                    self.consecutive_failures,
+                    None if age_seconds is None else age_seconds(),
+                    exc_info=True,
+                )
+            finally:
+                # Don't keep the registry alive while waiting.
+                del refresh
@@ -526,6 +526,58 @@ class BaseRegistry(ABC):
             List of project metadata
         """
 
+    def apply_objects(
+        self,
+        project: str,
+        objects_to_apply: List[Any],
+        objects_to_delete: Optional[List[Any]] = None,
+        commit: bool = True,
+    ):
+        """
+        Deletes and then registers several objects with Feast. Registries able to do so override this method to
+        apply all the changes at once.
+
+        Args:
+            project: Feast project that the objects belong to
+            objects_to_apply: Data sources, entities, feature views, feature services, saved datasets and
+                validation references to register
+            objects_to_delete: Data sources, entities, feature views, feature services and validation references
+                to delete, raising an exception if one isn't found
+            commit: Whether the changes should be persisted immediately
+        """
+        for obj in objects_to_delete or []:
+            if isinstance(obj, DataSource):
+                self.delete_data_source(obj.name, project, commit=False)
+            elif isinstance(obj, Entity):
+                self.delete_entity(obj.name, project, commit=False)
+            elif isinstance(obj, BaseFeatureView):
+                self.delete_feature_view(obj.name, project, commit=False)
+            elif isinstance(obj, FeatureService):
+                self.delete_feature_service(obj.name, project, commit=False)
+            elif isinstance(obj, ValidationReference):
+                self.delete_validation_reference(obj.name, project, commit=False)
+            else:
+                raise ValueError(f"Unexpected object type to delete: {type(obj)}")
+
+        for obj in objects_to_apply:
+            if isinstance(obj, DataSource):
+                self.apply_data_source(obj, project, commit=False)
+            elif isinstance(obj, Entity):
+                self.apply_entity(obj, project, commit=False)
+            elif isinstance(obj, BaseFeatureView):
+                self.apply_feature_view(obj, project, commit=False)
+            elif isinstance(obj, FeatureService):
+                self.apply_feature_service(obj, project, commit=False)
+            elif isinstance(obj, SavedDataset):
+                self.apply_saved_dataset(obj, project, commit=False)
+            elif isinstance(obj, ValidationReference):
+                self.apply_validation_reference(obj, project, commit=False)
+            else:
+                raise ValueError(f"Unexpected object type to apply: {type(obj)}")
+
+        if commit:
+            self.commit()
+
     @abstractmethod
     def update_infra(self, infra: Infra, project: str, commit: bool = True):
         """
@@ -582,6 +634,46 @@ class BaseRegistry(ABC):
     def refresh(self, project: Optional[str] = None):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
 
+    def cache_version(self, project: str) -> Optional[int]:
+        """
+        Returns a number that changes whenever reads with `allow_cache=True` may return different objects,
+        refreshing the registry cache first if it has expired. Callers may cache values derived from the
+        registry for as long as the number does not change.
+
+        Args:
+            project: Feast project whose objects will be read.
+
+        Returns:
+            The version of the registry cache, or None if the registry does not track changes, in which case
+            values derived from it must not be cached.
+        """
+        return None
+
+    def cache_age_seconds(self) -> Optional[float]:
+        """
+        Returns the number of seconds since the registry cache was last refreshed, or None if the registry has no
+        cache or it hasn't been loaded yet.
+        """
+        return None
+
+    def get_object_fingerprints(
+        self, kind: str, project: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Returns the fingerprints of the stored protos of the objects of a kind, as computed by
+        `proto_registry_utils.fingerprint`, so that registry diffs can skip objects that didn't change without
+        comparing them field by field. The fingerprints must reflect a state of the registry at least as recent as
+        the one returned by the last `list_*` call without cache.
+
+        Args:
+            kind: The kind of the objects, the name of their `RegistryProto` field, e.g. "feature_views".
+            project: Feast project that the objects belong to.
+
+        Returns:
+            The fingerprint of each object by name, or None if the registry doesn't compute fingerprints.
+        """
+        return None
+
     @staticmethod
     def _message_to_sorted_dict(message: Message) -> Dict[str, Any]:
         return json.loads(MessageToJson(message, sort_keys=True))
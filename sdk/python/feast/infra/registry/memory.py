@@ -1,6 +1,6 @@
 import copy
 from collections import defaultdict
-from typing import Optional, Dict, List, Any, TypeVar, Union
+from typing import Optional, Dict, List, Any, Tuple, TypeVar, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -21,7 +21,19 @@ from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.repo_config import RegistryConfig
 
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.proto_registry_utils import (
+    DATA_SOURCES,
+    ENTITIES,
+    FEATURE_SERVICES,
+    FEATURE_VIEWS,
+    ON_DEMAND_FEATURE_VIEWS,
+    REQUEST_FEATURE_VIEWS,
+    SAVED_DATASETS,
+    STREAM_FEATURE_VIEWS,
+    VALIDATION_REFERENCES,
+)
 
 from feast.errors import (
     ConflictingFeatureViewNames,
@@ -61,6 +73,20 @@ FeastResource = Union[
 ProjectKey = str
 RegistryDict = Dict[ProjectKey, Dict[str, T]]
 
+# Kinds of objects, in the order they are written to `RegistryProto`. Each kind is both the name of the
+# `RegistryProto` field and of the `InMemoryRegistry` attribute holding the objects.
+PROTO_KINDS = [
+    ENTITIES,
+    FEATURE_VIEWS,
+    DATA_SOURCES,
+    ON_DEMAND_FEATURE_VIEWS,
+    REQUEST_FEATURE_VIEWS,
+    STREAM_FEATURE_VIEWS,
+    FEATURE_SERVICES,
+    SAVED_DATASETS,
+    VALIDATION_REFERENCES,
+]
+
 
 class InMemoryRegistry(BaseRegistry):
     def __init__(
@@ -106,8 +132,15 @@ class InMemoryRegistry(BaseRegistry):
             self.saved_datasets,
         ] + self.feature_view_registries
 
-        # recomputing `RegistryProto` is expensive, cache unless changed
+        # recomputing `RegistryProto` is expensive, so it is cached at three levels: the protos of single objects
+        # keyed by (project, kind) and name, the `RegistryProto` fragment of each project, and the whole registry.
+        # Writes only invalidate the levels they touch, so that `proto()` re-serializes changed objects only.
         self.cached_proto: Optional[RegistryProto] = None
+        self._project_protos: Dict[ProjectKey, RegistryProto] = {}
+        self._object_protos: Dict[Tuple[ProjectKey, str], Dict[str, Any]] = defaultdict(dict)
+        self._object_fingerprints: Dict[Tuple[ProjectKey, str], Dict[str, str]] = defaultdict(dict)
+        # bumped on every write operation, see `cache_version`
+        self._cache_version = 0
 
     def enter_apply_context(self):
         self.is_feast_apply = True
@@ -119,37 +152,45 @@ class InMemoryRegistry(BaseRegistry):
         # `is_feast_apply` in that `is_built` remains True if set at least once.
         self.is_built = True
 
-    def _get_feature_view_registry(self, project: str, feature_view: BaseFeatureView) -> Dict[str, BaseFeatureView]:
-        # returns the sub-registry that aligns with `type(feature_view)`, or an exception if the type is unknown
+    def _get_feature_view_kind(self, feature_view: BaseFeatureView) -> str:
+        # returns the kind that aligns with `type(feature_view)`, or an exception if the type is unknown
         if isinstance(feature_view, StreamFeatureView):
-            return self.stream_feature_views[project]
+            return STREAM_FEATURE_VIEWS
         if isinstance(feature_view, FeatureView):
-            return self.feature_views[project]
+            return FEATURE_VIEWS
         if isinstance(feature_view, OnDemandFeatureView):
-            return self.on_demand_feature_views[project]
+            return ON_DEMAND_FEATURE_VIEWS
         if isinstance(feature_view, RequestFeatureView):
-            return self.request_feature_views[project]
+            return REQUEST_FEATURE_VIEWS
         raise FeatureViewNotFoundException(feature_view)
 
     def _maybe_init_project_metadata(self, project: str) -> None:
         # updates `usage` project uuid to match requested project
-        metadata = self.project_metadata.setdefault(project, ProjectMetadata(project_name=project))
-        usage.set_current_project_uuid(metadata.project_uuid)
-
-    def _maybe_reset_proto_registry(self) -> None:
-        # set cached proto registry to `None` if write operation is applied and registry is built
-        if self.is_built:
-            self.cached_proto = None
+        if project not in self.project_metadata:
+            self.project_metadata[project] = ProjectMetadata(project_name=project)
+            self._maybe_reset_proto_registry(project)
+        usage.set_current_project_uuid(self.project_metadata[project].project_uuid)
+
+    def _maybe_reset_proto_registry(self, project: str, kind: Optional[str] = None, name: Optional[str] = None) -> None:
+        # invalidates the cached protos a write operation to `project` affects; `kind` and `name` identify the
+        # written object, if any
+        self._cache_version += 1
+        self.cached_proto = None
+        self._project_protos.pop(project, None)
+        if kind is not None:
+            self._object_protos[(project, kind)].pop(name, None)
+            self._object_fingerprints[(project, kind)].pop(name, None)
 
     def _delete_object(
-        self, name: str, project: str, registry: Dict[str, FeastResource], on_miss_exc: Exception
+        self, name: str, project: str, kind: str, on_miss_exc: Exception
     ) -> None:
-        # deletes a key from `registry`, or `on_miss_exc` is raised if the object doesn't exist in the registry
+        # deletes an object of `kind` from the registry, or `on_miss_exc` is raised if the object doesn't exist
         self._maybe_init_project_metadata(project)
+        registry = getattr(self, kind)[project]
         if name not in registry:
             raise on_miss_exc
         del registry[name]
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, kind, name)
 
     def _get_object(
         self, name: str, project: str, registry: Dict[str, FeastResource], on_miss_exc: Exception
@@ -188,7 +229,7 @@ class InMemoryRegistry(BaseRegistry):
             raise EntityNameCollisionException(key, project)
 
         registry[key] = self._update_object_ts(entity)
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, ENTITIES, key)
 
     def delete_entity(self, name: str, project: str, commit: bool = True) -> None:
         """
@@ -202,7 +243,7 @@ class InMemoryRegistry(BaseRegistry):
         self._delete_object(
             name=name,
             project=project,
-            registry=self.entities[project],
+            kind=ENTITIES,
             on_miss_exc=EntityNotFoundException(name, project)
         )
 
@@ -254,7 +295,7 @@ class InMemoryRegistry(BaseRegistry):
         if key in registry and registry[key] != data_source:
             raise DataSourceRepeatNamesException(data_source.name)
         registry[key] = data_source
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, DATA_SOURCES, key)
 
     def delete_data_source(self, name: str, project: str, commit: bool = True) -> None:
         """
@@ -269,7 +310,7 @@ class InMemoryRegistry(BaseRegistry):
         self._delete_object(
             name=name,
             project=project,
-            registry=self.data_sources[project],
+            kind=DATA_SOURCES,
             on_miss_exc=exc
         )
 
@@ -319,7 +360,7 @@ class InMemoryRegistry(BaseRegistry):
         if key in registry and registry[key] != feature_service:
             raise FeatureServiceNameCollisionException(service_name=key, project=project)
         registry[key] = self._update_object_ts(feature_service)
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, FEATURE_SERVICES, key)
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True) -> None:
         """
@@ -334,7 +375,7 @@ class InMemoryRegistry(BaseRegistry):
         self._delete_object(
             name=name,
             project=project,
-            registry=self.feature_services[project],
+            kind=FEATURE_SERVICES,
             on_miss_exc=exc
         )
 
@@ -384,11 +425,12 @@ class InMemoryRegistry(BaseRegistry):
         self._maybe_init_project_metadata(project)
         feature_view.ensure_valid()
 
-        key, registry = feature_view.name, self._get_feature_view_registry(project, feature_view)
+        key, kind = feature_view.name, self._get_feature_view_kind(feature_view)
+        registry = getattr(self, kind)[project]
         if key in registry and registry[key] != feature_view:
             raise ConflictingFeatureViewNames(feature_view.name)
         registry[key] = self._update_object_ts(feature_view)
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, kind, key)
 
     def delete_feature_view(self, name: str, project: str, commit: bool = True) -> None:
         """
@@ -400,10 +442,11 @@ class InMemoryRegistry(BaseRegistry):
             commit: Whether the change should be persisted immediately
         """
         self._maybe_init_project_metadata(project=project)
-        for registry_dict in self.feature_view_registries:
-            if name in registry_dict[project]:
-                del registry_dict[project][name]
-                self._maybe_reset_proto_registry()
+        for kind in [STREAM_FEATURE_VIEWS, FEATURE_VIEWS, ON_DEMAND_FEATURE_VIEWS, REQUEST_FEATURE_VIEWS]:
+            registry = getattr(self, kind)[project]
+            if name in registry:
+                del registry[name]
+                self._maybe_reset_proto_registry(project, kind, name)
                 return
         raise FeatureViewNotFoundException(name=name, project=project)
 
@@ -559,12 +602,13 @@ class InMemoryRegistry(BaseRegistry):
     ) -> None:
         self._maybe_init_project_metadata(project)
         key = feature_view.name
-        for registry in [self.feature_views[project], self.stream_feature_views[project]]:
+        for kind in [FEATURE_VIEWS, STREAM_FEATURE_VIEWS]:
+            registry = getattr(self, kind)[project]
             if key in registry:
                 fv = registry[key]
                 fv.materialization_intervals.append((start_date, end_date))
                 fv.last_updated_timestamp = datetime.utcnow()
-                self._maybe_reset_proto_registry()
+                self._maybe_reset_proto_registry(project, kind, key)
                 return
         raise FeatureViewNotFoundException(feature_view.name, project)
 
@@ -587,7 +631,7 @@ class InMemoryRegistry(BaseRegistry):
         if key in registry and registry[key] != saved_dataset:
             raise SavedDatasetCollisionException(project=project, name=saved_dataset.name)
         registry[key] = self._update_object_ts(saved_dataset)
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, SAVED_DATASETS, key)
 
     def get_saved_dataset(
         self, name: str, project: str, allow_cache: bool = False
@@ -629,7 +673,7 @@ class InMemoryRegistry(BaseRegistry):
         self._delete_object(
             name=name,
             project=project,
-            registry=self.saved_datasets[project],
+            kind=SAVED_DATASETS,
             on_miss_exc=exc
         )
 
@@ -665,7 +709,7 @@ class InMemoryRegistry(BaseRegistry):
         if key in registry and registry[key] != validation_reference:
             raise DuplicateValidationReference(name=validation_reference.name, project=project)
         registry[key] = validation_reference
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project, VALIDATION_REFERENCES, key)
 
     def delete_validation_reference(self, name: str, project: str, commit: bool = True) -> None:
         """
@@ -680,7 +724,7 @@ class InMemoryRegistry(BaseRegistry):
         self._delete_object(
             name=name,
             project=project,
-            registry=self.validation_references[project],
+            kind=VALIDATION_REFERENCES,
             on_miss_exc=exc
         )
 
@@ -745,7 +789,7 @@ class InMemoryRegistry(BaseRegistry):
             commit: Whether the change should be persisted immediately
         """
         self.infra[project] = infra
-        self._maybe_reset_proto_registry()
+        self._maybe_reset_proto_registry(project)
 
     def get_infra(self, project: str, allow_cache: bool = False) -> Infra:
         """
@@ -771,43 +815,63 @@ class InMemoryRegistry(BaseRegistry):
         pass
 
     def proto(self) -> RegistryProto:
-        if self.cached_proto:
+        # the returned proto is shared with later callers until the next write, and must not be mutated
+        if self.cached_proto is not None:
             return self.cached_proto
 
         r = RegistryProto()
         for project in self.project_metadata:
-            for lister, registry_proto_field in [
-                (self.list_entities, r.entities),
-                (self.list_feature_views, r.feature_views),
-                (self.list_data_sources, r.data_sources),
-                (self.list_on_demand_feature_views, r.on_demand_feature_views),
-                (self.list_request_feature_views, r.request_feature_views),
-                (self.list_stream_feature_views, r.stream_feature_views),
-                (self.list_feature_services, r.feature_services),
-                (self.list_saved_datasets, r.saved_datasets),
-                (self.list_validation_references, r.validation_references),
-                (self.list_project_metadata, r.project_metadata),
-            ]:
-                objs: List[Any] = lister(project)
-                if objs:
-                    registry_proto_field_data = []
-                    for obj in objs:
-                        object_proto = obj.to_proto()
-                        # Overriding project when missing, this is to handle failures when the registry is cached
-                        if getattr(object_proto, 'spec', None) and object_proto.spec.project == '':
-                            object_proto.spec.project = project
-                        registry_proto_field_data.append(object_proto)
-
-                    registry_proto_field.extend(registry_proto_field_data)
-            r.infra.CopyFrom(self.get_infra(project).to_proto())
-        if self.is_built:
-            self.cached_proto = r
+            project_proto = self._project_proto(project)
+            r.MergeFrom(project_proto)
+            # `infra` isn't per project in `RegistryProto`, the last project's infra is kept
+            r.infra.CopyFrom(project_proto.infra)
+        self.cached_proto = r
         return r
 
+    def _project_proto(self, project: str) -> RegistryProto:
+        # returns the `RegistryProto` fragment holding the objects, metadata and infra of `project`
+        r = self._project_protos.get(project)
+        if r is not None:
+            return r
+
+        r = RegistryProto()
+        for kind in PROTO_KINDS:
+            objs: Dict[str, Any] = getattr(self, kind)[project]
+            object_protos = self._object_protos[(project, kind)]
+            registry_proto_field = getattr(r, kind)
+            for name, obj in objs.items():
+                object_proto = object_protos.get(name)
+                if object_proto is None:
+                    object_proto = obj.to_proto()
+                    # Overriding project when missing, this is to handle failures when the registry is cached
+                    if getattr(object_proto, 'spec', None) and object_proto.spec.project == '':
+                        object_proto.spec.project = project
+                    object_protos[name] = object_proto
+                registry_proto_field.append(object_proto)
+        r.project_metadata.append(self.project_metadata[project].to_proto())
+        r.infra.CopyFrom(self.get_infra(project).to_proto())
+        self._project_protos[project] = r
+        return r
+
+    def get_object_fingerprints(self, kind: str, project: str) -> Optional[Dict[str, str]]:
+        # computed from the object protos cached by `_project_proto`, and invalidated along with them
+        if project not in self.project_metadata:
+            return {}
+        self._project_proto(project)
+        fingerprints = self._object_fingerprints[(project, kind)]
+        for name, object_proto in self._object_protos[(project, kind)].items():
+            if name not in fingerprints:
+                fingerprints[name] = proto_registry_utils.fingerprint(object_proto)
+        return dict(fingerprints)
+
     def commit(self) -> None:
         # This is a noop because transactions are not supported
         pass
 
+    def cache_version(self, project: str) -> Optional[int]:
+        # objects are always served from memory, so the version only changes on writes
+        return self._cache_version
+
     def refresh(self, project: Optional[str] = None) -> None:
         self.proto()
         if project:
@@ -1,4 +1,6 @@
-from typing import List
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from feast.data_source import DataSource
 from feast.entity import Entity
@@ -21,192 +23,368 @@ from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
 
+class RegistryIndex:
+    """
+    The objects of a registry proto, deserialized and indexed by kind, project and name.
+
+    Objects of a given kind and project are deserialized on first access, after which gets are dict lookups
+    and lists reuse the same objects. The index must be discarded whenever the registry proto it was built
+    from changes. Objects are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, registry_proto: RegistryProto):
+        self.registry_proto = registry_proto
+        self._objects: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._fingerprints: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, project: str, name: str) -> Optional[Any]:
+        return self._get_objects(kind, project).get(name)
+
+    def list(self, kind: str, project: str) -> List[Any]:
+        return list(self._get_objects(kind, project).values())
+
+    def fingerprints(self, kind: str, project: str) -> Dict[str, str]:
+        """Returns the fingerprint of each object of the given kind and project by name, computed once per index."""
+        fingerprints = self._fingerprints.get((kind, project))
+        if fingerprints is None:
+            repeated_field, get_project, get_name, _ = _KINDS[kind]
+            fingerprints = {}
+            for object_proto in getattr(self.registry_proto, repeated_field):
+                if get_project(object_proto) == project:
+                    fingerprints.setdefault(
+                        get_name(object_proto), fingerprint(object_proto)
+                    )
+            self._fingerprints[(kind, project)] = fingerprints
+        return fingerprints
+
+    def with_changes(
+        self,
+        registry_proto: RegistryProto,
+        changes: Dict[Tuple[str, str, str], Optional[Any]],
+    ) -> "RegistryIndex":
+        """
+        Returns an index of `registry_proto`, which must be this index's registry proto with `changes` applied.
+        Objects that did not change are shared with this index.
+
+        Args:
+            registry_proto: The updated registry proto.
+            changes: Maps the (kind, project, name) of every changed object to its new proto, or to None if the
+                object was deleted.
+        """
+        index = RegistryIndex(registry_proto)
+        with self._lock:
+            index._objects = dict(self._objects)
+        copied = set()
+        for (kind, project, name), object_proto in changes.items():
+            objects = index._objects.get((kind, project))
+            if objects is None:
+                # Not deserialized yet, it will be built from the updated registry proto on first access.
+                continue
+            if (kind, project) not in copied:
+                objects = index._objects[(kind, project)] = dict(objects)
+                copied.add((kind, project))
+            if object_proto is None:
+                objects.pop(name, None)
+            else:
+                objects[name] = _KINDS[kind][3](object_proto)
+        return index
+
+    def _get_objects(self, kind: str, project: str) -> Dict[str, Any]:
+        objects = self._objects.get((kind, project))
+        if objects is None:
+            with self._lock:
+                objects = self._objects.get((kind, project))
+                if objects is None:
+                    objects = self._deserialize(kind, project)
+                    self._objects[(kind, project)] = objects
+        return objects
+
+    def _deserialize(self, kind: str, project: str) -> Dict[str, Any]:
+        repeated_field, get_project, get_name, from_proto = _KINDS[kind]
+        objects: Dict[str, Any] = {}
+        for object_proto in getattr(self.registry_proto, repeated_field):
+            if get_project(object_proto) == project:
+                name = get_name(object_proto)
+                # Lookups used to return the first match, keep doing so for duplicated names.
+                if name not in objects:
+                    objects[name] = from_proto(object_proto)
+        return objects
+
+
+FEATURE_SERVICES = "feature_services"
+FEATURE_VIEWS = "feature_views"
+STREAM_FEATURE_VIEWS = "stream_feature_views"
+REQUEST_FEATURE_VIEWS = "request_feature_views"
+ON_DEMAND_FEATURE_VIEWS = "on_demand_feature_views"
+DATA_SOURCES = "data_sources"
+ENTITIES = "entities"
+SAVED_DATASETS = "saved_datasets"
+VALIDATION_REFERENCES = "validation_references"
+
+
+def _spec_project(object_proto) -> str:
+    return object_proto.spec.project
+
+
+def _spec_name(object_proto) -> str:
+    return object_proto.spec.name
+
+
+def _project(object_proto) -> str:
+    return object_proto.project
+
+
+def _name(object_proto) -> str:
+    return object_proto.name
+
+
+# Kind -> (repeated field of the registry proto, project getter, name getter, deserializer).
+_KINDS: Dict[str, Tuple[str, Callable, Callable, Callable]] = {
+    FEATURE_SERVICES: (
+        "feature_services",
+        _spec_project,
+        _spec_name,
+        FeatureService.from_proto,
+    ),
+    FEATURE_VIEWS: ("feature_views", _spec_project, _spec_name, FeatureView.from_proto),
+    STREAM_FEATURE_VIEWS: (
+        "stream_feature_views",
+        _spec_project,
+        _spec_name,
+        StreamFeatureView.from_proto,
+    ),
+    REQUEST_FEATURE_VIEWS: (
+        "request_feature_views",
+        _spec_project,
+        _spec_name,
+        RequestFeatureView.from_proto,
+    ),
+    ON_DEMAND_FEATURE_VIEWS: (
+        "on_demand_feature_views",
+        _spec_project,
+        _spec_name,
+        OnDemandFeatureView.from_proto,
+    ),
+    DATA_SOURCES: ("data_sources", _project, _name, DataSource.from_proto),
+    ENTITIES: ("entities", _spec_project, _spec_name, Entity.from_proto),
+    SAVED_DATASETS: (
+        "saved_datasets",
+        _spec_project,
+        _spec_name,
+        SavedDataset.from_proto,
+    ),
+    VALIDATION_REFERENCES: (
+        "validation_references",
+        _project,
+        _name,
+        ValidationReference.from_proto,
+    ),
+}
+
+
+def iter_registry_objects(
+    registry_proto: RegistryProto,
+) -> Iterator[Tuple[str, str, str, Any]]:
+    """Yields the kind, project, name and proto of every object of `registry_proto`, in the proto's order."""
+    for kind, (repeated_field, get_project, get_name, _) in _KINDS.items():
+        for object_proto in getattr(registry_proto, repeated_field):
+            yield kind, get_project(object_proto), get_name(object_proto), object_proto
+
+
+def fingerprint(object_proto: Any) -> str:
+    """
+    Returns a hash of the fields of an object's proto that registry diffs compare: its spec, or the whole proto for
+    objects without a spec, except for the project and the data source class that registries add to stored data
+    sources. Objects with the same fingerprint have no differences.
+    """
+    if "spec" in object_proto.DESCRIPTOR.fields_by_name:
+        object_proto = object_proto.spec
+    ignored_fields = [
+        field
+        for field in ("project", "data_source_class_type")
+        if field in object_proto.DESCRIPTOR.fields_by_name
+    ]
+    if ignored_fields:
+        compared_proto = type(object_proto)()
+        compared_proto.CopyFrom(object_proto)
+        for field in ignored_fields:
+            compared_proto.ClearField(field)
+        object_proto = compared_proto
+    return hashlib.sha256(object_proto.SerializeToString(deterministic=True)).hexdigest()
+
+
+def from_proto(kind: str, object_proto: Any) -> Any:
+    """Deserializes the proto of an object of the given kind."""
+    return _KINDS[kind][3](object_proto)
+
+
+def patch_registry_proto(
+    registry_proto: RegistryProto, changes: Dict[Tuple[str, str, str], Optional[Any]]
+) -> RegistryProto:
+    """
+    Applies `changes` to `registry_proto` in place and returns it. Only the repeated fields of the changed kinds
+    are touched, so the cost is proportional to those fields rather than to the whole registry.
+
+    Args:
+        registry_proto: The registry proto to patch.
+        changes: Maps the (kind, project, name) of every changed object to its new proto, or to None if the
+            object was deleted.
+    """
+    changes_by_kind: Dict[str, Dict[Tuple[str, str], Optional[Any]]] = {}
+    for (kind, project, name), object_proto in changes.items():
+        changes_by_kind.setdefault(kind, {})[(project, name)] = object_proto
+
+    for kind, kind_changes in changes_by_kind.items():
+        repeated_field, get_project, get_name, _ = _KINDS[kind]
+        object_protos = getattr(registry_proto, repeated_field)
+        remaining = dict(kind_changes)
+        deleted = []
+        for i, object_proto in enumerate(object_protos):
+            key = (get_project(object_proto), get_name(object_proto))
+            if key not in kind_changes:
+                continue
+            new_proto = remaining.pop(key, None)
+            if new_proto is None:
+                deleted.append(i)
+            else:
+                object_proto.CopyFrom(new_proto)
+        for i in reversed(deleted):
+            del object_protos[i]
+        object_protos.extend(p for p in remaining.values() if p is not None)
+    return registry_proto
+
+
 def get_feature_service(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> FeatureService:
-    for feature_service_proto in registry_proto.feature_services:
-        if (
-            feature_service_proto.spec.project == project
-            and feature_service_proto.spec.name == name
-        ):
-            return FeatureService.from_proto(feature_service_proto)
-    raise FeatureServiceNotFoundException(name, project=project)
+    feature_service = registry_index.get(FEATURE_SERVICES, project, name)
+    if feature_service is None:
+        raise FeatureServiceNotFoundException(name, project=project)
+    return feature_service
 
 
 def get_feature_view(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> FeatureView:
-    for feature_view_proto in registry_proto.feature_views:
-        if (
-            feature_view_proto.spec.name == name
-            and feature_view_proto.spec.project == project
-        ):
-            return FeatureView.from_proto(feature_view_proto)
-    raise FeatureViewNotFoundException(name, project)
+    feature_view = registry_index.get(FEATURE_VIEWS, project, name)
+    if feature_view is None:
+        raise FeatureViewNotFoundException(name, project)
+    return feature_view
 
 
 def get_stream_feature_view(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> StreamFeatureView:
-    for feature_view_proto in registry_proto.stream_feature_views:
-        if (
-            feature_view_proto.spec.name == name
-            and feature_view_proto.spec.project == project
-        ):
-            return StreamFeatureView.from_proto(feature_view_proto)
-    raise FeatureViewNotFoundException(name, project)
+    stream_feature_view = registry_index.get(STREAM_FEATURE_VIEWS, project, name)
+    if stream_feature_view is None:
+        raise FeatureViewNotFoundException(name, project)
+    return stream_feature_view
 
 
-def get_request_feature_view(registry_proto: RegistryProto, name: str, project: str):
-    for feature_view_proto in registry_proto.feature_views:
-        if (
-            feature_view_proto.spec.name == name
-            and feature_view_proto.spec.project == project
-        ):
-            return RequestFeatureView.from_proto(feature_view_proto)
-    raise FeatureViewNotFoundException(name, project)
+def get_request_feature_view(registry_index: RegistryIndex, name: str, project: str):
+    request_feature_view = registry_index.get(REQUEST_FEATURE_VIEWS, project, name)
+    if request_feature_view is None:
+        raise FeatureViewNotFoundException(name, project)
+    return request_feature_view
 
 
 def get_on_demand_feature_view(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> OnDemandFeatureView:
-    for on_demand_feature_view in registry_proto.on_demand_feature_views:
-        if (
-            on_demand_feature_view.spec.project == project
-            and on_demand_feature_view.spec.name == name
-        ):
-            return OnDemandFeatureView.from_proto(on_demand_feature_view)
-    raise OnDemandFeatureViewNotFoundException(name, project=project)
+    on_demand_feature_view = registry_index.get(ON_DEMAND_FEATURE_VIEWS, project, name)
+    if on_demand_feature_view is None:
+        raise OnDemandFeatureViewNotFoundException(name, project=project)
+    return on_demand_feature_view
 
 
 def get_data_source(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> DataSource:
-    for data_source in registry_proto.data_sources:
-        if data_source.project == project and data_source.name == name:
-            return DataSource.from_proto(data_source)
-    raise DataSourceObjectNotFoundException(name, project=project)
+    data_source = registry_index.get(DATA_SOURCES, project, name)
+    if data_source is None:
+        raise DataSourceObjectNotFoundException(name, project=project)
+    return data_source
 
 
-def get_entity(registry_proto: RegistryProto, name: str, project: str) -> Entity:
-    for entity_proto in registry_proto.entities:
-        if entity_proto.spec.name == name and entity_proto.spec.project == project:
-            return Entity.from_proto(entity_proto)
-    raise EntityNotFoundException(name, project=project)
+def get_entity(registry_index: RegistryIndex, name: str, project: str) -> Entity:
+    entity = registry_index.get(ENTITIES, project, name)
+    if entity is None:
+        raise EntityNotFoundException(name, project=project)
+    return entity
 
 
 def get_saved_dataset(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> SavedDataset:
-    for saved_dataset in registry_proto.saved_datasets:
-        if saved_dataset.spec.name == name and saved_dataset.spec.project == project:
-            return SavedDataset.from_proto(saved_dataset)
-    raise SavedDatasetNotFound(name, project=project)
+    saved_dataset = registry_index.get(SAVED_DATASETS, project, name)
+    if saved_dataset is None:
+        raise SavedDatasetNotFound(name, project=project)
+    return saved_dataset
 
 
 def get_validation_reference(
-    registry_proto: RegistryProto, name: str, project: str
+    registry_index: RegistryIndex, name: str, project: str
 ) -> ValidationReference:
-    for validation_reference in registry_proto.validation_references:
-        if (
-            validation_reference.name == name
-            and validation_reference.project == project
-        ):
-            return ValidationReference.from_proto(validation_reference)
-    raise ValidationReferenceNotFound(name, project=project)
+    validation_reference = registry_index.get(VALIDATION_REFERENCES, project, name)
+    if validation_reference is None:
+        raise ValidationReferenceNotFound(name, project=project)
+    return validation_reference
 
 
-def list_validation_references(registry_proto: RegistryProto):
-    return registry_proto.validation_references
+def list_validation_references(registry_index: RegistryIndex):
+    return registry_index.registry_proto.validation_references
 
 
 def list_feature_services(
-    registry_proto: RegistryProto, project: str, allow_cache: bool = False
+    registry_index: RegistryIndex, project: str, allow_cache: bool = False
 ) -> List[FeatureService]:
-    feature_services = []
-    for feature_service_proto in registry_proto.feature_services:
-        if feature_service_proto.spec.project == project:
-            feature_services.append(FeatureService.from_proto(feature_service_proto))
-    return feature_services
+    return registry_index.list(FEATURE_SERVICES, project)
 
 
 def list_feature_views(
-    registry_proto: RegistryProto, project: str
+    registry_index: RegistryIndex, project: str
 ) -> List[FeatureView]:
-    feature_views: List[FeatureView] = []
-    for feature_view_proto in registry_proto.feature_views:
-        if feature_view_proto.spec.project == project:
-            feature_views.append(FeatureView.from_proto(feature_view_proto))
-    return feature_views
+    return registry_index.list(FEATURE_VIEWS, project)
 
 
 def list_request_feature_views(
-    registry_proto: RegistryProto, project: str
+    registry_index: RegistryIndex, project: str
 ) -> List[RequestFeatureView]:
-    feature_views: List[RequestFeatureView] = []
-    for request_feature_view_proto in registry_proto.request_feature_views:
-        if request_feature_view_proto.spec.project == project:
-            feature_views.append(
-                RequestFeatureView.from_proto(request_feature_view_proto)
-            )
-    return feature_views
+    return registry_index.list(REQUEST_FEATURE_VIEWS, project)
 
 
 def list_stream_feature_views(
-    registry_proto: RegistryProto, project: str
+    registry_index: RegistryIndex, project: str
 ) -> List[StreamFeatureView]:
-    stream_feature_views = []
-    for stream_feature_view in registry_proto.stream_feature_views:
-        if stream_feature_view.spec.project == project:
-            stream_feature_views.append(
-                StreamFeatureView.from_proto(stream_feature_view)
-            )
-    return stream_feature_views
+    return registry_index.list(STREAM_FEATURE_VIEWS, project)
 
 
 def list_on_demand_feature_views(
-    registry_proto: RegistryProto, project: str
+    registry_index: RegistryIndex, project: str
 ) -> List[OnDemandFeatureView]:
-    on_demand_feature_views = []
-    for on_demand_feature_view in registry_proto.on_demand_feature_views:
-        if on_demand_feature_view.spec.project == project:
-            on_demand_feature_views.append(
-                OnDemandFeatureView.from_proto(on_demand_feature_view)
-            )
-    return on_demand_feature_views
+    return registry_index.list(ON_DEMAND_FEATURE_VIEWS, project)
 
 
-def list_entities(registry_proto: RegistryProto, project: str) -> List[Entity]:
-    entities = []
-    for entity_proto in registry_proto.entities:
-        if entity_proto.spec.project == project:
-            entities.append(Entity.from_proto(entity_proto))
-    return entities
+def list_entities(registry_index: RegistryIndex, project: str) -> List[Entity]:
+    return registry_index.list(ENTITIES, project)
 
 
-def list_data_sources(registry_proto: RegistryProto, project: str) -> List[DataSource]:
-    data_sources = []
-    for data_source_proto in registry_proto.data_sources:
-        if data_source_proto.project == project:
-            data_sources.append(DataSource.from_proto(data_source_proto))
-    return data_sources
+def list_data_sources(registry_index: RegistryIndex, project: str) -> List[DataSource]:
+    return registry_index.list(DATA_SOURCES, project)
 
 
 def list_saved_datasets(
-    registry_proto: RegistryProto, project: str, allow_cache: bool = False
+    registry_index: RegistryIndex, project: str, allow_cache: bool = False
 ) -> List[SavedDataset]:
-    return [
-        SavedDataset.from_proto(saved_dataset)
-        for saved_dataset in registry_proto.saved_datasets
-        if saved_dataset.spec.project == project
-    ]
+    return registry_index.list(SAVED_DATASETS, project)
 
 
 def list_project_metadata(
-    registry_proto: RegistryProto, project: str
+    registry_index: RegistryIndex, project: str
 ) -> List[ProjectMetadata]:
     return [
         ProjectMetadata.from_proto(project_metadata)
-        for project_metadata in registry_proto.project_metadata
+        for project_metadata in registry_index.registry_proto.project_metadata
         if project_metadata.project == project
     ]
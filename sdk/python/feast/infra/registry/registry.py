@@ -40,6 +40,7 @@ from feast.feature_view import FeatureView
 from feast.importer import import_class
 from feast.infra.infra_object import Infra
 from feast.infra.registry import proto_registry_utils
+from feast.infra.registry.background_refresher import BackgroundRefresher
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry_store import NoopRegistryStore
 from feast.on_demand_feature_view import OnDemandFeatureView
@@ -84,22 +85,32 @@ class FeastObjectType(Enum):
         registry: "BaseRegistry", project: str
     ) -> Dict["FeastObjectType", List[Any]]:
         return {
-            FeastObjectType.DATA_SOURCE: registry.list_data_sources(project=project),
-            FeastObjectType.ENTITY: registry.list_entities(project=project),
-            FeastObjectType.FEATURE_VIEW: registry.list_feature_views(project=project),
-            FeastObjectType.ON_DEMAND_FEATURE_VIEW: registry.list_on_demand_feature_views(
+            object_type: object_type.get_objects_of_type_from_registry(
+                registry, project
+            )
+            for object_type in FeastObjectType
+        }
+
+    def get_objects_of_type_from_registry(
+        self, registry: "BaseRegistry", project: str
+    ) -> List[Any]:
+        if self == FeastObjectType.DATA_SOURCE:
+            return registry.list_data_sources(project=project)
+        if self == FeastObjectType.ENTITY:
+            return registry.list_entities(project=project)
+        if self == FeastObjectType.FEATURE_VIEW:
+            return registry.list_feature_views(project=project)
+        if self == FeastObjectType.ON_DEMAND_FEATURE_VIEW:
+            return registry.list_on_demand_feature_views(
                 project=project, ignore_udfs=True
-            ),
-            FeastObjectType.REQUEST_FEATURE_VIEW: registry.list_request_feature_views(
-                project=project
-            ),
-            FeastObjectType.STREAM_FEATURE_VIEW: registry.list_stream_feature_views(
+            )
+        if self == FeastObjectType.REQUEST_FEATURE_VIEW:
+            return registry.list_request_feature_views(project=project)
+        if self == FeastObjectType.STREAM_FEATURE_VIEW:
+            return registry.list_stream_feature_views(
                 project=project, ignore_udfs=True
-            ),
-            FeastObjectType.FEATURE_SERVICE: registry.list_feature_services(
-                project=project
-            ),
-        }
+            )
+        return registry.list_feature_services(project=project)
 
     @staticmethod
     def get_objects_from_repo_contents(
@@ -188,6 +199,12 @@ class Registry(BaseRegistry):
     cached_registry_proto: Optional[RegistryProto] = None
     cached_registry_proto_created: Optional[datetime] = None
     cached_registry_proto_ttl: timedelta
+    # Bumped whenever cached_registry_proto is replaced or modified, see `cache_version`.
+    _cache_version: int = 0
+    # Deserialized objects of cached_registry_proto, rebuilt lazily after every change.
+    _registry_index: Optional[proto_registry_utils.RegistryIndex] = None
+    # Set if the cache is refreshed by a background thread rather than when it expires.
+    _background_refresher: Optional[BackgroundRefresher] = None
 
     def __new__(
         cls, registry_config: Optional[RegistryConfig], repo_path: Optional[Path]
@@ -198,6 +215,10 @@ class Registry(BaseRegistry):
             from feast.infra.registry.sql import SqlRegistry
 
             return SqlRegistry(registry_config, repo_path)
+        elif registry_config and registry_config.registry_type == "snapshot":
+            from feast.infra.registry.snapshot import SnapshotRegistry
+
+            return SnapshotRegistry(registry_config, repo_path)
         else:
             return super(Registry, cls).__new__(cls)
 
@@ -229,6 +250,15 @@ class Registry(BaseRegistry):
                 if registry_config.cache_ttl_seconds is not None
                 else 0
             )
+            if (
+                registry_config.background_refresh
+                and self.cached_registry_proto_ttl.total_seconds() > 0
+            ):
+                self._background_refresher = BackgroundRefresher(
+                    self.refresh,
+                    self.cached_registry_proto_ttl.total_seconds(),
+                    self.cache_age_seconds,
+                )
 
     def clone(self) -> "Registry":
         new_registry = Registry(None, None)
@@ -297,7 +327,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_entities(registry_proto, project)
+        return proto_registry_utils.list_entities(self._get_registry_index(registry_proto), project)
 
     def list_data_sources(
         self, project: str, allow_cache: bool = False
@@ -305,7 +335,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_data_sources(registry_proto, project)
+        return proto_registry_utils.list_data_sources(self._get_registry_index(registry_proto), project)
 
     def apply_data_source(
         self, data_source: DataSource, project: str, commit: bool = True
@@ -370,7 +400,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_feature_services(registry_proto, project)
+        return proto_registry_utils.list_feature_services(self._get_registry_index(registry_proto), project)
 
     def get_feature_service(
         self, name: str, project: str, allow_cache: bool = False
@@ -378,13 +408,13 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_feature_service(registry_proto, name, project)
+        return proto_registry_utils.get_feature_service(self._get_registry_index(registry_proto), name, project)
 
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_entity(registry_proto, name, project)
+        return proto_registry_utils.get_entity(self._get_registry_index(registry_proto), name, project)
 
     def apply_feature_view(
         self, feature_view: BaseFeatureView, project: str, commit: bool = True
@@ -448,7 +478,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_stream_feature_views(registry_proto, project)
+        return proto_registry_utils.list_stream_feature_views(self._get_registry_index(registry_proto), project)
 
     def list_on_demand_feature_views(
         self, project: str, allow_cache: bool = False
@@ -457,7 +487,7 @@ class Registry(BaseRegistry):
             project=project, allow_cache=allow_cache
         )
         return proto_registry_utils.list_on_demand_feature_views(
-            registry_proto, project
+            self._get_registry_index(registry_proto), project
         )
 
     def get_on_demand_feature_view(
@@ -467,7 +497,7 @@ class Registry(BaseRegistry):
             project=project, allow_cache=allow_cache
         )
         return proto_registry_utils.get_on_demand_feature_view(
-            registry_proto, name, project
+            self._get_registry_index(registry_proto), name, project
         )
 
     def get_data_source(
@@ -476,7 +506,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_data_source(registry_proto, name, project)
+        return proto_registry_utils.get_data_source(self._get_registry_index(registry_proto), name, project)
 
     def apply_materialization(
         self,
@@ -543,12 +573,12 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_feature_views(registry_proto, project)
+        return proto_registry_utils.list_feature_views(self._get_registry_index(registry_proto), project)
 
     def get_request_feature_view(self, name: str, project: str):
         registry_proto = self._get_registry_proto(project=project, allow_cache=False)
         return proto_registry_utils.get_request_feature_view(
-            registry_proto, name, project
+            self._get_registry_index(registry_proto), name, project
         )
 
     def list_request_feature_views(
@@ -557,7 +587,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_request_feature_views(registry_proto, project)
+        return proto_registry_utils.list_request_feature_views(self._get_registry_index(registry_proto), project)
 
     def get_feature_view(
         self, name: str, project: str, allow_cache: bool = False
@@ -565,7 +595,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_feature_view(registry_proto, name, project)
+        return proto_registry_utils.get_feature_view(self._get_registry_index(registry_proto), name, project)
 
     def get_stream_feature_view(
         self, name: str, project: str, allow_cache: bool = False
@@ -574,7 +604,7 @@ class Registry(BaseRegistry):
             project=project, allow_cache=allow_cache
         )
         return proto_registry_utils.get_stream_feature_view(
-            registry_proto, name, project
+            self._get_registry_index(registry_proto), name, project
         )
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True):
@@ -702,7 +732,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_saved_dataset(registry_proto, name, project)
+        return proto_registry_utils.get_saved_dataset(self._get_registry_index(registry_proto), name, project)
 
     def list_saved_datasets(
         self, project: str, allow_cache: bool = False
@@ -710,7 +740,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_saved_datasets(registry_proto, project)
+        return proto_registry_utils.list_saved_datasets(self._get_registry_index(registry_proto), project)
 
     def apply_validation_reference(
         self,
@@ -743,7 +773,7 @@ class Registry(BaseRegistry):
             project=project, allow_cache=allow_cache
         )
         return proto_registry_utils.get_validation_reference(
-            registry_proto, name, project
+            self._get_registry_index(registry_proto), name, project
         )
 
     def list_validation_references(
@@ -752,7 +782,7 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_validation_references(registry_proto)
+        return proto_registry_utils.list_validation_references(self._get_registry_index(registry_proto))
 
     def delete_validation_reference(self, name: str, project: str, commit: bool = True):
         registry_proto = self._prepare_registry_for_changes(project)
@@ -775,19 +805,40 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_project_metadata(registry_proto, project)
+        return proto_registry_utils.list_project_metadata(self._get_registry_index(registry_proto), project)
+
+    def get_object_fingerprints(
+        self, kind: str, project: str
+    ) -> Optional[Dict[str, str]]:
+        # Read from the registry store: objects whose fingerprints match aren't listed again, so the fingerprints
+        # must reflect changes made by other clients since the registry was cached.
+        registry_proto = self._get_registry_proto(project=project, allow_cache=False)
+        return self._get_registry_index(registry_proto).fingerprints(kind, project)
 
     def commit(self):
         """Commits the state of the registry cache to the remote registry store."""
         if self.cached_registry_proto:
             self._registry_store.update_registry_proto(self.cached_registry_proto)
+        self._on_cached_registry_changed()
 
     def refresh(self, project: Optional[str] = None):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
         self._get_registry_proto(project=project, allow_cache=False)
 
+    def cache_version(self, project: str) -> Optional[int]:
+        self._get_registry_proto(project=project, allow_cache=True)
+        return self._cache_version
+
+    def cache_age_seconds(self) -> Optional[float]:
+        created = self.cached_registry_proto_created
+        if created is None:
+            return None
+        return (datetime.utcnow() - created).total_seconds()
+
     def teardown(self):
         """Tears down (removes) the registry."""
+        if self._background_refresher:
+            self._background_refresher.stop()
         self._registry_store.teardown()
 
     def proto(self) -> RegistryProto:
@@ -805,6 +856,7 @@ class Registry(BaseRegistry):
             registry_proto.registry_schema_version = REGISTRY_SCHEMA_VERSION
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = datetime.utcnow()
+            self._on_cached_registry_changed()
 
         # Initialize project metadata if needed
         assert self.cached_registry_proto
@@ -812,8 +864,23 @@ class Registry(BaseRegistry):
             _init_project_metadata(self.cached_registry_proto, project)
             self.commit()
 
+        # The caller is about to modify the cached registry proto in place.
+        self._on_cached_registry_changed()
         return self.cached_registry_proto
 
+    def _on_cached_registry_changed(self):
+        self._cache_version += 1
+        self._registry_index = None
+
+    def _get_registry_index(
+        self, registry_proto: RegistryProto
+    ) -> proto_registry_utils.RegistryIndex:
+        registry_index = self._registry_index
+        if registry_index is None or registry_index.registry_proto is not registry_proto:
+            registry_index = proto_registry_utils.RegistryIndex(registry_proto)
+            self._registry_index = registry_index
+        return registry_index
+
     def _get_registry_proto(
         self, project: Optional[str], allow_cache: bool = False
     ) -> RegistryProto:
@@ -825,6 +892,15 @@ class Registry(BaseRegistry):
 
         Returns: Returns a RegistryProto object which represents the state of the registry
         """
+        if allow_cache and self._background_refresher:
+            # The cache never expires, serve it without waiting for a refresh in progress.
+            registry_proto = self.cached_registry_proto
+            if registry_proto is not None and (
+                not project
+                or _get_project_metadata(registry_proto, project) is not None
+            ):
+                return registry_proto
+
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -856,6 +932,7 @@ class Registry(BaseRegistry):
             registry_proto = self._registry_store.get_registry_proto()
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = datetime.utcnow()
+            self._on_cached_registry_changed()
 
             if not project:
                 return registry_proto
@@ -0,0 +1,509 @@
+"""
+Registry snapshots: memory-mappable files holding every object of a registry, which
+can be looked up without loading the whole file.
+
+A snapshot file is laid out as follows, with all integers little-endian:
+
+    header: magic (8 bytes) | format version (u32) | index offset (u64)
+            | index entry count (u64)
+    data:   for every entry, its key followed by its serialized proto
+    index:  one fixed-size entry per object, sorted by key:
+            key offset (u64) | key length (u32) | proto offset (u64)
+            | proto length (u64)
+
+Keys are `project \\0 kind \\0 name`, so that the objects of a kind and project are
+contiguous in the index. Lookups binary search the index of the memory-mapped file,
+and only the objects that are read get deserialized.
+"""
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from feast.base_feature_view import BaseFeatureView
+from feast.data_source import DataSource
+from feast.entity import Entity
+from feast.errors import ReadOnlyRegistryException
+from feast.feature_service import FeatureService
+from feast.feature_view import FeatureView
+from feast.infra.infra_object import Infra
+from feast.infra.registry import proto_registry_utils
+from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.proto_registry_utils import iter_registry_objects
+from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.project_metadata import ProjectMetadata
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+from feast.protos.feast.core.FeatureService_pb2 import (
+    FeatureService as FeatureServiceProto,
+)
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
+from feast.protos.feast.core.Registry_pb2 import ProjectMetadata as ProjectMetadataProto
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+from feast.protos.feast.core.RequestFeatureView_pb2 import (
+    RequestFeatureView as RequestFeatureViewProto,
+)
+from feast.protos.feast.core.SavedDataset_pb2 import SavedDataset as SavedDatasetProto
+from feast.protos.feast.core.StreamFeatureView_pb2 import (
+    StreamFeatureView as StreamFeatureViewProto,
+)
+from feast.protos.feast.core.ValidationProfile_pb2 import (
+    ValidationReference as ValidationReferenceProto,
+)
+from feast.repo_config import RegistryConfig
+from feast.request_feature_view import RequestFeatureView
+from feast.saved_dataset import SavedDataset, ValidationReference
+from feast.stream_feature_view import StreamFeatureView
+
+SNAPSHOT_MAGIC = b"FEASTSNP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIQQ")
+_INDEX_ENTRY = struct.Struct("<QIQQ")
+
+# Kinds of the snapshot entries that aren't registry objects.
+PROJECT_METADATA = "project_metadata"
+# The registry proto without its repeated fields, under an empty project and name.
+REGISTRY_METADATA = "registry_metadata"
+
+_PROTO_CLASSES: Dict[str, Any] = {
+    proto_registry_utils.FEATURE_SERVICES: FeatureServiceProto,
+    proto_registry_utils.FEATURE_VIEWS: FeatureViewProto,
+    proto_registry_utils.STREAM_FEATURE_VIEWS: StreamFeatureViewProto,
+    proto_registry_utils.REQUEST_FEATURE_VIEWS: RequestFeatureViewProto,
+    proto_registry_utils.ON_DEMAND_FEATURE_VIEWS: OnDemandFeatureViewProto,
+    proto_registry_utils.DATA_SOURCES: DataSourceProto,
+    proto_registry_utils.ENTITIES: EntityProto,
+    proto_registry_utils.SAVED_DATASETS: SavedDatasetProto,
+    proto_registry_utils.VALIDATION_REFERENCES: ValidationReferenceProto,
+    PROJECT_METADATA: ProjectMetadataProto,
+    REGISTRY_METADATA: RegistryProto,
+}
+
+
+def _key(project: str, kind: str, name: str) -> bytes:
+    return f"{project}\0{kind}\0{name}".encode()
+
+
+def write_registry_snapshot(registry_proto: RegistryProto, path: str):
+    """
+    Writes a snapshot of `registry_proto` to `path`. The file is replaced atomically,
+    so processes that have the previous snapshot mapped keep reading it until they
+    refresh.
+    """
+    registry_metadata = RegistryProto()
+    registry_metadata.CopyFrom(registry_proto)
+    for field, _ in registry_proto.ListFields():
+        if field.label == field.LABEL_REPEATED:
+            registry_metadata.ClearField(field.name)
+
+    entries = [(_key("", REGISTRY_METADATA, ""), registry_metadata)]
+    entries.extend(
+        (
+            _key(project_metadata.project, PROJECT_METADATA, project_metadata.project),
+            project_metadata,
+        )
+        for project_metadata in registry_proto.project_metadata
+    )
+    entries.extend(
+        (_key(project, kind, name), object_proto)
+        for kind, project, name, object_proto in iter_registry_objects(registry_proto)
+    )
+    # The sort is stable: as in the registry proto, the first of several objects
+    # with the same name wins.
+    entries.sort(key=lambda entry: entry[0])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry_snapshot")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * _HEADER.size)
+            offset = _HEADER.size
+            index = []
+            previous_key = None
+            for key, object_proto in entries:
+                if key == previous_key:
+                    continue
+                previous_key = key
+                body = object_proto.SerializeToString()
+                f.write(key)
+                f.write(body)
+                index.append(
+                    _INDEX_ENTRY.pack(offset, len(key), offset + len(key), len(body))
+                )
+                offset += len(key) + len(body)
+            f.write(b"".join(index))
+            f.seek(0)
+            f.write(
+                _HEADER.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, offset, len(index)
+                )
+            )
+        # mkstemp creates the file readable by its owner only, which the replace would
+        # carry over to the snapshot.
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class RegistrySnapshot:
+    """A memory-mapped registry snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:8] != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a registry snapshot.")
+            _, version, self._index_offset, self._count = _HEADER.unpack(header)
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(
+                    f"Registry snapshot {path} has format version {version}, "
+                    f"this version of Feast reads version {SNAPSHOT_FORMAT_VERSION}."
+                )
+            if self._index_offset + self._count * _INDEX_ENTRY.size > size:
+                raise ValueError(
+                    f"Registry snapshot {path} is truncated: its index ends past the "
+                    f"end of the file ({size} bytes)."
+                )
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, kind: str, project: str, name: str) -> Optional[Any]:
+        """Returns the proto of the given object, or None if there's none."""
+        key = _key(project, kind, name)
+        i = self._lower_bound(key)
+        if i < self._count and self._key_at(i) == key:
+            return self._proto_at(kind, i)
+        return None
+
+    def list(self, kind: str, project: str) -> Iterator[Tuple[str, Any]]:
+        """Yields the name and proto of all objects of the given kind and project."""
+        prefix = _key(project, kind, "")
+        i = self._lower_bound(prefix)
+        while i < self._count:
+            key = self._key_at(i)
+            if not key.startswith(prefix):
+                return
+            yield key[len(prefix) :].decode(), self._proto_at(kind, i)
+            i += 1
+
+    def entries(self) -> Iterator[Tuple[str, Any]]:
+        """Yields the kind and proto of all entries."""
+        for i in range(self._count):
+            _, kind, _ = self._key_at(i).split(b"\0", 2)
+            yield kind.decode(), self._proto_at(kind.decode(), i)
+
+    def _entry(self, i: int) -> Tuple[int, int, int, int]:
+        return _INDEX_ENTRY.unpack_from(
+            self._mmap, self._index_offset + i * _INDEX_ENTRY.size
+        )
+
+    def _key_at(self, i: int) -> bytes:
+        key_offset, key_length, _, _ = self._entry(i)
+        return self._mmap[key_offset : key_offset + key_length]
+
+    def _proto_at(self, kind: str, i: int) -> Any:
+        _, _, proto_offset, proto_length = self._entry(i)
+        return _PROTO_CLASSES[kind].FromString(
+            self._mmap[proto_offset : proto_offset + proto_length]
+        )
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class _SnapshotIndex:
+    """
+    The objects of a snapshot, deserialized and cached as they are read. Objects are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(self, snapshot: RegistrySnapshot):
+        self.snapshot = snapshot
+        self._objects: Dict[Tuple[str, str, str], Any] = {}
+        self._lists: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, project: str, name: str) -> Optional[Any]:
+        key = (kind, project, name)
+        obj = self._objects.get(key)
+        if obj is None:
+            object_proto = self.snapshot.get(kind, project, name)
+            if object_proto is None:
+                return None
+            obj = proto_registry_utils.from_proto(kind, object_proto)
+            with self._lock:
+                obj = self._objects.setdefault(key, obj)
+        return obj
+
+    def list(self, kind: str, project: str) -> List[Any]:
+        objects = self._lists.get((kind, project))
+        if objects is None:
+            objects = [
+                self.get(kind, project, name)
+                for name, _ in self.snapshot.list(kind, project)
+            ]
+            self._lists[(kind, project)] = objects
+        return list(objects)
+
+
+class SnapshotRegistry(BaseRegistry):
+    """
+    A read-only registry served from a snapshot file, as written by
+    `feast registry snapshot`.
+
+    Opening the registry maps the file in memory without reading it, and objects are
+    only deserialized when they are first read, so startup time does not depend on
+    the size of the registry. `refresh` maps the file again, to pick up a snapshot
+    written in its place.
+    """
+
+    def __init__(
+        self, registry_config: Optional[RegistryConfig], repo_path: Optional[Path]
+    ):
+        assert (
+            registry_config is not None
+        ), "SnapshotRegistry needs a valid registry_config"
+        path = Path(registry_config.path)
+        if not path.is_absolute() and repo_path is not None:
+            path = Path(repo_path).joinpath(path)
+        self.path = str(path)
+        self._cache_version = 0
+        self._opened: Optional[datetime] = None
+        self.refresh()
+
+    def refresh(self, project: Optional[str] = None):
+        self._index = _SnapshotIndex(RegistrySnapshot(self.path))
+        self._opened = datetime.utcnow()
+        self._cache_version += 1
+
+    def cache_version(self, project: str) -> Optional[int]:
+        return self._cache_version
+
+    def cache_age_seconds(self) -> Optional[float]:
+        if self._opened is None:
+            return None
+        return (datetime.utcnow() - self._opened).total_seconds()
+
+    def enter_apply_context(self):
+        pass
+
+    def exit_apply_context(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def _read_only(self, operation: str):
+        raise ReadOnlyRegistryException(self.path, operation)
+
+    def apply_entity(self, entity: Entity, project: str, commit: bool = True):
+        self._read_only("apply_entity")
+
+    def delete_entity(self, name: str, project: str, commit: bool = True):
+        self._read_only("delete_entity")
+
+    def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
+        return proto_registry_utils.get_entity(self._index, name, project)
+
+    def list_entities(self, project: str, allow_cache: bool = False) -> List[Entity]:
+        return proto_registry_utils.list_entities(self._index, project)
+
+    def apply_data_source(
+        self, data_source: DataSource, project: str, commit: bool = True
+    ):
+        self._read_only("apply_data_source")
+
+    def delete_data_source(self, name: str, project: str, commit: bool = True):
+        self._read_only("delete_data_source")
+
+    def get_data_source(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> DataSource:
+        return proto_registry_utils.get_data_source(self._index, name, project)
+
+    def list_data_sources(
+        self, project: str, allow_cache: bool = False
+    ) -> List[DataSource]:
+        return proto_registry_utils.list_data_sources(self._index, project)
+
+    def apply_feature_service(
+        self, feature_service: FeatureService, project: str, commit: bool = True
+    ):
+        self._read_only("apply_feature_service")
+
+    def delete_feature_service(self, name: str, project: str, commit: bool = True):
+        self._read_only("delete_feature_service")
+
+    def get_feature_service(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> FeatureService:
+        return proto_registry_utils.get_feature_service(self._index, name, project)
+
+    def list_feature_services(
+        self, project: str, allow_cache: bool = False
+    ) -> List[FeatureService]:
+        return proto_registry_utils.list_feature_services(self._index, project)
+
+    def apply_feature_view(
+        self, feature_view: BaseFeatureView, project: str, commit: bool = True
+    ):
+        self._read_only("apply_feature_view")
+
+    def delete_feature_view(self, name: str, project: str, commit: bool = True):
+        self._read_only("delete_feature_view")
+
+    def get_stream_feature_view(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> StreamFeatureView:
+        return proto_registry_utils.get_stream_feature_view(self._index, name, project)
+
+    def list_stream_feature_views(
+        self, project: str, allow_cache: bool = False, ignore_udfs: bool = False
+    ) -> List[StreamFeatureView]:
+        return proto_registry_utils.list_stream_feature_views(self._index, project)
+
+    def get_on_demand_feature_view(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> OnDemandFeatureView:
+        return proto_registry_utils.get_on_demand_feature_view(
+            self._index, name, project
+        )
+
+    def list_on_demand_feature_views(
+        self, project: str, allow_cache: bool = False, ignore_udfs: bool = False
+    ) -> List[OnDemandFeatureView]:
+        return proto_registry_utils.list_on_demand_feature_views(self._index, project)
+
+    def get_feature_view(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> FeatureView:
+        return proto_registry_utils.get_feature_view(self._index, name, project)
+
+    def list_feature_views(
+        self, project: str, allow_cache: bool = False
+    ) -> List[FeatureView]:
+        return proto_registry_utils.list_feature_views(self._index, project)
+
+    def get_request_feature_view(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> RequestFeatureView:
+        return proto_registry_utils.get_request_feature_view(self._index, name, project)
+
+    def list_request_feature_views(
+        self, project: str, allow_cache: bool = False
+    ) -> List[RequestFeatureView]:
+        return proto_registry_utils.list_request_feature_views(self._index, project)
+
+    def apply_materialization(
+        self,
+        feature_view: FeatureView,
+        project: str,
+        start_date: datetime,
+        end_date: datetime,
+        commit: bool = True,
+    ):
+        self._read_only("apply_materialization")
+
+    def apply_saved_dataset(
+        self, saved_dataset: SavedDataset, project: str, commit: bool = True
+    ):
+        self._read_only("apply_saved_dataset")
+
+    def get_saved_dataset(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> SavedDataset:
+        return proto_registry_utils.get_saved_dataset(self._index, name, project)
+
+    def list_saved_datasets(
+        self, project: str, allow_cache: bool = False
+    ) -> List[SavedDataset]:
+        return proto_registry_utils.list_saved_datasets(self._index, project)
+
+    def apply_validation_reference(
+        self,
+        validation_reference: ValidationReference,
+        project: str,
+        commit: bool = True,
+    ):
+        self._read_only("apply_validation_reference")
+
+    def delete_validation_reference(self, name: str, project: str, commit: bool = True):
+        self._read_only("delete_validation_reference")
+
+    def get_validation_reference(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> ValidationReference:
+        return proto_registry_utils.get_validation_reference(self._index, name, project)
+
+    def list_validation_references(
+        self, project: str, allow_cache: bool = False
+    ) -> List[ValidationReference]:
+        return self._index.list(proto_registry_utils.VALIDATION_REFERENCES, project)
+
+    def list_project_metadata(
+        self, project: str, allow_cache: bool = False
+    ) -> List[ProjectMetadata]:
+        project_metadata = self._index.snapshot.get(PROJECT_METADATA, project, project)
+        return (
+            [ProjectMetadata.from_proto(project_metadata)] if project_metadata else []
+        )
+
+    def get_object_fingerprints(
+        self, kind: str, project: str
+    ) -> Optional[Dict[str, str]]:
+        return {
+            name: proto_registry_utils.fingerprint(object_proto)
+            for name, object_proto in self._index.snapshot.list(kind, project)
+        }
+
+    def update_infra(self, infra: Infra, project: str, commit: bool = True):
+        self._read_only("update_infra")
+
+    def get_infra(self, project: str, allow_cache: bool = False) -> Infra:
+        registry_metadata = self._index.snapshot.get(REGISTRY_METADATA, "", "")
+        return (
+            Infra.from_proto(registry_metadata.infra) if registry_metadata else Infra()
+        )
+
+    def apply_user_metadata(
+        self,
+        project: str,
+        feature_view: BaseFeatureView,
+        metadata_bytes: Optional[bytes],
+    ):
+        self._read_only("apply_user_metadata")
+
+    def get_user_metadata(
+        self, project: str, feature_view: BaseFeatureView
+    ) -> Optional[bytes]:
+        return None
+
+    def proto(self) -> RegistryProto:
+        registry_proto = RegistryProto()
+        for kind, entry_proto in self._index.snapshot.entries():
+            if kind == REGISTRY_METADATA:
+                registry_proto.MergeFrom(entry_proto)
+            else:
+                getattr(registry_proto, kind).append(entry_proto)
+        return registry_proto
@@ -1,13 +1,17 @@
+import logging
+import time
 import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from sqlalchemy import (  # type: ignore
     BigInteger,
     Column,
+    Integer,
     LargeBinary,
     MetaData,
     String,
@@ -17,9 +21,14 @@ from sqlalchemy import (  # type: ignore
     insert,
     select,
     update,
-    and_
+    and_,
+    bindparam,
+    cast,
+    func,
+    or_,
 )
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 
 from feast import usage
 from feast.base_feature_view import BaseFeatureView
@@ -37,6 +46,7 @@ from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
 from feast.infra.registry import proto_registry_utils
+from feast.infra.registry.background_refresher import BackgroundRefresher
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.project_metadata import ProjectMetadata
@@ -66,6 +76,8 @@ from feast.request_feature_view import RequestFeatureView
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
+logger = logging.getLogger(__name__)
+
 metadata = MetaData()
 
 entities = Table(
@@ -167,6 +179,11 @@ managed_infra = Table(
 class FeastMetadataKeys(Enum):
     LAST_UPDATED_TIMESTAMP = "last_updated_timestamp"
     PROJECT_UUID = "project_uuid"
+    REGISTRY_VERSION = "registry_version"
+
+
+# Project id of the metadata of the registry as a whole, rather than of a single project.
+REGISTRY_METADATA_PROJECT = ""
 
 
 feast_metadata = Table(
@@ -178,6 +195,81 @@ feast_metadata = Table(
     Column("last_updated_timestamp", BigInteger, nullable=False),
 )
 
+# Append-only log of every object written to or deleted from the tables above. A change only records which object
+# changed, readers fetch its current row, and treat a missing row as a deletion.
+registry_changes = Table(
+    "registry_changes",
+    metadata,
+    Column("change_id", Integer, primary_key=True, autoincrement=True),
+    Column("table_name", String(50), nullable=False),
+    Column("project_id", String(50), nullable=False),
+    Column("object_name", String(50), nullable=False),
+    Column("last_updated_timestamp", BigInteger, nullable=False),
+    sqlite_autoincrement=True,
+)
+
+# Fingerprint, see `proto_registry_utils.fingerprint`, of every object in the tables above, written along with the
+# object so that registry diffs can tell which objects changed without reading and parsing their protos.
+registry_fingerprints = Table(
+    "registry_fingerprints",
+    metadata,
+    Column("table_name", String(50), primary_key=True),
+    Column("project_id", String(50), primary_key=True),
+    Column("object_name", String(50), primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+)
+
+# How long changes are kept in the change log. Caches older than this are rebuilt from scratch.
+REGISTRY_CHANGES_RETENTION = timedelta(days=7)
+
+# How long a hole in the change ids is waited on before it is assumed to be a rolled back insert.
+REGISTRY_CHANGE_GAP_TIMEOUT_SECONDS = 60
+
+# Most holes in the change ids tracked at once, the cache is rebuilt from scratch past that.
+REGISTRY_CHANGE_MAX_GAPS = 1000
+
+# Change log table name -> (table, id column, proto column, proto class), for the tables holding registry objects.
+_OBJECT_TABLES: Dict[str, Tuple[Table, str, str, Any]] = {
+    table.name: (table, id_field_name, proto_field_name, proto_class)
+    for table, id_field_name, proto_field_name, proto_class in [
+        (entities, "entity_name", "entity_proto", EntityProto),
+        (data_sources, "data_source_name", "data_source_proto", DataSourceProto),
+        (feature_views, "feature_view_name", "feature_view_proto", FeatureViewProto),
+        (
+            request_feature_views,
+            "feature_view_name",
+            "feature_view_proto",
+            RequestFeatureViewProto,
+        ),
+        (
+            stream_feature_views,
+            "feature_view_name",
+            "feature_view_proto",
+            StreamFeatureViewProto,
+        ),
+        (
+            on_demand_feature_views,
+            "feature_view_name",
+            "feature_view_proto",
+            OnDemandFeatureViewProto,
+        ),
+        (
+            feature_services,
+            "feature_service_name",
+            "feature_service_proto",
+            FeatureServiceProto,
+        ),
+        (saved_datasets, "saved_dataset_name", "saved_dataset_proto", SavedDatasetProto),
+        (
+            validation_references,
+            "validation_reference_name",
+            "validation_reference_proto",
+            ValidationReferenceProto,
+        ),
+        (managed_infra, "infra_name", "infra_proto", InfraProto),
+    ]
+}
+
 
 class SqlRegistry(BaseRegistry):
     def __init__(
@@ -187,6 +279,17 @@ class SqlRegistry(BaseRegistry):
         self.engine: Engine = create_engine(registry_config.path, echo=False)
         metadata.create_all(self.engine)
         self.cached_registry_proto_created = self._cached_registry_proto = None
+        self._cache_version = 0
+        self._cached_registry_index: Optional[proto_registry_utils.RegistryIndex] = None
+        self.incremental_refresh = registry_config.incremental_refresh
+        # Last change of the change log reflected in the cached registry, and holes in the change ids below it
+        # (changes possibly not committed yet when the change log was read) mapped to when they were first seen.
+        self._last_change_id = 0
+        self._missing_change_ids: Dict[int, float] = {}
+        self.check_version = registry_config.check_version
+        # Registry version the cached registry was built at, None if unknown.
+        self._registry_version: Optional[int] = None
+        self._init_registry_version()
 
         self._refresh_lock = Lock()
         self.cached_registry_proto_ttl = timedelta(
@@ -195,6 +298,18 @@ class SqlRegistry(BaseRegistry):
             else 0
         )
         self._in_feast_apply_context = is_feast_apply
+
+        # Set if the cache is refreshed by a background thread rather than when it expires.
+        self._background_refresher: Optional[BackgroundRefresher] = None
+        if (
+            registry_config.background_refresh
+            and self.cached_registry_proto_ttl.total_seconds() > 0
+        ):
+            self._background_refresher = BackgroundRefresher(
+                self._refresh_cache,
+                self.cached_registry_proto_ttl.total_seconds(),
+                self.cache_age_seconds,
+            )
         self.refresh()
 
     def enter_apply_context(self):
@@ -204,8 +319,16 @@ class SqlRegistry(BaseRegistry):
         self._in_feast_apply_context = False
 
     def _build_cached_registry_proto(self):
+        # Read before building the proto: changes made meanwhile are then picked up again by the next refresh.
+        last_change_id = self._get_last_change_id()
+        registry_version = self._get_registry_version()
         self._cached_registry_proto = self.proto()
         self.cached_registry_proto_created = datetime.utcnow()
+        self._cache_version += 1
+        self._cached_registry_index = None
+        self._last_change_id = last_change_id
+        self._missing_change_ids = {}
+        self._registry_version = registry_version
         return self._cached_registry_proto
 
     @property
@@ -221,25 +344,54 @@ class SqlRegistry(BaseRegistry):
             return self._cached_registry_proto
         return self._build_cached_registry_proto()
 
+    @property
+    def cached_registry_index(self) -> proto_registry_utils.RegistryIndex:
+        """Deserialized objects of the cached registry, rebuilt lazily whenever the cached registry is."""
+        registry_proto = self.cached_registry_proto
+        registry_index = self._cached_registry_index
+        if registry_index is None or registry_index.registry_proto is not registry_proto:
+            registry_index = proto_registry_utils.RegistryIndex(registry_proto)
+            self._cached_registry_index = registry_index
+        return registry_index
+
     def teardown(self):
-        for t in {
-            entities,
-            data_sources,
-            feature_views,
-            feature_services,
-            on_demand_feature_views,
-            request_feature_views,
-            saved_datasets,
-            validation_references,
-        }:
-            with self.engine.connect() as conn:
-                stmt = delete(t)
-                conn.execute(stmt)
+        if self._background_refresher:
+            self._background_refresher.stop()
+        with self.engine.begin() as conn:
+            for t in {
+                entities,
+                data_sources,
+                feature_views,
+                feature_services,
+                on_demand_feature_views,
+                request_feature_views,
+                saved_datasets,
+                validation_references,
+                registry_changes,
+                registry_fingerprints,
+            }:
+                conn.execute(delete(t))
+            # Without a new version, readers that check it would keep serving their cached registry.
+            self._bump_registry_version(conn, int(datetime.utcnow().timestamp()))
 
     def refresh(self, project: Optional[str] = None):
         self._build_cached_registry_proto()
 
+    def cache_version(self, project: str) -> Optional[int]:
+        self._refresh_cached_registry_if_necessary()
+        return self._cache_version
+
+    def cache_age_seconds(self) -> Optional[float]:
+        created = self.cached_registry_proto_created
+        if created is None:
+            return None
+        return (datetime.utcnow() - created).total_seconds()
+
     def _refresh_cached_registry_if_necessary(self):
+        if self._background_refresher and self._cached_registry_proto is not None:
+            # The cache never expires, serve it without waiting for a refresh in progress.
+            return
+
         with self._refresh_lock:
             expired = (
                 self._cached_registry_proto is None
@@ -257,7 +409,251 @@ class SqlRegistry(BaseRegistry):
             )
 
             if expired:
-                self.refresh()
+                self._refresh_cache_locked()
+
+    def _refresh_cache(self):
+        with self._refresh_lock:
+            self._refresh_cache_locked()
+
+    def _refresh_cache_locked(self):
+        registry_version = self._get_registry_version() if self.check_version else None
+        if (
+            registry_version is not None
+            and registry_version == self._registry_version
+            and self._cached_registry_proto is not None
+        ):
+            # Nothing was written since the cache was built.
+            self.cached_registry_proto_created = datetime.utcnow()
+            return
+
+        if (
+            self.incremental_refresh
+            and self._cached_registry_proto is not None
+            and self._refresh_incrementally()
+        ):
+            self._registry_version = registry_version
+        else:
+            self.refresh()
+
+    def _refresh_incrementally(self) -> bool:
+        """
+        Brings the cached registry up to date by reloading only the objects changed since it was built, as recorded
+        in the change log. Returns False if the change log can't tell what changed and the cache must be rebuilt.
+        """
+        with self.engine.connect() as conn:
+            min_change_id, max_change_id = conn.execute(
+                select([func.min(registry_changes.c.change_id), func.max(registry_changes.c.change_id)])
+            ).first()
+            if max_change_id is None:
+                max_change_id = 0
+            if max_change_id < self._last_change_id:
+                # The change log was reset.
+                return False
+            if max_change_id > self._last_change_id and min_change_id > self._last_change_id + 1:
+                # Changes we haven't seen were pruned.
+                return False
+
+            condition = registry_changes.c.change_id > self._last_change_id
+            if self._missing_change_ids:
+                condition = or_(condition, registry_changes.c.change_id.in_(list(self._missing_change_ids)))
+            change_rows = conn.execute(select([registry_changes]).where(condition)).fetchall()
+
+            changed_names: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+            seen_change_ids = set()
+            for row in change_rows:
+                seen_change_ids.add(row["change_id"])
+                changed_names[(row["table_name"], row["project_id"])].add(row["object_name"])
+
+            now = time.monotonic()
+            missing_change_ids = {
+                change_id: first_seen
+                for change_id, first_seen in self._missing_change_ids.items()
+                if change_id not in seen_change_ids
+                and now - first_seen < REGISTRY_CHANGE_GAP_TIMEOUT_SECONDS
+            }
+            if max_change_id - self._last_change_id > len(seen_change_ids) + REGISTRY_CHANGE_MAX_GAPS:
+                return False
+            for change_id in range(self._last_change_id + 1, max_change_id + 1):
+                if change_id not in seen_change_ids:
+                    missing_change_ids[change_id] = now
+
+            if not changed_names:
+                self.cached_registry_proto_created = datetime.utcnow()
+                self._last_change_id = max_change_id
+                self._missing_change_ids = missing_change_ids
+                return True
+
+            changes: Dict[Tuple[str, str, str], Optional[Any]] = {}
+            infra_proto = None
+            for (table_name, project), names in changed_names.items():
+                if table_name not in _OBJECT_TABLES:
+                    return False
+                table, id_field_name, proto_field_name, proto_class = _OBJECT_TABLES[table_name]
+                stmt = select([table]).where(and_(
+                    table.c.project_id == project, getattr(table.c, id_field_name).in_(list(names))
+                ))
+                current_protos = {
+                    row[id_field_name]: proto_class.FromString(row[proto_field_name])
+                    for row in conn.execute(stmt).fetchall()
+                }
+                if table is managed_infra:
+                    infra_proto = current_protos.get("infra_obj", infra_proto)
+                    continue
+                for name in names:
+                    object_proto = current_protos.get(name)
+                    # Overriding project when missing, as `proto()` does.
+                    if getattr(object_proto, "spec", None) and object_proto.spec.project == "":
+                        object_proto.spec.project = project
+                    changes[(table_name, project, name)] = object_proto
+
+        registry_proto = proto_registry_utils.patch_registry_proto(self._cached_registry_proto, changes)
+        if infra_proto is not None:
+            registry_proto.infra.CopyFrom(infra_proto)
+        known_projects = {m.project for m in registry_proto.project_metadata}
+        for project in {project for _, project in changed_names} - known_projects:
+            registry_proto.project_metadata.extend(m.to_proto() for m in self.list_project_metadata(project))
+        last_updated_timestamps = [
+            self._get_last_updated_metadata(project) for _, project in changed_names
+        ]
+        last_updated_timestamps.append(registry_proto.last_updated.ToDatetime())
+        registry_proto.last_updated.FromDatetime(max(t for t in last_updated_timestamps if t is not None))
+
+        registry_index = self._cached_registry_index
+        if registry_index is not None and registry_index.registry_proto is self._cached_registry_proto:
+            registry_index = registry_index.with_changes(registry_proto, changes)
+        else:
+            registry_index = None
+
+        self._cached_registry_index = registry_index
+        self._cached_registry_proto = registry_proto
+        self.cached_registry_proto_created = datetime.utcnow()
+        self._cache_version += 1
+        self._last_change_id = max_change_id
+        self._missing_change_ids = missing_change_ids
+        logger.debug("Refreshed the registry cache from %s changes", len(change_rows))
+        return True
+
+    def _init_registry_version(self):
+        with self.engine.connect() as conn:
+            if self._get_registry_version(conn) is not None:
+                return
+            try:
+                conn.execute(
+                    insert(feast_metadata).values(
+                        project_id=REGISTRY_METADATA_PROJECT,
+                        metadata_key=FeastMetadataKeys.REGISTRY_VERSION.value,
+                        metadata_value="0",
+                        last_updated_timestamp=int(datetime.utcnow().timestamp()),
+                    )
+                )
+            except IntegrityError:
+                # Created concurrently by another process.
+                pass
+
+    def _get_registry_version(self, conn=None) -> Optional[int]:
+        """
+        Returns the registry version, which is incremented by every write to the registry, or None if the registry
+        was created by a Feast version that doesn't maintain it.
+        """
+        if conn is None:
+            with self.engine.connect() as conn:
+                return self._get_registry_version(conn)
+
+        registry_version = conn.execute(
+            select([feast_metadata.c.metadata_value]).where(and_(
+                feast_metadata.c.metadata_key == FeastMetadataKeys.REGISTRY_VERSION.value,
+                feast_metadata.c.project_id == REGISTRY_METADATA_PROJECT,
+            ))
+        ).scalar()
+        return None if registry_version is None else int(registry_version)
+
+    def _bump_registry_version(self, conn, update_time: int):
+        # Incremented in the database rather than read and written back, so that concurrent writes can't both
+        # write the same version.
+        conn.execute(
+            feast_metadata.update()
+            .where(and_(
+                feast_metadata.c.metadata_key == FeastMetadataKeys.REGISTRY_VERSION.value,
+                feast_metadata.c.project_id == REGISTRY_METADATA_PROJECT,
+            ))
+            .values(
+                metadata_value=cast(
+                    cast(feast_metadata.c.metadata_value, BigInteger) + 1, String(50)
+                ),
+                last_updated_timestamp=update_time,
+            )
+        )
+
+    def _get_last_change_id(self) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(select([func.max(registry_changes.c.change_id)])).scalar() or 0
+
+    def _log_change(self, conn, table: Table, project: str, name: str, update_datetime: datetime):
+        self._log_changes(conn, project, [(table, name)], update_datetime)
+
+    def _log_changes(
+        self, conn, project: str, changed_objects: List[Tuple[Table, str]], update_datetime: datetime
+    ):
+        update_time = int(update_datetime.timestamp())
+        conn.execute(
+            insert(registry_changes).values(
+                [
+                    {
+                        "table_name": table.name,
+                        "project_id": project,
+                        "object_name": name,
+                        "last_updated_timestamp": update_time,
+                    }
+                    for table, name in changed_objects
+                ]
+            )
+        )
+        conn.execute(
+            delete(registry_changes).where(
+                registry_changes.c.last_updated_timestamp
+                < update_time - int(REGISTRY_CHANGES_RETENTION.total_seconds())
+            )
+        )
+        # Bumped after the changes are written, so that readers seeing the new version also see the changes.
+        self._bump_registry_version(conn, update_time)
+
+    def _update_fingerprints(
+        self,
+        conn,
+        project: str,
+        changed_objects: List[Tuple[Table, str]],
+        object_protos: Dict[Tuple[Table, str], Any],
+    ):
+        """Replaces the fingerprints of the changed objects by those of their new protos, if they weren't deleted."""
+        names_by_table: Dict[str, List[str]] = defaultdict(list)
+        for table, name in changed_objects:
+            names_by_table[table.name].append(name)
+        conn.execute(
+            delete(registry_fingerprints).where(and_(
+                registry_fingerprints.c.project_id == project,
+                or_(*[
+                    and_(
+                        registry_fingerprints.c.table_name == table_name,
+                        registry_fingerprints.c.object_name.in_(names),
+                    )
+                    for table_name, names in names_by_table.items()
+                ]),
+            ))
+        )
+        if object_protos:
+            conn.execute(
+                insert(registry_fingerprints).values(
+                    [
+                        {
+                            "table_name": table.name,
+                            "project_id": project,
+                            "object_name": name,
+                            "fingerprint": proto_registry_utils.fingerprint(object_proto),
+                        }
+                        for (table, name), object_proto in object_protos.items()
+                    ]
+                )
+            )
 
     def get_stream_feature_view(
         self, name: str, project: str, allow_cache: bool = False
@@ -265,7 +661,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_stream_feature_view(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=stream_feature_views,
@@ -284,7 +680,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_stream_feature_views(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             stream_feature_views,
@@ -308,7 +704,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_entity(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=entities,
@@ -327,7 +723,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_feature_view(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=feature_views,
@@ -346,7 +742,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_on_demand_feature_view(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=on_demand_feature_views,
@@ -365,7 +761,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_request_feature_view(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=request_feature_views,
@@ -384,7 +780,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_feature_service(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=feature_services,
@@ -403,7 +799,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_saved_dataset(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=saved_datasets,
@@ -422,7 +818,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_validation_reference(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=validation_references,
@@ -441,7 +837,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_validation_references(
-                self.cached_registry_proto
+                self.cached_registry_index
             )
         return self._list_objects(
             table=validation_references,
@@ -455,7 +851,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_entities(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             entities, project, EntityProto, Entity, "entity_proto"
@@ -495,7 +891,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.get_data_source(
-                self.cached_registry_proto, name, project
+                self.cached_registry_index, name, project
             )
         return self._get_object(
             table=data_sources,
@@ -514,7 +910,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_data_sources(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             data_sources, project, DataSourceProto, DataSource, "data_source_proto"
@@ -556,6 +952,8 @@ class SqlRegistry(BaseRegistry):
             rows = conn.execute(stmt)
             if rows.rowcount < 1:
                 raise DataSourceObjectNotFoundException(name, project)
+            self._update_fingerprints(conn, project, [(data_sources, name)], {})
+            self._log_change(conn, data_sources, project, name, datetime.utcnow())
 
     def list_feature_services(
         self, project: str, allow_cache: bool = False
@@ -563,7 +961,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_feature_services(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             feature_services,
@@ -579,7 +977,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_feature_views(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             feature_views, project, FeatureViewProto, FeatureView, "feature_view_proto"
@@ -591,7 +989,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_saved_datasets(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             saved_datasets,
@@ -607,7 +1005,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_request_feature_views(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             request_feature_views,
@@ -623,7 +1021,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_on_demand_feature_views(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         return self._list_objects(
             on_demand_feature_views,
@@ -640,7 +1038,7 @@ class SqlRegistry(BaseRegistry):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
             return proto_registry_utils.list_project_metadata(
-                self.cached_registry_proto, project
+                self.cached_registry_index, project
             )
         with self.engine.connect() as conn:
             stmt = select([feast_metadata]).where(
@@ -657,6 +1055,40 @@ class SqlRegistry(BaseRegistry):
                 return [project_metadata]
         return []
 
+    def get_object_fingerprints(
+        self, kind: str, project: str
+    ) -> Optional[Dict[str, str]]:
+        # Read from the database, the cached registry may be older than reads without cache.
+        table, id_field_name, proto_field_name, proto_class = _OBJECT_TABLES[kind]
+        id_column = getattr(table.c, id_field_name)
+        with self.engine.connect() as conn:
+            stmt = (
+                select([id_column, registry_fingerprints.c.fingerprint])
+                .select_from(
+                    table.outerjoin(
+                        registry_fingerprints,
+                        and_(
+                            registry_fingerprints.c.table_name == table.name,
+                            registry_fingerprints.c.project_id == table.c.project_id,
+                            registry_fingerprints.c.object_name == id_column,
+                        ),
+                    )
+                )
+                .where(table.c.project_id == project)
+            )
+            fingerprints = dict(conn.execute(stmt).fetchall())
+            # Objects written before fingerprints were stored have none, theirs are computed from their protos.
+            missing_names = [name for name, fingerprint in fingerprints.items() if fingerprint is None]
+            if missing_names:
+                stmt = select([id_column, getattr(table.c, proto_field_name)]).where(
+                    and_(table.c.project_id == project, id_column.in_(missing_names))
+                )
+                for name, object_proto in conn.execute(stmt):
+                    fingerprints[name] = proto_registry_utils.fingerprint(
+                        proto_class.FromString(object_proto)
+                    )
+            return fingerprints
+
     def apply_saved_dataset(
         self,
         saved_dataset: SavedDataset,
@@ -685,6 +1117,150 @@ class SqlRegistry(BaseRegistry):
             "validation_reference_proto",
         )
 
+    def apply_objects(
+        self,
+        project: str,
+        objects_to_apply: List[Any],
+        objects_to_delete: Optional[List[Any]] = None,
+        commit: bool = True,
+    ):
+        """
+        Deletes and upserts all the objects in a single transaction, with one statement per table and kind of
+        change rather than several per object, and updates the project metadata once.
+        """
+        deletes: Dict[Tuple[Table, ...], Tuple[str, Callable, Set[str]]] = {}
+        for obj in objects_to_delete or []:
+            if isinstance(obj, DataSource):
+                key, id_field_name, not_found_exception = (
+                    (data_sources,), "data_source_name", DataSourceObjectNotFoundException
+                )
+            elif isinstance(obj, Entity):
+                key, id_field_name, not_found_exception = (
+                    (entities,), "entity_name", EntityNotFoundException
+                )
+            elif isinstance(obj, BaseFeatureView):
+                key, id_field_name, not_found_exception = (
+                    (feature_views, request_feature_views, on_demand_feature_views, stream_feature_views),
+                    "feature_view_name",
+                    FeatureViewNotFoundException,
+                )
+            elif isinstance(obj, FeatureService):
+                key, id_field_name, not_found_exception = (
+                    (feature_services,), "feature_service_name", FeatureServiceNotFoundException
+                )
+            elif isinstance(obj, ValidationReference):
+                key, id_field_name, not_found_exception = (
+                    (validation_references,), "validation_reference_name", ValidationReferenceNotFound
+                )
+            else:
+                raise ValueError(f"Unexpected object type to delete: {type(obj)}")
+            deletes.setdefault(key, (id_field_name, not_found_exception, set()))[2].add(obj.name)
+
+        upserts: Dict[Table, Tuple[str, str, Dict[str, Any]]] = {}
+        for obj in objects_to_apply:
+            if isinstance(obj, DataSource):
+                table, id_field_name, proto_field_name = data_sources, "data_source_name", "data_source_proto"
+            elif isinstance(obj, Entity):
+                table, id_field_name, proto_field_name = entities, "entity_name", "entity_proto"
+            elif isinstance(obj, BaseFeatureView):
+                table, id_field_name, proto_field_name = (
+                    self._infer_fv_table(obj), "feature_view_name", "feature_view_proto"
+                )
+            elif isinstance(obj, FeatureService):
+                table, id_field_name, proto_field_name = (
+                    feature_services, "feature_service_name", "feature_service_proto"
+                )
+            elif isinstance(obj, SavedDataset):
+                table, id_field_name, proto_field_name = (
+                    saved_datasets, "saved_dataset_name", "saved_dataset_proto"
+                )
+            elif isinstance(obj, ValidationReference):
+                table, id_field_name, proto_field_name = (
+                    validation_references, "validation_reference_name", "validation_reference_proto"
+                )
+            else:
+                raise ValueError(f"Unexpected object type to apply: {type(obj)}")
+            upserts.setdefault(table, (id_field_name, proto_field_name, {}))[2][obj.name] = obj
+
+        update_datetime = datetime.utcnow()
+        update_time = int(update_datetime.timestamp())
+        changed_objects: List[Tuple[Table, str]] = []
+        object_protos: Dict[Tuple[Table, str], Any] = {}
+        with self.engine.begin() as conn:
+            self._init_project_metadata(conn, project)
+            for tables, (id_field_name, not_found_exception, names) in deletes.items():
+                deleted_names: Set[str] = set()
+                for table in tables:
+                    id_column = getattr(table.c, id_field_name)
+                    condition = and_(table.c.project_id == project, id_column.in_(list(names)))
+                    table_names = {row[0] for row in conn.execute(select([id_column]).where(condition))}
+                    if table_names:
+                        conn.execute(delete(table).where(condition))
+                        changed_objects.extend((table, name) for name in table_names)
+                        deleted_names |= table_names
+                missing_names = names - deleted_names
+                if missing_names:
+                    # Raising rolls back the whole transaction.
+                    raise not_found_exception(sorted(missing_names)[0], project)
+
+            for table, (id_field_name, proto_field_name, objects) in upserts.items():
+                id_column = getattr(table.c, id_field_name)
+                stmt = select([id_column]).where(
+                    and_(table.c.project_id == project, id_column.in_(list(objects)))
+                )
+                existing_names = {row[0] for row in conn.execute(stmt)}
+
+                inserted_rows, updated_rows = [], []
+                for name, obj in objects.items():
+                    if hasattr(obj, "last_updated_timestamp"):
+                        obj.last_updated_timestamp = update_datetime
+                    obj_proto = obj.to_proto()
+                    object_protos[(table, name)] = obj_proto
+                    if name in existing_names:
+                        updated_rows.append(
+                            {
+                                "_name": name,
+                                "_project": project,
+                                "_proto": obj_proto.SerializeToString(),
+                                "_last_updated_timestamp": update_time,
+                            }
+                        )
+                    else:
+                        if hasattr(obj_proto, "meta") and hasattr(
+                            obj_proto.meta, "created_timestamp"
+                        ):
+                            obj_proto.meta.created_timestamp.FromDatetime(update_datetime)
+                        inserted_rows.append(
+                            {
+                                id_field_name: name,
+                                proto_field_name: obj_proto.SerializeToString(),
+                                "last_updated_timestamp": update_time,
+                                "project_id": project,
+                            }
+                        )
+
+                if inserted_rows:
+                    conn.execute(insert(table).values(inserted_rows))
+                if updated_rows:
+                    update_stmt = (
+                        update(table)
+                        .where(and_(
+                            id_column == bindparam("_name"),
+                            table.c.project_id == bindparam("_project"),
+                        ))
+                        .values({
+                            proto_field_name: bindparam("_proto"),
+                            "last_updated_timestamp": bindparam("_last_updated_timestamp"),
+                        })
+                    )
+                    conn.execute(update_stmt, updated_rows)
+                changed_objects.extend((table, name) for name in objects)
+
+            if changed_objects:
+                self._update_fingerprints(conn, project, changed_objects, object_protos)
+                self._log_changes(conn, project, changed_objects, update_datetime)
+                self._set_last_updated_metadata(update_datetime, project, conn)
+
     def apply_materialization(
         self,
         feature_view: FeatureView,
@@ -894,10 +1470,11 @@ class SqlRegistry(BaseRegistry):
             row = conn.execute(stmt).first()
             if hasattr(obj, "last_updated_timestamp"):
                 obj.last_updated_timestamp = update_datetime
+            obj_proto = obj.to_proto()
 
             if row:
                 values = {
-                    proto_field_name: obj.to_proto().SerializeToString(),
+                    proto_field_name: obj_proto.SerializeToString(),
                     "last_updated_timestamp": update_time,
                 }
                 update_stmt = (
@@ -909,8 +1486,6 @@ class SqlRegistry(BaseRegistry):
                 )
                 conn.execute(update_stmt)
             else:
-                obj_proto = obj.to_proto()
-
                 if hasattr(obj_proto, "meta") and hasattr(
                     obj_proto.meta, "created_timestamp"
                 ):
@@ -927,31 +1502,37 @@ class SqlRegistry(BaseRegistry):
                 )
                 conn.execute(insert_stmt)
 
+            self._update_fingerprints(conn, project, [(table, name)], {(table, name): obj_proto})
+            self._log_change(conn, table, project, name, update_datetime)
             self._set_last_updated_metadata(update_datetime, project)
 
     def _maybe_init_project_metadata(self, project):
         # Initialize project metadata if needed
         with self.engine.connect() as conn:
-            update_datetime = datetime.utcnow()
-            update_time = int(update_datetime.timestamp())
-            stmt = select([feast_metadata]).where(and_(
-                feast_metadata.c.metadata_key == FeastMetadataKeys.PROJECT_UUID.value,
-                feast_metadata.c.project_id == project,
-            ))
-            row = conn.execute(stmt).first()
-            if row:
-                usage.set_current_project_uuid(row["metadata_value"])
-            else:
-                new_project_uuid = f"{uuid.uuid4()}"
-                values = {
-                    "metadata_key": FeastMetadataKeys.PROJECT_UUID.value,
-                    "metadata_value": new_project_uuid,
-                    "last_updated_timestamp": update_time,
-                    "project_id": project,
-                }
-                insert_stmt = insert(feast_metadata).values(values)
-                conn.execute(insert_stmt)
-                usage.set_current_project_uuid(new_project_uuid)
+            self._init_project_metadata(conn, project)
+
+    def _init_project_metadata(self, conn, project: str):
+        update_datetime = datetime.utcnow()
+        update_time = int(update_datetime.timestamp())
+        stmt = select([feast_metadata]).where(and_(
+            feast_metadata.c.metadata_key == FeastMetadataKeys.PROJECT_UUID.value,
+            feast_metadata.c.project_id == project,
+        ))
+        row = conn.execute(stmt).first()
+        if row:
+            usage.set_current_project_uuid(row["metadata_value"])
+        else:
+            new_project_uuid = f"{uuid.uuid4()}"
+            values = {
+                "metadata_key": FeastMetadataKeys.PROJECT_UUID.value,
+                "metadata_value": new_project_uuid,
+                "last_updated_timestamp": update_time,
+                "project_id": project,
+            }
+            insert_stmt = insert(feast_metadata).values(values)
+            conn.execute(insert_stmt)
+            self._bump_registry_version(conn, update_time)
+            usage.set_current_project_uuid(new_project_uuid)
 
     def _delete_object(
         self,
@@ -968,7 +1549,11 @@ class SqlRegistry(BaseRegistry):
             rows = conn.execute(stmt)
             if rows.rowcount < 1 and not_found_exception:
                 raise not_found_exception(name, project)
-            self._set_last_updated_metadata(datetime.utcnow(), project)
+            update_datetime = datetime.utcnow()
+            if rows.rowcount > 0:
+                self._update_fingerprints(conn, project, [(table, name)], {})
+                self._log_change(conn, table, project, name, update_datetime)
+            self._set_last_updated_metadata(update_datetime, project)
 
             return rows.rowcount
 
@@ -1023,39 +1608,42 @@ class SqlRegistry(BaseRegistry):
                 return res
         return []
 
-    def _set_last_updated_metadata(self, last_updated: datetime, project: str):
-        with self.engine.connect() as conn:
-            stmt = select([feast_metadata]).where(and_(
-                feast_metadata.c.metadata_key
-                == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                feast_metadata.c.project_id == project,
-            ))
-            row = conn.execute(stmt).first()
-
-            update_time = int(last_updated.timestamp())
-
-            values = {
-                "metadata_key": FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                "metadata_value": f"{update_time}",
-                "last_updated_timestamp": update_time,
-                "project_id": project,
-            }
-            if row:
-                update_stmt = (
-                    feast_metadata.update()
-                    .where(and_(
-                        feast_metadata.c.metadata_key
-                        == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                        feast_metadata.c.project_id == project,
-                    ))
-                    .values(values)
-                )
-                conn.execute(update_stmt)
-            else:
-                insert_stmt = insert(feast_metadata).values(
-                    values,
-                )
-                conn.execute(insert_stmt)
+    def _set_last_updated_metadata(self, last_updated: datetime, project: str, conn=None):
+        if conn is None:
+            with self.engine.connect() as conn:
+                return self._set_last_updated_metadata(last_updated, project, conn)
+
+        stmt = select([feast_metadata]).where(and_(
+            feast_metadata.c.metadata_key
+            == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+            feast_metadata.c.project_id == project,
+        ))
+        row = conn.execute(stmt).first()
+
+        update_time = int(last_updated.timestamp())
+
+        values = {
+            "metadata_key": FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+            "metadata_value": f"{update_time}",
+            "last_updated_timestamp": update_time,
+            "project_id": project,
+        }
+        if row:
+            update_stmt = (
+                feast_metadata.update()
+                .where(and_(
+                    feast_metadata.c.metadata_key
+                    == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+                    feast_metadata.c.project_id == project,
+                ))
+                .values(values)
+            )
+            conn.execute(update_stmt)
+        else:
+            insert_stmt = insert(feast_metadata).values(
+                values,
+            )
+            conn.execute(insert_stmt)
 
     def _get_last_updated_metadata(self, project: str):
         with self.engine.connect() as conn:
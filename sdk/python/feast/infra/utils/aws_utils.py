@@ -474,6 +474,28 @@ def delete_s3_directory(s3_resource, bucket: str, key: str):
         obj.delete()
 
 
+def iter_s3_parquet_batches(
+    s3_resource, s3_path: str, batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """Stream the parquet files of an S3 directory as PyArrow record batches, downloading one
+    file at a time, and delete the S3 directory afterwards"""
+    bucket, key = get_bucket_and_key(s3_path)
+    bucket_obj = s3_resource.Bucket(bucket)
+    if key != "" and not key.endswith("/"):
+        key = key + "/"
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_file_path = os.path.join(temp_dir, "part.parquet")
+            for obj in bucket_obj.objects.filter(Prefix=key):
+                bucket_obj.download_file(obj.key, local_file_path)
+                yield from pq.ParquetFile(local_file_path).iter_batches(
+                    batch_size=batch_size
+                )
+                os.remove(local_file_path)
+    finally:
+        delete_s3_directory(s3_resource, bucket, key)
+
+
 def execute_redshift_query_and_unload_to_s3(
     redshift_data_client,
     cluster_id: str,
@@ -556,6 +578,30 @@ def unload_redshift_query_to_df(
     return table.to_pandas()
 
 
+def unload_redshift_query_to_arrow_batches(
+    redshift_data_client,
+    cluster_id: str,
+    database: str,
+    user: str,
+    s3_resource,
+    s3_path: str,
+    iam_role: str,
+    query: str,
+    batch_size: int,
+) -> Iterator[pa.RecordBatch]:
+    """Unload Redshift Query results to S3 and stream the results as PyArrow record batches"""
+    execute_redshift_query_and_unload_to_s3(
+        redshift_data_client,
+        cluster_id,
+        database,
+        user,
+        s3_path,
+        iam_role,
+        query,
+    )
+    yield from iter_s3_parquet_batches(s3_resource, s3_path, batch_size)
+
+
 def get_lambda_function(lambda_client, function_name: str) -> Optional[Dict]:
     """
     Get the AWS Lambda function by name or return None if it doesn't exist.
@@ -872,6 +918,24 @@ def unload_athena_query_to_df(
     return table.to_pandas()
 
 
+def unload_athena_query_to_arrow_batches(
+    athena_data_client,
+    data_source: str,
+    database: str,
+    workgroup: str,
+    s3_resource,
+    s3_path: str,
+    query: str,
+    temp_table: str,
+    batch_size: int,
+) -> Iterator[pa.RecordBatch]:
+    """Unload Athena Query results to S3 and stream the results as PyArrow record batches"""
+    execute_athena_query_and_unload_to_s3(
+        athena_data_client, data_source, database, workgroup, query, temp_table
+    )
+    yield from iter_s3_parquet_batches(s3_resource, s3_path, batch_size)
+
+
 def execute_athena_query_and_unload_to_s3(
     athena_data_client,
     data_source: str,
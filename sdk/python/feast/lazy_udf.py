@@ -0,0 +1,67 @@
+from functools import lru_cache
+from types import CodeType, FunctionType
+from typing import Any
+
+import dill
+
+# Number of distinct deserialized udfs kept per process.
+UDF_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=UDF_CACHE_SIZE)
+def _load_udf(body: bytes) -> FunctionType:
+    dill.extend(True)
+    return dill.loads(body)
+
+
+class LazyUdf:
+    """
+    A user defined function serialized with dill, only deserialized the first time it is called.
+
+    Loading a udf with dill also loads the modules it closes over, which is slow and memory heavy. Feature
+    views built from protos hold their udfs as `LazyUdf`s, so that only udfs that actually run pay for it.
+    Deserialized udfs are cached per process, keyed by their serialized body, and shared between feature
+    views and registry reloads.
+    """
+
+    def __init__(self, name: str, body: bytes):
+        """
+        Args:
+            name: The name of the udf.
+            body: The udf serialized with dill.
+        """
+        self.name = name
+        self.body = body
+
+    def resolve(self) -> FunctionType:
+        """Returns the deserialized udf."""
+        return _load_udf(self.body)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    @property
+    def __name__(self) -> str:  # type: ignore
+        return self.name
+
+    @property
+    def __code__(self) -> CodeType:
+        return self.resolve().__code__
+
+    def __repr__(self):
+        return f"LazyUdf({self.name})"
+
+
+def serialize_udf(udf: Any, **kwargs) -> bytes:
+    """Serializes the given udf with dill, reusing the serialized body of lazy udfs."""
+    if isinstance(udf, LazyUdf):
+        return udf.body
+    dill.extend(True)
+    return dill.dumps(udf, **kwargs)
+
+
+def same_udf_code(udf: Any, other: Any) -> bool:
+    """Returns whether two udfs have the same bytecode, without deserializing lazy udfs with the same body."""
+    if isinstance(udf, LazyUdf) and isinstance(other, LazyUdf) and udf.body == other.body:
+        return True
+    return udf.__code__.co_code == other.__code__.co_code
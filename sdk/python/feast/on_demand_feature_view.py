@@ -18,6 +18,7 @@ from feast.errors import RegistryInferenceFailure, SpecifiedFeaturesNotPresentEr
 from feast.feature_view import FeatureView
 from feast.feature_view_projection import FeatureViewProjection
 from feast.field import Field, from_value_type
+from feast.lazy_udf import LazyUdf, same_udf_code, serialize_udf
 from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
     OnDemandFeatureView as OnDemandFeatureViewProto,
 )
@@ -70,7 +71,7 @@ class OnDemandFeatureView(BaseFeatureView):
     features: List[Field]
     source_feature_view_projections: Dict[str, FeatureViewProjection]
     source_request_sources: Dict[str, RequestSource]
-    udf: FunctionType
+    udf: Union[FunctionType, LazyUdf]
     udf_string: str
     mode: str
     description: str
@@ -90,7 +91,7 @@ class OnDemandFeatureView(BaseFeatureView):
                 FeatureViewProjection,
             ]
         ],
-        udf: FunctionType,
+        udf: Union[FunctionType, LazyUdf],
         udf_string: str = "",
         mode: str = "pandas",
         description: str = "",
@@ -179,7 +180,7 @@ class OnDemandFeatureView(BaseFeatureView):
             or self.source_request_sources != other.source_request_sources
             or self.udf_string != other.udf_string
             or self.mode != other.mode
-            or self.udf.__code__.co_code != other.udf.__code__.co_code
+            or not same_udf_code(self.udf, other.udf)
         ):
             return False
 
@@ -217,14 +218,13 @@ class OnDemandFeatureView(BaseFeatureView):
                 request_data_source=request_sources.to_proto()
             )
 
-        dill.extend(True)
         spec = OnDemandFeatureViewSpec(
             name=self.name,
             features=[feature.to_proto() for feature in self.features],
             sources=sources,
             user_defined_function=UserDefinedFunctionProto(
                 name=self.udf.__name__,
-                body=dill.dumps(self.udf, recurse=True),
+                body=serialize_udf(self.udf, recurse=True),
                 body_text=self.udf_string,
             ),
             mode=self.mode,
@@ -266,11 +266,13 @@ class OnDemandFeatureView(BaseFeatureView):
                     RequestSource.from_proto(on_demand_source.request_data_source)
                 )
 
-        dill.extend(True)
         udf = (
             _empty_odfv_udf_fn
             if skip_udf
-            else dill.loads(on_demand_feature_view_proto.spec.user_defined_function.body)
+            else LazyUdf(
+                on_demand_feature_view_proto.spec.user_defined_function.name,
+                on_demand_feature_view_proto.spec.user_defined_function.body,
+            )
         )
 
         on_demand_feature_view_obj = cls(
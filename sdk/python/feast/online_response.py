@@ -12,30 +12,106 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
+import pyarrow as pa
+from google.protobuf.timestamp_pb2 import Timestamp
 
 from feast.feature_view import DUMMY_ENTITY_ID
-from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+)
+from feast.protos.feast.types.Value_pb2 import Value
 from feast.type_map import feast_value_type_to_python_type
 
 TIMESTAMP_POSTFIX: str = "__ts"
 
 
+class OnlineFeatureColumn:
+    """
+    A single column of an online response, holding the values returned by the online store as is.
+
+    When `indexes` is set, values, statuses and event timestamps are stored once per unique entity, and
+    `indexes[i]` lists the rows at which the i-th unique entity appears. Each distinct value is then only
+    converted to Python once, and no per-row protos are built unless the response proto is requested.
+    """
+
+    def __init__(
+        self,
+        values: Sequence[Value],
+        statuses: Sequence["FieldStatus.ValueType"],
+        event_timestamps: Sequence[Timestamp],
+        indexes: Optional[Sequence[List[int]]] = None,
+    ):
+        self.values = values
+        self.statuses = statuses
+        self.event_timestamps = event_timestamps
+        self.indexes = indexes
+
+    def to_python(self) -> List[Any]:
+        """Returns the native Python value of every row."""
+        return self._expand([feast_value_type_to_python_type(v) for v in self.values])
+
+    def event_timestamp_seconds(self) -> List[int]:
+        """Returns the event timestamp of every row, in seconds since the epoch."""
+        return self._expand([ts.seconds for ts in self.event_timestamps])
+
+    def to_proto(self) -> GetOnlineFeaturesResponse.FeatureVector:
+        return GetOnlineFeaturesResponse.FeatureVector(
+            values=self._expand(self.values),
+            statuses=self._expand(self.statuses),
+            event_timestamps=self._expand(self.event_timestamps),
+        )
+
+    def _expand(self, items: Sequence[Any]) -> List[Any]:
+        if self.indexes is None:
+            return list(items)
+        output: List[Any] = [None] * sum(len(rows) for rows in self.indexes)
+        for item, rows in zip(items, self.indexes):
+            for row in rows:
+                output[row] = item
+        return output
+
+
 class OnlineResponse:
     """
     Defines an online response in feast.
+
+    A response is backed either by a GetOnlineFeaturesResponse proto or by the columns read from the
+    online store. In the latter case the proto is only built when `proto` is first accessed, and
+    `to_dict`, `to_df` and `to_arrow` are computed from the columns directly.
     """
 
-    def __init__(self, online_response_proto: GetOnlineFeaturesResponse):
+    def __init__(
+        self,
+        online_response_proto: Optional[GetOnlineFeaturesResponse] = None,
+        read_latencies: Optional[Dict[str, float]] = None,
+        columns: Optional[List[Tuple[str, OnlineFeatureColumn]]] = None,
+    ):
         """
-        Construct a native online response from its protobuf version.
+        Construct a native online response from its protobuf version, or from its columns.
 
         Args:
-        online_response_proto: GetOnlineResponse proto object to construct from.
+            online_response_proto: GetOnlineResponse proto object to construct from.
+            read_latencies: Seconds spent reading each feature view from the online
+                store, keyed by feature view name.
+            columns: Pairs of feature name and column to construct from, if no proto
+                is given.
         """
-        self.proto = online_response_proto
+        if (online_response_proto is None) == (columns is None):
+            raise ValueError(
+                "Exactly one of online_response_proto and columns must be provided."
+            )
+        self.read_latencies = read_latencies or {}
+        self._proto = online_response_proto
+        self._columns = columns
+
+        if columns is not None:
+            self._columns = [(name, c) for name, c in columns if name != DUMMY_ENTITY_ID]
+            return
+
         # Delete DUMMY_ENTITY_ID from proto if it exists
         for idx, val in enumerate(self.proto.metadata.feature_names.val):
             if val == DUMMY_ENTITY_ID:
@@ -44,15 +120,38 @@ class OnlineResponse:
 
                 break
 
+    @property
+    def proto(self) -> GetOnlineFeaturesResponse:
+        """The GetOnlineFeaturesResponse proto of this response, built on first access if needed."""
+        if self._proto is None:
+            assert self._columns is not None
+            self._proto = GetOnlineFeaturesResponse(
+                results=[column.to_proto() for _, column in self._columns]
+            )
+            self._proto.metadata.feature_names.val.extend(
+                name for name, _ in self._columns
+            )
+        return self._proto
+
     def to_dict(self, include_event_timestamps: bool = False) -> Dict[str, Any]:
         """
         Converts GetOnlineFeaturesResponse features into a dictionary form.
 
         Args:
-        is_with_event_timestamps: bool Optionally include feature timestamps in the dictionary
+            include_event_timestamps: Optionally include feature timestamps in the dictionary.
         """
         response: Dict[str, List[Any]] = {}
 
+        if self._columns is not None:
+            for feature_ref, column in self._columns:
+                response[feature_ref] = column.to_python()
+
+                if include_event_timestamps:
+                    timestamp_ref = feature_ref + TIMESTAMP_POSTFIX
+                    response[timestamp_ref] = column.event_timestamp_seconds()
+
+            return response
+
         for feature_ref, feature_vector in zip(
             self.proto.metadata.feature_names.val, self.proto.results
         ):
@@ -73,7 +172,17 @@ class OnlineResponse:
         Converts GetOnlineFeaturesResponse features into Panda dataframe form.
 
         Args:
-        is_with_event_timestamps: bool Optionally include feature timestamps in the dataframe
+            include_event_timestamps: Optionally include feature timestamps in the dataframe.
         """
 
         return pd.DataFrame(self.to_dict(include_event_timestamps))
+
+    def to_arrow(self, include_event_timestamps: bool = False) -> pa.Table:
+        """
+        Converts GetOnlineFeaturesResponse features into a pyarrow Table.
+
+        Args:
+            include_event_timestamps: Optionally include feature timestamps in the table.
+        """
+
+        return pa.Table.from_pydict(self.to_dict(include_event_timestamps))
@@ -8,6 +8,7 @@ import yaml
 from pydantic import (
     BaseModel,
     Field,
+    StrictBool,
     StrictInt,
     StrictStr,
     ValidationError,
@@ -57,6 +58,7 @@ ONLINE_STORE_CLASS_FOR_TYPE = {
 
 OFFLINE_STORE_CLASS_FOR_TYPE = {
     "file": "feast.infra.offline_stores.file.FileOfflineStore",
+    "duckdb": "feast.infra.offline_stores.duckdb.DuckDBOfflineStore",
     "bigquery": "feast.infra.offline_stores.bigquery.BigQueryOfflineStore",
     "redshift": "feast.infra.offline_stores.redshift.RedshiftOfflineStore",
     "snowflake.offline": "feast.infra.offline_stores.snowflake.SnowflakeOfflineStore",
@@ -101,7 +103,9 @@ class RegistryConfig(FeastBaseModel):
 
     registry_type: StrictStr = "file"
     """ str: Provider name or a class name that implements RegistryStore.
-        If specified, registry_store_type should be redundant."""
+        If specified, registry_store_type should be redundant. "snapshot" serves a
+        read-only registry from a snapshot file written by `feast registry snapshot`,
+        found at `path`."""
 
     registry_store_type: Optional[StrictStr]
     """ str: Provider name or a class name that implements RegistryStore. """
@@ -118,6 +122,22 @@ class RegistryConfig(FeastBaseModel):
     s3_additional_kwargs: Optional[Dict[str, str]]
     """ Dict[str, str]: Extra arguments to pass to boto3 when writing the registry file to S3. """
 
+    incremental_refresh: StrictBool = False
+    """ bool: Only used by the sql registry. If True, an expired cache is brought up to date by reloading only the
+     objects changed since the last refresh, as recorded in the registry change log, instead of the whole registry.
+     Every process writing to the registry must run a Feast version that maintains the change log. """
+
+    check_version: StrictBool = False
+    """ bool: Only used by the sql registry. If True, an expired cache is only reloaded if the registry version,
+     which every write to the registry increments, has changed since the cache was built. This makes a check of
+     an unchanged registry a single query. Every process writing to the registry must run a Feast version that
+     maintains the registry version. """
+
+    background_refresh: StrictBool = False
+    """ bool: If True, the registry cache is refreshed every `cache_ttl_seconds` by a background thread, and reads
+     keep being served from the current cache while it runs instead of refreshing it when it expires. Has no effect
+     if `cache_ttl_seconds` is 0. """
+
 
 class RepoConfig(FeastBaseModel):
     """Repo config. Typically loaded from `feature_store.yaml`"""
@@ -170,6 +190,17 @@ class RepoConfig(FeastBaseModel):
         in-memory registry.
     """
 
+    online_read_max_workers: StrictInt = 1
+    """ The number of threads used to read the feature views of a single online request concurrently. A value of 1
+        reads the feature views one after another. Not used by online stores that read all feature views in a single
+        round trip (MySQL).
+    """
+
+    inference_max_workers: StrictInt = 8
+    """ The number of threads used to infer the schemas of data sources and feature views concurrently during
+        `feast plan` and `feast apply`. A value of 1 infers them one after another.
+    """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -1,13 +1,15 @@
+import hashlib
 import importlib
 import json
 import os
 import random
 import re
 import sys
+import threading
 from importlib.abc import Loader
 from importlib.machinery import ModuleSpec
 from pathlib import Path
-from typing import List, Set, Union, Tuple, Optional
+from typing import Any, Dict, List, Set, Union, Tuple, Optional
 
 import click
 from click.exceptions import BadParameter
@@ -97,6 +99,45 @@ def get_repo_files(repo_root: Path) -> List[Path]:
     return sorted(repo_files)
 
 
+# Module-level objects of every repo file parsed so far, keyed by the file's path and module name, along with the
+# hash of the file's content they were read from.
+_repo_file_objects: Dict[Tuple[Path, str], Tuple[str, List[Any]]] = {}
+_repo_file_objects_lock = threading.Lock()
+
+
+def _load_repo_objects(repo_files: List[Path]) -> List[List[Any]]:
+    """
+    Returns the module-level objects of each of the given repo files, importing the files as needed.
+
+    Objects are cached per file, keyed on the hash of the file's content, so that parsing an unchanged repo again
+    doesn't walk its modules again. If a file changed since it was imported, every repo module is imported again,
+    since modules may import objects from each other.
+    """
+    with _repo_file_objects_lock:
+        content_hashes = {
+            (repo_file, py_path_to_module(repo_file)): hashlib.sha256(
+                repo_file.read_bytes()
+            ).hexdigest()
+            for repo_file in repo_files
+        }
+        if any(
+            key in _repo_file_objects and _repo_file_objects[key][0] != content_hash
+            for key, content_hash in content_hashes.items()
+        ):
+            for _, module_path in list(_repo_file_objects) + list(content_hashes):
+                sys.modules.pop(module_path, None)
+            _repo_file_objects.clear()
+
+        for key, content_hash in content_hashes.items():
+            if key not in _repo_file_objects:
+                module = importlib.import_module(key[1])
+                _repo_file_objects[key] = (
+                    content_hash,
+                    [getattr(module, attr_name) for attr_name in dir(module)],
+                )
+        return [_repo_file_objects[key][1] for key in content_hashes]
+
+
 def parse_repo(repo_root: Path) -> RepoContents:
     """
     Collects unique Feast object definitions from the given feature repo.
@@ -116,18 +157,20 @@ def parse_repo(repo_root: Path) -> RepoContents:
     )
 
     res.entities.append(DUMMY_ENTITY)
-    for repo_file in get_repo_files(repo_root):
-        module_path = py_path_to_module(repo_file)
-        module = importlib.import_module(module_path)
-
-        for attr_name in dir(module):
-            obj = getattr(module, attr_name)
-
-            if isinstance(obj, DataSource) and not any(
-                (obj is ds) for ds in res.data_sources
-            ):
-                res.data_sources.append(obj)
-
+    # Ids of the objects added so far, to check whether an object was already added without scanning them all.
+    added_ids = {id(DUMMY_ENTITY)}
+
+    def add(objects: List[Any], obj: Any) -> bool:
+        # adds `obj` to `objects` unless it was already added, returns whether it was added
+        if id(obj) in added_ids:
+            return False
+        added_ids.add(id(obj))
+        objects.append(obj)
+        return True
+
+    for module_objects in _load_repo_objects(get_repo_files(repo_root)):
+        for obj in module_objects:
+            if isinstance(obj, DataSource) and add(res.data_sources, obj):
                 # Handle batch sources defined within stream sources.
                 if (
                     isinstance(obj, PushSource)
@@ -136,69 +179,43 @@ def parse_repo(repo_root: Path) -> RepoContents:
                 ):
                     batch_source = obj.batch_source
 
-                    if batch_source and not any(
-                        (batch_source is ds) for ds in res.data_sources
-                    ):
-                        res.data_sources.append(batch_source)
+                    if batch_source:
+                        add(res.data_sources, batch_source)
             if (
                 isinstance(obj, FeatureView)
-                and not any((obj is fv) for fv in res.feature_views)
                 and not isinstance(obj, StreamFeatureView)
                 and not isinstance(obj, BatchFeatureView)
             ):
-                res.feature_views.append(obj)
-
-                # Handle batch sources defined with feature views.
-                batch_source = obj.batch_source
-                assert batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(batch_source)
-
-                # Handle stream sources defined with feature views.
-                if obj.stream_source:
+                if add(res.feature_views, obj):
+                    # Handle batch sources defined with feature views.
+                    batch_source = obj.batch_source
+                    assert batch_source
+                    add(res.data_sources, batch_source)
+
+                    # Handle stream sources defined with feature views.
+                    if obj.stream_source:
+                        add(res.data_sources, obj.stream_source)
+            elif isinstance(obj, StreamFeatureView):
+                if add(res.stream_feature_views, obj):
+                    # Handle batch sources defined with feature views.
+                    add(res.data_sources, obj.batch_source)
+
+                    # Handle stream sources defined with feature views.
                     stream_source = obj.stream_source
-                    if not any((stream_source is ds) for ds in res.data_sources):
-                        res.data_sources.append(stream_source)
-            elif isinstance(obj, StreamFeatureView) and not any(
-                (obj is sfv) for sfv in res.stream_feature_views
-            ):
-                res.stream_feature_views.append(obj)
-
-                # Handle batch sources defined with feature views.
-                batch_source = obj.batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(batch_source)
-
-                # Handle stream sources defined with feature views.
-                stream_source = obj.stream_source
-                assert stream_source
-                if not any((stream_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(stream_source)
-            elif isinstance(obj, BatchFeatureView) and not any(
-                (obj is bfv) for bfv in res.feature_views
-            ):
-                res.feature_views.append(obj)
-
-                # Handle batch sources defined with feature views.
-                batch_source = obj.batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(batch_source)
-            elif isinstance(obj, Entity) and not any(
-                (obj is entity) for entity in res.entities
-            ):
-                res.entities.append(obj)
-            elif isinstance(obj, FeatureService) and not any(
-                (obj is fs) for fs in res.feature_services
-            ):
-                res.feature_services.append(obj)
-            elif isinstance(obj, OnDemandFeatureView) and not any(
-                (obj is odfv) for odfv in res.on_demand_feature_views
-            ):
-                res.on_demand_feature_views.append(obj)
-            elif isinstance(obj, RequestFeatureView) and not any(
-                (obj is rfv) for rfv in res.request_feature_views
-            ):
-                res.request_feature_views.append(obj)
+                    assert stream_source
+                    add(res.data_sources, stream_source)
+            elif isinstance(obj, BatchFeatureView):
+                if add(res.feature_views, obj):
+                    # Handle batch sources defined with feature views.
+                    add(res.data_sources, obj.batch_source)
+            elif isinstance(obj, Entity):
+                add(res.entities, obj)
+            elif isinstance(obj, FeatureService):
+                add(res.feature_services, obj)
+            elif isinstance(obj, OnDemandFeatureView):
+                add(res.on_demand_feature_views, obj)
+            elif isinstance(obj, RequestFeatureView):
+                add(res.request_feature_views, obj)
 
     res.entities.append(DUMMY_ENTITY)
     return res
@@ -15,6 +15,7 @@ from feast.data_source import DataSource
 from feast.entity import Entity
 from feast.feature_view import FeatureView
 from feast.field import Field
+from feast.lazy_udf import LazyUdf, same_udf_code, serialize_udf
 from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
 from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
     UserDefinedFunction as UserDefinedFunctionProto,
@@ -72,7 +73,7 @@ class StreamFeatureView(FeatureView):
     mode: str
     timestamp_field: str
     materialization_intervals: List[Tuple[datetime, datetime]]
-    udf: Optional[FunctionType]
+    udf: Optional[Union[FunctionType, LazyUdf]]
     udf_string: Optional[str]
 
     def __init__(
@@ -91,7 +92,7 @@ class StreamFeatureView(FeatureView):
         aggregations: Optional[List[Aggregation]] = None,
         mode: Optional[str] = "spark",
         timestamp_field: Optional[str] = "",
-        udf: Optional[FunctionType] = None,
+        udf: Optional[Union[FunctionType, LazyUdf]] = None,
         udf_string: Optional[str] = "",
     ):
         if not flags_helper.is_test():
@@ -150,7 +151,7 @@ class StreamFeatureView(FeatureView):
         if (
             self.mode != other.mode
             or self.timestamp_field != other.timestamp_field
-            or self.udf.__code__.co_code != other.udf.__code__.co_code
+            or not same_udf_code(self.udf, other.udf)
             or self.udf_string != other.udf_string
             or self.aggregations != other.aggregations
         ):
@@ -180,11 +181,10 @@ class StreamFeatureView(FeatureView):
             stream_source_proto.data_source_class_type = f"{self.stream_source.__class__.__module__}.{self.stream_source.__class__.__name__}"
 
         udf_proto = None
-        dill.extend(True)
         if self.udf:
             udf_proto = UserDefinedFunctionProto(
                 name=self.udf.__name__,
-                body=dill.dumps(self.udf, byref=False, recurse=True),
+                body=serialize_udf(self.udf, byref=False, recurse=True),
                 body_text=self.udf_string,
             )
         spec = StreamFeatureViewSpecProto(
@@ -220,9 +220,11 @@ class StreamFeatureView(FeatureView):
             else None
         )
 
-        dill.extend(True)
         udf = (
-            dill.loads(sfv_proto.spec.user_defined_function.body)
+            LazyUdf(
+                sfv_proto.spec.user_defined_function.name,
+                sfv_proto.spec.user_defined_function.body,
+            )
             if sfv_proto.spec.HasField("user_defined_function") and not skip_udf
             else None
         )
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow
+import pyarrow.dataset
+import pytest
+
+from feast import FileSource
+from feast.infra.offline_stores.file import _read_datasource
+
+NUM_DAYS = 30
+ROWS_PER_DAY = 50_000
+NUM_FEATURES = 20
+START = datetime(2023, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def partitioned_source(tmp_path_factory) -> FileSource:
+    path = tmp_path_factory.mktemp("partitioned_source")
+    for day in range(NUM_DAYS):
+        day_start = START + timedelta(days=day)
+        df = pd.DataFrame(
+            {
+                "driver_id": np.random.randint(0, 10_000, ROWS_PER_DAY),
+                "event_timestamp": pd.date_range(
+                    day_start, day_start + timedelta(days=1), periods=ROWS_PER_DAY
+                ),
+                **{
+                    f"feature_{i}": np.random.rand(ROWS_PER_DAY)
+                    for i in range(NUM_FEATURES)
+                },
+            }
+        )
+        df["day"] = day_start.strftime("%Y-%m-%d")
+        pyarrow.dataset.write_dataset(
+            pyarrow.Table.from_pandas(df, preserve_index=False),
+            base_dir=str(path),
+            basename_template=f"part-{day}-{{i}}.parquet",
+            format="parquet",
+            partitioning=["day"],
+            partitioning_flavor="hive",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    return FileSource(path=str(path), timestamp_field="event_timestamp")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pushdown", [False, True], ids=["full_scan", "pushdown"])
+def test_read_partitioned_datasource(partitioned_source, pushdown, benchmark):
+    """
+    Benchmarks reading two features of a two day window out of a month of data.
+    """
+    kwargs = (
+        dict(
+            columns=["driver_id", "event_timestamp", "feature_0", "feature_1"],
+            timestamp_field="event_timestamp",
+            start_date=START + timedelta(days=10),
+            end_date=START + timedelta(days=12),
+        )
+        if pushdown
+        else {}
+    )
+
+    benchmark(lambda: _read_datasource(partitioned_source, **kwargs).compute())
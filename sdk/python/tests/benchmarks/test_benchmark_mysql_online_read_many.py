@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.type_map import python_values_to_proto_values
+from feast.value_type import ValueType
+from tests.integration.feature_repos.repo_configuration import (
+    construct_universal_feature_views,
+)
+from tests.integration.feature_repos.universal.entities import customer, driver, location
+
+
+def _entity_keys(join_key, values):
+    return [
+        EntityKeyProto(join_keys=[join_key], entity_values=[proto_value])
+        for proto_value in python_values_to_proto_values(values, ValueType.INT64)
+    ]
+
+
+@pytest.fixture
+def mysql_read_many_inputs(environment, universal_data_sources):
+    fs = environment.feature_store
+    entities, _, data_sources = universal_data_sources
+    feature_views = construct_universal_feature_views(data_sources)
+    fs.apply([*feature_views.values(), driver(), customer(), location()])
+    fs.materialize(environment.start_date, environment.end_date)
+
+    drivers = random.choices(entities.driver_vals, k=500)
+    customers = random.choices(entities.customer_vals, k=500)
+    tables = [
+        fs.get_feature_view("driver_stats"),
+        fs.get_feature_view("customer_profile"),
+    ]
+    entity_keys_list = [
+        _entity_keys("driver_id", drivers),
+        _entity_keys("customer_id", customers),
+    ]
+    return fs, tables, entity_keys_list
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+@pytest.mark.universal_online_stores(only=["mysql"])
+@pytest.mark.parametrize("read_many", [True, False], ids=["read_many", "per_table"])
+def test_mysql_online_read_many(mysql_read_many_inputs, read_many, benchmark):
+    """
+    Benchmarks reading several feature views with a single `online_read_many` round trip against the
+    per-table `online_read` path used by `FeatureStore._get_online_features` for other stores.
+    """
+    fs, tables, entity_keys_list = mysql_read_many_inputs
+    online_store = fs._get_provider().online_store
+
+    def per_table():
+        return [
+            online_store.online_read(fs.config, table, entity_keys)
+            for table, entity_keys in zip(tables, entity_keys_list)
+        ]
+
+    if read_many:
+        benchmark(online_store.online_read_many, fs.config, tables, entity_keys_list)
+    else:
+        benchmark(per_table)
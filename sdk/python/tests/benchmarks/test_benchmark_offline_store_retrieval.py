@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource
+from feast.infra.offline_stores.duckdb import (
+    DuckDBOfflineStore,
+    DuckDBOfflineStoreConfig,
+)
+from feast.infra.offline_stores.file import FileOfflineStore, FileOfflineStoreConfig
+from feast.infra.registry.memory import InMemoryRegistry
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Int64
+
+PROJECT = "benchmark"
+NUM_ENTITIES = 10_000
+NUM_FEATURES = 10
+START = datetime(2023, 1, 1)
+END = datetime(2023, 1, 31)
+
+OFFLINE_STORES = {
+    "file": (FileOfflineStore, FileOfflineStoreConfig()),
+    "duckdb": (DuckDBOfflineStore, DuckDBOfflineStoreConfig()),
+}
+
+
+@pytest.fixture(scope="module")
+def feature_views(tmp_path_factory):
+    path = tmp_path_factory.mktemp("offline_store_retrieval")
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    feature_views = []
+    for name, num_rows in [("driver_hourly", 500_000), ("driver_daily", 50_000)]:
+        source_path = str(path / f"{name}.parquet")
+        pd.DataFrame(
+            {
+                "driver_id": np.random.randint(0, NUM_ENTITIES, num_rows),
+                "event_timestamp": pd.to_datetime(
+                    np.random.randint(START.timestamp(), END.timestamp(), num_rows),
+                    unit="s",
+                    utc=True,
+                ),
+                "created": pd.Timestamp(END, tz="UTC"),
+                **{
+                    f"{name}_{i}": np.random.rand(num_rows) for i in range(NUM_FEATURES)
+                },
+            }
+        ).to_parquet(source_path)
+        feature_views.append(
+            FeatureView(
+                name=name,
+                entities=[driver],
+                ttl=timedelta(days=7),
+                schema=[Field(name="driver_id", dtype=Int64)]
+                + [
+                    Field(name=f"{name}_{i}", dtype=Float32)
+                    for i in range(NUM_FEATURES)
+                ],
+                source=FileSource(
+                    path=source_path,
+                    timestamp_field="event_timestamp",
+                    created_timestamp_column="created",
+                ),
+            )
+        )
+    return feature_views
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("offline_store", list(OFFLINE_STORES))
+@pytest.mark.parametrize("num_entity_rows", [10_000, 100_000])
+def test_get_historical_features(
+    feature_views, offline_store, num_entity_rows, benchmark
+):
+    """
+    Benchmarks a point-in-time join of two feature views over local parquet files.
+    """
+    offline_store_class, offline_store_config = OFFLINE_STORES[offline_store]
+    config = RepoConfig(
+        registry="registry.db",
+        project=PROJECT,
+        provider="local",
+        offline_store=offline_store_config,
+        entity_key_serialization_version=2,
+    )
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": np.random.randint(0, NUM_ENTITIES, num_entity_rows),
+            "event_timestamp": pd.to_datetime(
+                np.random.randint(
+                    (START + timedelta(days=7)).timestamp(),
+                    END.timestamp(),
+                    num_entity_rows,
+                ),
+                unit="s",
+                utc=True,
+            ),
+        }
+    )
+    feature_refs = [
+        f"{fv.name}:{fv.name}_{i}" for fv in feature_views for i in range(NUM_FEATURES)
+    ]
+
+    benchmark(
+        lambda: offline_store_class.get_historical_features(
+            config=config,
+            feature_views=feature_views,
+            feature_refs=feature_refs,
+            entity_df=entity_df,
+            registry=InMemoryRegistry(None, None),
+            project=PROJECT,
+        ).to_arrow()
+    )
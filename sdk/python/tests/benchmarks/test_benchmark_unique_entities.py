@@ -0,0 +1,47 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+import pytest
+
+from feast import FeatureStore
+from feast.protos.feast.types.Value_pb2 import Value
+
+
+@dataclass
+class MockFeatureViewProjection:
+    join_key_map: Dict[str, str]
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+    entities: List[str]
+    projection: MockFeatureViewProjection
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [1_000, 100_000])
+@pytest.mark.parametrize("num_entities", [1, 2], ids=["single_key", "composite_key"])
+def test_get_unique_entities(num_rows, num_entities, benchmark):
+    """
+    Benchmarks de-duplicating the entity rows of a batch scoring request, where roughly half the rows repeat.
+    """
+    entity_names = [f"entity_{i}" for i in range(num_entities)]
+    join_key_values = {
+        name: [Value(int64_val=random.randrange(num_rows // 2)) for _ in range(num_rows)]
+        for name in entity_names
+    }
+    fv = MockFeatureView(
+        name="fv",
+        entities=entity_names,
+        projection=MockFeatureViewProjection(join_key_map={}),
+    )
+
+    benchmark(
+        FeatureStore._get_unique_entities,
+        FeatureStore,
+        fv,
+        join_key_values,
+        {name: name for name in entity_names},
+    )
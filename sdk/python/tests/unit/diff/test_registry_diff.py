@@ -1,14 +1,22 @@
+from tempfile import mkstemp
+from unittest.mock import patch
+
 import pandas as pd
 
-from feast import Field, PushSource
+from feast import Field, FileSource, PushSource
+from feast.diff.property_diff import TransitionType
 from feast.diff.registry_diff import (
+    diff_between,
     diff_registry_objects,
     tag_objects_for_keep_delete_update_add,
 )
 from feast.entity import Entity
 from feast.feature_view import FeatureView
+from feast.infra.registry.registry import FeastObjectType, Registry
 from feast.on_demand_feature_view import on_demand_feature_view
-from feast.types import String
+from feast.repo_config import RegistryConfig
+from feast.repo_contents import RepoContents
+from feast.types import Float32, String
 from tests.utils.data_source_test_creator import prep_file_source
 
 
@@ -169,3 +177,89 @@ def test_diff_registry_objects_batch_to_push_source(simple_dataset_1):
             feast_object_diffs.feast_object_property_diffs[0].property_name
             == "stream_source"
         )
+
+
+def test_diff_between_only_compares_changed_objects():
+    project = "project"
+    registry = Registry(RegistryConfig(path=mkstemp()[1]), None)
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(name="source", path="source.parquet", timestamp_field="ts")
+
+    def feature_view(name: str, tags: dict) -> FeatureView:
+        return FeatureView(
+            name=name,
+            entities=[entity],
+            schema=[Field(name="feature", dtype=Float32)],
+            source=source,
+            tags=tags,
+        )
+
+    registry.apply_entity(entity, project)
+    registry.apply_data_source(source, project)
+    registry.apply_feature_view(feature_view("unchanged", {}), project)
+    registry.apply_feature_view(feature_view("changed", {"when": "before"}), project)
+
+    desired_repo_contents = RepoContents(
+        data_sources=[source],
+        feature_views=[
+            feature_view("unchanged", {}),
+            feature_view("changed", {"when": "after"}),
+        ],
+        on_demand_feature_views=[],
+        request_feature_views=[],
+        stream_feature_views=[],
+        entities=[entity],
+        feature_services=[],
+    )
+    with patch(
+        "feast.diff.registry_diff.diff_registry_objects",
+        side_effect=diff_registry_objects,
+    ) as diff_objects:
+        registry_diff = diff_between(registry, project, desired_repo_contents)
+
+    assert [call.args[1].name for call in diff_objects.call_args_list] == ["changed"]
+    transitions = {
+        feast_object_diff.name: feast_object_diff.transition_type
+        for feast_object_diff in registry_diff.feast_object_diffs
+        if feast_object_diff.feast_object_type == FeastObjectType.FEATURE_VIEW
+    }
+    assert transitions == {
+        "unchanged": TransitionType.UNCHANGED,
+        "changed": TransitionType.UPDATE,
+    }
+
+
+def test_diff_between_sees_changes_from_other_clients():
+    project = "project"
+    registry_path = mkstemp()[1]
+    registry = Registry(RegistryConfig(path=registry_path, cache_ttl_seconds=600), None)
+    other_registry = Registry(
+        RegistryConfig(path=registry_path, cache_ttl_seconds=600), None
+    )
+    entity = Entity(name="driver", join_keys=["driver_id"], tags={"owner": "a"})
+    registry.apply_entity(entity, project)
+
+    desired_repo_contents = RepoContents(
+        data_sources=[],
+        feature_views=[],
+        on_demand_feature_views=[],
+        request_feature_views=[],
+        stream_feature_views=[],
+        entities=[entity],
+        feature_services=[],
+    )
+
+    def entity_transitions():
+        registry_diff = diff_between(registry, project, desired_repo_contents)
+        return [
+            feast_object_diff.transition_type
+            for feast_object_diff in registry_diff.feast_object_diffs
+            if feast_object_diff.feast_object_type == FeastObjectType.ENTITY
+        ]
+
+    assert entity_transitions() == [TransitionType.UNCHANGED]
+
+    other_registry.apply_entity(
+        Entity(name="driver", join_keys=["driver_id"], tags={"owner": "b"}), project
+    )
+    assert entity_transitions() == [TransitionType.UPDATE]
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from feast.infra.online_stores.contrib.mysql_online_store.connection_pool import (
+    ConnectionPoolClosed,
+    ConnectionPoolTimeout,
+    MySQLConnectionPool,
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query, values=None):
+        if self.conn.broken:
+            raise ConnectionError("broken")
+
+    def fetchall(self):
+        return [(1,)]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.rollbacks = 0
+        self.server_status = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(**kwargs):
+    opened = []
+
+    def connect():
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn, conn
+
+    return MySQLConnectionPool(connect=connect, **kwargs), opened
+
+
+def test_released_connection_is_reused():
+    pool, opened = _pool(max_size=2)
+    first = pool.checkout()
+    pool.release(first)
+    second = pool.checkout()
+
+    assert second is first
+    assert len(opened) == 1
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 1
+
+
+def test_checkout_blocks_when_exhausted_and_times_out():
+    pool, _ = _pool(max_size=1, checkout_timeout_seconds=0.05)
+    pool.checkout()
+
+    with pytest.raises(ConnectionPoolTimeout):
+        pool.checkout()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_checkout_waits_for_release_from_another_thread():
+    pool, opened = _pool(max_size=1, checkout_timeout_seconds=5)
+    held = pool.checkout()
+
+    threading.Timer(0.05, pool.release, args=(held,)).start()
+    assert pool.checkout() is held
+    assert len(opened) == 1
+
+
+def test_connections_are_recycled_after_max_lifetime():
+    pool, opened = _pool(max_size=1, max_lifetime_seconds=1)
+    pooled = pool.checkout()
+    pool.release(pooled)
+    pooled.created_at -= 2
+
+    assert pool.checkout() is not pooled
+    assert opened[0].closed
+    assert pool.stats()["recycled"] == 1
+
+
+def test_unhealthy_connections_are_replaced():
+    pool, opened = _pool(max_size=1, health_check_interval_seconds=0)
+    pooled = pool.checkout()
+    pool.release(pooled)
+    opened[0].broken = True
+
+    assert pool.checkout() is not pooled
+    assert len(opened) == 2
+    assert pool.stats()["discarded"] == 1
+
+
+def test_release_rolls_back_open_transactions_only():
+    pool, opened = _pool(max_size=1)
+    pooled = pool.checkout()
+    pool.release(pooled)
+    assert opened[0].rollbacks == 0
+
+    pooled = pool.checkout()
+    opened[0].server_status = 1
+    pool.release(pooled)
+    assert opened[0].rollbacks == 1
+
+
+def test_discarded_connection_frees_its_slot():
+    pool, opened = _pool(max_size=1, checkout_timeout_seconds=0.05)
+    pool.release(pool.checkout(), discard=True)
+
+    start = time.monotonic()
+    pool.checkout()
+    assert time.monotonic() - start < 0.05
+    assert opened[0].closed
+    assert len(opened) == 2
+
+
+def test_checkout_after_close_raises_and_late_releases_are_closed():
+    pool, opened = _pool(max_size=2)
+    held = pool.checkout()
+    pool.release(pool.checkout())
+    pool.close()
+    assert opened[1].closed
+
+    with pytest.raises(ConnectionPoolClosed):
+        pool.checkout()
+    assert len(opened) == 2
+
+    pool.release(held)
+    assert opened[0].closed
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["in_use"] == 0
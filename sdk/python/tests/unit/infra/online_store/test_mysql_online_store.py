@@ -0,0 +1,348 @@
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pymysql
+import pytest
+
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib.mysql_online_store import mysql
+from feast.infra.online_stores.contrib.mysql_online_store.mysql import (
+    MYSQL_DEADLOCK_ERR,
+    MySQLOnlineStore,
+    MySQLOnlineStoreConfig,
+    _pack_wide_row,
+    _unpack_wide_row,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+PROJECT = "test_mysql"
+TS = datetime(2023, 1, 1)
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query, values=None):
+        self.conn.queries.append((query, list(values or [])))
+        self.rows = self.conn.respond(query, list(values or []))
+        self.rowcount = len(values or [])
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    def __init__(self, respond=lambda query, values: []):
+        self.respond = respond
+        self.queries = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def _key_bin(driver_id: int) -> str:
+    return serialize_entity_key(
+        _entity_key(driver_id), entity_key_serialization_version=2
+    ).hex()
+
+
+def _table(driver_ids, features=("conv_rate", "acc_rate")):
+    """
+    Fake table contents: one (entity_key, feature_name, value, event_ts) row per
+    entity and feature.
+    """
+    return [
+        (_key_bin(i), f, ValueProto(double_val=i).SerializeToString(), TS)
+        for i in driver_ids
+        for f in features
+    ]
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        registry="registry.db",
+        project=PROJECT,
+        provider="local",
+        online_store=MySQLOnlineStoreConfig(read_batch_size=2),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _store_with(conn: FakeConnection) -> MySQLOnlineStore:
+    store = MySQLOnlineStore()
+
+    @contextmanager
+    def get_conn(config, readonly=False):
+        yield conn
+
+    store._get_conn = get_conn
+    return store
+
+
+def _respond_from(rows):
+    def respond(query, values):
+        return [
+            r
+            for r in rows
+            if r[0] in values and ("feature_name IN" not in query or r[1] in values)
+        ]
+
+    return respond
+
+
+def test_online_read_batches_keys_and_preserves_input_order(repo_config):
+    conn = FakeConnection(_respond_from(_table([1, 2, 3])))
+    store = _store_with(conn)
+
+    result = store.online_read(
+        repo_config,
+        MockFeatureView("driver_stats"),
+        [_entity_key(i) for i in [3, 4, 1, 2, 3]],
+        requested_features=["conv_rate"],
+    )
+
+    # 4 distinct keys in chunks of 2.
+    assert len(conn.queries) == 2
+    assert all("feature_name IN" in q for q, _ in conn.queries)
+    assert conn.commits == 0
+
+    assert [r[1]["conv_rate"].double_val if r[1] else None for r in result] == [
+        3,
+        None,
+        1,
+        2,
+        3,
+    ]
+    assert result[1] == (None, None)
+    assert set(result[0][1].keys()) == {"conv_rate"}
+    assert result[0][0] == TS
+
+
+def _write_data(driver_ids, features=("conv_rate", "acc_rate")):
+    return [
+        (_entity_key(i), {f: ValueProto(double_val=i) for f in features}, TS, None)
+        for i in driver_ids
+    ]
+
+
+def test_online_write_batch_coalesces_entities_into_chunks(repo_config):
+    conn = FakeConnection()
+    store = _store_with(conn)
+    repo_config.online_store.write_batch_max_rows = 5
+    progress = []
+
+    store.online_write_batch(
+        repo_config,
+        MockFeatureView("driver_stats"),
+        _write_data(range(5)),
+        progress.append,
+    )
+
+    # Two rows per entity and at most 5 rows per statement: entities are never split
+    # across chunks.
+    assert [len(values) // 5 for _, values in conn.queries] == [4, 4, 2]
+    assert conn.commits == 3
+    assert progress == [2, 2, 1]
+
+
+def test_online_write_batch_retries_only_the_deadlocked_chunk(repo_config):
+    attempts = []
+
+    def respond(query, values):
+        attempts.append(values[0])
+        if len(attempts) == 2:
+            raise pymysql.err.OperationalError(MYSQL_DEADLOCK_ERR, "Deadlock found")
+        return []
+
+    conn = FakeConnection(respond)
+    store = _store_with(conn)
+    repo_config.online_store.write_batch_max_rows = 2
+    progress = []
+
+    with patch("time.sleep"):
+        store.online_write_batch(
+            repo_config,
+            MockFeatureView("driver_stats"),
+            _write_data(range(3)),
+            progress.append,
+        )
+
+    assert attempts == [_key_bin(0), _key_bin(1), _key_bin(1), _key_bin(2)]
+    assert conn.commits == 3
+    assert progress == [1, 1, 1]
+
+
+def test_online_read_many_returns_one_result_per_entity(repo_config):
+    rows = _table([1, 2, 3])
+
+    def respond(query, values):
+        assert query.count("UNION ALL") == 2
+        # Every sub-select is tagged with the index of its feature view.
+        return [
+            (*r, i)
+            for i, table_rows in enumerate([rows, rows[:2]])
+            for r in table_rows
+            if r[0] in values
+        ]
+
+    conn = FakeConnection(respond)
+    store = _store_with(conn)
+
+    result = store.online_read_many(
+        repo_config,
+        [MockFeatureView("driver_stats"), MockFeatureView("driver_profile")],
+        [[_entity_key(i) for i in [2, 1, 3]], [_entity_key(i) for i in [1, 2]]],
+    )
+
+    assert len(conn.queries) == 1
+    assert [
+        [r[1]["conv_rate"].double_val if r[1] else None for r in table]
+        for table in result
+    ] == [
+        [2, 1, 3],
+        [1, None],
+    ]
+
+
+def test_wide_row_round_trip():
+    values = {"conv_rate": ValueProto(double_val=0.5), "trips": ValueProto(int64_val=7)}
+    blob = _pack_wide_row(values, TS)
+
+    assert _unpack_wide_row(blob) == (TS, values)
+    assert _unpack_wide_row(blob, ["trips"]) == (TS, {"trips": values["trips"]})
+
+
+def test_wide_layout_writes_and_reads_one_row_per_entity(repo_config):
+    repo_config.online_store.table_layout = "wide"
+    written = {}
+
+    def respond(query, values):
+        if query.lstrip().startswith("INSERT"):
+            written.update(zip(values[::2], values[1::2]))
+            return []
+        return [(k, written[k]) for k in values if k in written]
+
+    conn = FakeConnection(respond)
+    store = _store_with(conn)
+    table = MockFeatureView("driver_stats")
+
+    store.online_write_batch(repo_config, table, _write_data([1, 2]), None)
+    assert all("driver_stats_wide" in q for q, _ in conn.queries)
+    assert set(written) == {
+        serialize_entity_key(_entity_key(i), entity_key_serialization_version=2)
+        for i in [1, 2]
+    }
+
+    result = store.online_read(
+        repo_config,
+        table,
+        [_entity_key(i) for i in [2, 3]],
+        requested_features=["acc_rate"],
+    )
+    assert result[0] == (TS, {"acc_rate": ValueProto(double_val=2)})
+    assert result[1] == (None, None)
+
+
+def test_wide_layout_occ_writes_check_the_row_version(repo_config):
+    repo_config.online_store.table_layout = "wide"
+    stored = {}
+
+    def respond(query, values):
+        if query.startswith("SELECT version"):
+            return [(stored[values[0]][1],)] if values[0] in stored else []
+        key, blob, version, expected_version, _ = values
+        if key not in stored or stored[key][1] == expected_version:
+            stored[key] = (blob, version)
+        return []
+
+    conn = FakeConnection(respond)
+    store = _store_with(conn)
+    table = MockFeatureView("driver_stats")
+
+    store.online_write_batch_occ(repo_config, table, _write_data([1, 2]), None)
+    store.online_write_batch_occ(
+        repo_config, table, _write_data([1], features=("conv_rate",)), None
+    )
+
+    assert all("driver_stats_wide" in q for q, _ in conn.queries)
+    assert conn.commits == 3
+    key_1, key_2 = (
+        serialize_entity_key(_entity_key(i), entity_key_serialization_version=2)
+        for i in [1, 2]
+    )
+    assert stored[key_1][1] == 1
+    assert _unpack_wide_row(stored[key_1][0]) == (
+        TS,
+        {"conv_rate": ValueProto(double_val=1)},
+    )
+    assert stored[key_2][1] == 0
+    assert _unpack_wide_row(stored[key_2][0])[1].keys() == {"conv_rate", "acc_rate"}
+
+
+def test_async_pool_of_a_previous_event_loop_is_closed(repo_config):
+    class FakeAsyncPool:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            pass
+
+        async def wait_closed(self):
+            self.closed = True
+
+    async def create_pool(**kwargs):
+        return FakeAsyncPool()
+
+    store = MySQLOnlineStore()
+    old_loop = asyncio.new_event_loop()
+    try:
+        with patch.object(mysql, "aiomysql", SimpleNamespace(create_pool=create_pool)):
+            old_pool = old_loop.run_until_complete(
+                store._get_async_pool(repo_config.online_store)
+            )
+            new_pool = asyncio.run(store._get_async_pool(repo_config.online_store))
+    finally:
+        old_loop.close()
+
+    assert new_pool is not old_pool
+    assert old_pool.closed
+    assert not new_pool.closed
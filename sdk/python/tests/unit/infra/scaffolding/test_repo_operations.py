@@ -1,12 +1,23 @@
+import importlib
+import sys
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from typing import Optional
+from unittest.mock import patch
 
 import assertpy
+import pytest
 
-from feast.repo_operations import get_ignore_files, get_repo_files, read_feastignore
+from feast import repo_operations
+from feast.feature_view import DUMMY_ENTITY_NAME
+from feast.repo_operations import (
+    get_ignore_files,
+    get_repo_files,
+    parse_repo,
+    read_feastignore,
+)
 
 
 @contextmanager
@@ -138,3 +149,48 @@ def test_feastignore_with_stars2():
                 (repo_root / "foo1/c.py").resolve(),
             ]
         )
+
+
+@pytest.fixture
+def cached_feature_repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(repo_operations, "_repo_file_objects", {})
+    yield tmp_path
+    for module_name in ("cached_drivers", "cached_customers"):
+        sys.modules.pop(module_name, None)
+
+
+def _write_entity_file(path: Path, *entity_names: str):
+    path.write_text(
+        "from feast import Entity\n"
+        + "".join(f"{name} = Entity(name='{name}')\n" for name in entity_names)
+    )
+
+
+def _entity_names(repo_root: Path):
+    return sorted(
+        e.name for e in parse_repo(repo_root).entities if e.name != DUMMY_ENTITY_NAME
+    )
+
+
+def test_parse_repo_imports_changed_files_only(cached_feature_repo):
+    repo_root = cached_feature_repo
+    _write_entity_file(repo_root / "cached_drivers.py", "driver")
+    _write_entity_file(repo_root / "cached_customers.py", "customer")
+    assert _entity_names(repo_root) == ["customer", "driver"]
+
+    # Unchanged files are not imported again.
+    with patch.object(
+        importlib, "import_module", wraps=importlib.import_module
+    ) as import_module:
+        assert _entity_names(repo_root) == ["customer", "driver"]
+    import_module.assert_not_called()
+
+    # An edited file is imported again.
+    _write_entity_file(repo_root / "cached_drivers.py", "driver", "vehicle")
+    assert _entity_names(repo_root) == ["customer", "driver", "vehicle"]
+
+    # The objects of a removed file disappear.
+    (repo_root / "cached_customers.py").unlink()
+    assert _entity_names(repo_root) == ["driver", "vehicle"]
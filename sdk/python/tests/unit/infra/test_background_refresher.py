@@ -0,0 +1,109 @@
+import gc
+import threading
+import time
+from tempfile import mkstemp
+from unittest.mock import patch
+
+from feast.entity import Entity
+from feast.infra.registry import background_refresher
+from feast.infra.registry.background_refresher import BackgroundRefresher
+from feast.infra.registry.registry import Registry
+from feast.infra.registry.sql import SqlRegistry
+from feast.repo_config import RegistryConfig
+
+
+class FlakyRegistry:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+        self.refreshed = threading.Event()
+
+    def refresh(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("registry unavailable")
+        self.refreshed.set()
+
+
+def test_next_delay_backs_off_and_jitters():
+    registry = FlakyRegistry(failures=0)
+    refresher = BackgroundRefresher(registry.refresh, interval_seconds=60)
+    refresher.stop()
+
+    for _ in range(100):
+        assert 54 <= refresher.next_delay() <= 60
+
+    refresher.consecutive_failures = 3
+    assert 3.6 <= refresher.next_delay() <= 4
+    refresher.consecutive_failures = 20
+    assert 54 <= refresher.next_delay() <= 60
+
+
+def test_failed_refreshes_are_retried():
+    registry = FlakyRegistry(failures=2)
+    with patch.object(background_refresher, "RETRY_BASE_SECONDS", 0.01):
+        refresher = BackgroundRefresher(registry.refresh, interval_seconds=0.5)
+        assert registry.refreshed.wait(5)
+    refresher.stop()
+
+    assert registry.calls == 3
+    assert refresher.consecutive_failures == 0
+
+
+def test_refresher_stops_with_its_registry():
+    registry = FlakyRegistry(failures=0)
+    refresher = BackgroundRefresher(registry.refresh, interval_seconds=0.01)
+    assert registry.refreshed.wait(5)
+
+    del registry
+    gc.collect()
+    refresher._thread.join(5)
+    assert not refresher._thread.is_alive()
+
+
+def test_registry_serves_expired_cache_while_refreshing_in_background():
+    _, registry_path = mkstemp()
+    registry_config = RegistryConfig(
+        path=registry_path, cache_ttl_seconds=3600, background_refresh=True
+    )
+    registry = Registry(registry_config, None)
+    project = "project"
+    registry.apply_entity(Entity(name="driver_car_id"), project)
+
+    registry.cached_registry_proto_created -= registry.cached_registry_proto_ttl * 2
+    assert registry.cache_age_seconds() > 3600
+    with patch.object(
+        registry._registry_store, "get_registry_proto", side_effect=AssertionError
+    ):
+        assert registry.get_entity("driver_car_id", project, allow_cache=True)
+
+    registry.refresh()
+    assert registry.cache_age_seconds() < 3600
+
+    registry.teardown()
+
+
+def test_cache_age_grows_while_background_refreshes_fail():
+    registry_config = RegistryConfig(
+        registry_type="sql",
+        path="sqlite://",
+        cache_ttl_seconds=1,
+        background_refresh=True,
+    )
+    registry = SqlRegistry(registry_config, None)
+    refresher = registry._background_refresher
+    assert registry.cache_age_seconds() < 1
+
+    with patch.object(
+        registry, "_refresh_cache_locked", side_effect=RuntimeError("unavailable")
+    ):
+        deadline = time.monotonic() + 10
+        while refresher.consecutive_failures < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert refresher.consecutive_failures >= 2
+        assert registry.cache_age_seconds() > 1
+
+    registry.refresh()
+    assert registry.cache_age_seconds() < 1
+
+    registry.teardown()
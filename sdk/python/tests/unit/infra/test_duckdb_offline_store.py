@@ -0,0 +1,180 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource
+from feast.infra.offline_stores.duckdb import (
+    DuckDBOfflineStore,
+    DuckDBOfflineStoreConfig,
+)
+from feast.infra.registry.memory import InMemoryRegistry
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Int64
+
+PROJECT = "project"
+TS = datetime(2023, 1, 1)
+
+
+@pytest.fixture
+def repo_config() -> RepoConfig:
+    return RepoConfig(
+        registry="registry.db",
+        project=PROJECT,
+        provider="local",
+        offline_store=DuckDBOfflineStoreConfig(threads=1),
+        entity_key_serialization_version=2,
+    )
+
+
+@pytest.fixture
+def feature_view(tmp_path) -> FeatureView:
+    path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1, 1, 1, 2],
+            "event_timestamp": [
+                TS,
+                TS + timedelta(hours=2),
+                TS + timedelta(hours=2),
+                TS,
+            ],
+            "created": [TS, TS, TS + timedelta(minutes=1), TS],
+            "rate": [0.1, 0.2, 0.3, 0.4],
+        }
+    ).to_parquet(path)
+    return FeatureView(
+        name="driver_stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        ttl=timedelta(hours=3),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=FileSource(
+            path=path,
+            timestamp_field="event_timestamp",
+            created_timestamp_column="created",
+            field_mapping={"rate": "conv_rate"},
+        ),
+    )
+
+
+def test_get_historical_features(repo_config, feature_view):
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 1, 2, 3],
+            "event_timestamp": pd.to_datetime(
+                [
+                    TS + timedelta(hours=1),
+                    TS + timedelta(hours=1),
+                    TS + timedelta(hours=2),
+                    TS + timedelta(hours=4),
+                    TS + timedelta(hours=4),
+                ],
+                utc=True,
+            ),
+        }
+    )
+
+    job = DuckDBOfflineStore.get_historical_features(
+        config=repo_config,
+        feature_views=[feature_view],
+        feature_refs=["driver_stats:conv_rate"],
+        entity_df=entity_df,
+        registry=InMemoryRegistry(None, None),
+        project=PROJECT,
+        full_feature_names=True,
+    )
+    table = job.to_arrow()
+
+    assert table.column_names == [
+        "driver_id",
+        "event_timestamp",
+        "driver_stats__conv_rate",
+    ]
+    df = table.to_pandas().sort_values(["event_timestamp", "driver_id"])
+    assert df["driver_stats__conv_rate"].tolist()[:3] == [0.1, 0.4, 0.3]
+    # Outside of the TTL and unknown entities have no features
+    assert df["driver_stats__conv_rate"].iloc[3:].isna().all()
+
+
+def test_get_historical_features_separates_entity_values(repo_config, tmp_path):
+    # Without a separator, the entity values (1, 23) and (12, 3) would share a row id.
+    path = str(tmp_path / "trips.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1, 12],
+            "customer_id": [23, 3],
+            "event_timestamp": [TS, TS],
+            "trips": [1, 2],
+        }
+    ).to_parquet(path)
+    trips = FeatureView(
+        name="trips",
+        entities=[
+            Entity(name="driver", join_keys=["driver_id"]),
+            Entity(name="customer", join_keys=["customer_id"]),
+        ],
+        ttl=timedelta(hours=3),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="customer_id", dtype=Int64),
+            Field(name="trips", dtype=Int64),
+        ],
+        source=FileSource(path=path, timestamp_field="event_timestamp"),
+    )
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 12],
+            "customer_id": [23, 3],
+            "event_timestamp": pd.to_datetime([TS, TS], utc=True),
+        }
+    )
+
+    df = DuckDBOfflineStore.get_historical_features(
+        config=repo_config,
+        feature_views=[trips],
+        feature_refs=["trips:trips"],
+        entity_df=entity_df,
+        registry=InMemoryRegistry(None, None),
+        project=PROJECT,
+    ).to_df()
+
+    assert sorted(zip(df["driver_id"], df["trips"])) == [(1, 1), (12, 2)]
+
+
+def test_pull_latest_from_table_or_query(repo_config, feature_view):
+    job = DuckDBOfflineStore.pull_latest_from_table_or_query(
+        config=repo_config,
+        data_source=feature_view.batch_source,
+        join_key_columns=["driver_id"],
+        feature_name_columns=["rate"],
+        timestamp_field="event_timestamp",
+        created_timestamp_column="created",
+        start_date=TS,
+        end_date=TS + timedelta(days=1),
+    )
+
+    df = job.to_df().sort_values("driver_id")
+
+    assert df["driver_id"].tolist() == [1, 2]
+    assert df["rate"].tolist() == [0.3, 0.4]
+
+
+def test_to_arrow_batches(repo_config, feature_view):
+    job = DuckDBOfflineStore.pull_all_from_table_or_query(
+        config=repo_config,
+        data_source=feature_view.batch_source,
+        join_key_columns=["driver_id"],
+        feature_name_columns=["rate"],
+        timestamp_field="event_timestamp",
+        start_date=TS,
+        end_date=TS + timedelta(days=1),
+    )
+
+    batches = list(job.to_arrow_batches(batch_size=3))
+
+    assert sum(batch.num_rows for batch in batches) == 4
+    assert all(batch.num_rows <= 3 for batch in batches)
+    assert batches[0].schema.names == ["driver_id", "rate", "event_timestamp"]
@@ -0,0 +1,269 @@
+from datetime import datetime, timedelta
+
+import dask.dataframe as dd
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource, RequestSource
+from feast.infra.offline_stores.file import (
+    FileOfflineStore,
+    FileOfflineStoreConfig,
+    FileRetrievalJob,
+    _latest_per_key,
+    _point_in_time_join,
+    _read_datasource,
+)
+from feast.infra.registry.memory import InMemoryRegistry
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Float64, Int64
+
+
+def _write_partitioned_dataset(path, tz=None) -> datetime:
+    start = datetime(2023, 1, 1)
+    df = pd.DataFrame(
+        {
+            "driver_id": [i % 10 for i in range(240)],
+            "ts": pd.date_range(start, periods=240, freq="H", tz=tz),
+            "conv_rate": [float(i) for i in range(240)],
+            "acc_rate": [float(i) for i in range(240)],
+        }
+    )
+    # One file per day, so that reading a timestamp range can skip whole files
+    for day in range(10):
+        pyarrow.parquet.write_table(
+            pyarrow.Table.from_pandas(
+                df.iloc[day * 24 : (day + 1) * 24], preserve_index=False
+            ),
+            str(path / f"part-{day}.parquet"),
+        )
+    return start
+
+
+@pytest.mark.parametrize("tz", [None, "UTC"], ids=["naive", "tz_aware"])
+def test_read_datasource_pushes_down_columns_and_timestamp_range(tmp_path, tz):
+    start = _write_partitioned_dataset(tmp_path, tz)
+    source = FileSource(path=str(tmp_path), timestamp_field="ts")
+
+    df = _read_datasource(
+        source,
+        columns=["driver_id", "ts", "conv_rate", "missing"],
+        timestamp_field="ts",
+        start_date=start + timedelta(days=3),
+        end_date=start + timedelta(days=4, hours=12),
+    ).compute()
+
+    assert sorted(df.columns) == ["conv_rate", "driver_id", "ts"]
+    # Only the row groups of the fourth and fifth day may be read
+    assert df["conv_rate"].min() >= 72
+    assert df["conv_rate"].max() < 120
+    assert 108 in df["conv_rate"].values
+
+
+def test_read_datasource_without_pushdown(tmp_path):
+    _write_partitioned_dataset(tmp_path)
+    source = FileSource(path=str(tmp_path), timestamp_field="ts")
+
+    df = _read_datasource(source).compute()
+
+    assert len(df) == 240
+    assert {"driver_id", "ts", "conv_rate", "acc_rate"} <= set(df.columns)
+
+
+def test_latest_per_key_across_partitions():
+    ts = datetime(2023, 1, 1)
+    df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 1, 2, 1, 3],
+            "ts": [ts, ts, ts + timedelta(hours=1), ts, ts + timedelta(hours=1), ts],
+            "created": [ts, ts + timedelta(minutes=1), ts, ts, ts + timedelta(1), ts],
+            "conv_rate": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        }
+    )
+
+    latest = (
+        _latest_per_key(
+            dd.from_pandas(df, npartitions=3), ["driver_id"], "ts", "created"
+        )
+        .compute()
+        .sort_values("driver_id")
+    )
+
+    assert latest["driver_id"].tolist() == [1, 2, 3]
+    assert latest["conv_rate"].tolist() == [0.5, 0.2, 0.6]
+
+
+def test_point_in_time_join(tmp_path):
+    ts = datetime(2023, 1, 1)
+    path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1, 1, 1, 2],
+            "event_timestamp": [
+                ts,
+                ts + timedelta(hours=2),
+                ts + timedelta(hours=2),
+                ts,
+            ],
+            "created": [ts, ts, ts + timedelta(minutes=1), ts],
+            "rate": [0.1, 0.2, 0.3, 0.4],
+        }
+    ).to_parquet(path)
+    feature_view = FeatureView(
+        name="driver_stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        ttl=timedelta(hours=3),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=FileSource(
+            path=path,
+            timestamp_field="event_timestamp",
+            created_timestamp_column="created",
+            field_mapping={"rate": "conv_rate"},
+        ),
+    )
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 1, 2, 3],
+            "event_timestamp": pd.to_datetime(
+                [
+                    ts + timedelta(hours=1),
+                    ts + timedelta(hours=1),
+                    ts + timedelta(hours=2),
+                    ts + timedelta(hours=4),
+                    ts + timedelta(hours=4),
+                ],
+                utc=True,
+            ),
+        }
+    )
+
+    features = _point_in_time_join(
+        entity_df,
+        "event_timestamp",
+        feature_view,
+        ["conv_rate"],
+        (ts + timedelta(hours=1), ts + timedelta(hours=4)),
+        full_feature_names=True,
+    )
+
+    assert list(features.columns) == ["driver_stats__conv_rate"]
+    assert features.index.equals(entity_df.index)
+    assert features["driver_stats__conv_rate"].tolist()[:3] == [0.1, 0.4, 0.3]
+    # Outside of the TTL and unknown entities have no features
+    assert features["driver_stats__conv_rate"].iloc[3:].isna().all()
+
+
+def test_to_arrow_batches_streams_partitions():
+    df = pd.DataFrame({"driver_id": range(10), "conv_rate": [0.1] * 10})
+    job = FileRetrievalJob(
+        evaluation_function=lambda: dd.from_pandas(df, npartitions=2),
+        full_feature_names=False,
+    )
+
+    batches = list(job.to_arrow_batches(batch_size=3))
+
+    assert [batch.num_rows for batch in batches] == [3, 2, 3, 2]
+    assert pyarrow.Table.from_batches(batches).to_pandas().equals(df)
+
+
+def test_to_arrow_batches_types_columns_that_start_with_nulls():
+    df = pd.DataFrame(
+        {
+            "driver_id": range(10),
+            "conv_rate": [None] * 5 + [0.1] * 5,
+            "city": [None] * 8 + ["SF", None],
+        }
+    )
+    job = FileRetrievalJob(
+        evaluation_function=lambda: dd.from_pandas(df, npartitions=2),
+        full_feature_names=False,
+    )
+
+    batches = list(job.to_arrow_batches(batch_size=3))
+
+    assert [batch.num_rows for batch in batches] == [3, 2, 3, 2]
+    assert all(batch.schema.equals(batches[0].schema) for batch in batches)
+    assert batches[0].schema.field("conv_rate").type == pyarrow.float64()
+    assert batches[0].schema.field("city").type == pyarrow.string()
+    table = pyarrow.Table.from_batches(batches)
+    assert table.column("conv_rate").to_pylist() == [None] * 5 + [0.1] * 5
+    assert table.column("city").to_pylist() == [None] * 8 + ["SF", None]
+
+
+def test_to_arrow_batches_applies_on_demand_feature_views_with_one_schema():
+    @on_demand_feature_view(
+        sources=[
+            RequestSource(
+                name="driver_request", schema=[Field(name="driver_id", dtype=Int64)]
+            )
+        ],
+        schema=[Field(name="low_driver_id", dtype=Float64)],
+    )
+    def low_driver_ids(features_df: pd.DataFrame) -> pd.DataFrame:
+        # Missing from the second partition only, so its type would be inferred differently.
+        return pd.DataFrame(
+            {
+                "low_driver_id": features_df["driver_id"].where(
+                    features_df["driver_id"] < 7
+                )
+            }
+        )
+
+    df = pd.DataFrame({"driver_id": range(10), "conv_rate": [0.1] * 10})
+    job = FileRetrievalJob(
+        evaluation_function=lambda: dd.from_pandas(df, npartitions=2),
+        full_feature_names=False,
+        on_demand_feature_views=[low_driver_ids],
+    )
+
+    batches = list(job.to_arrow_batches(batch_size=3))
+
+    assert [batch.num_rows for batch in batches] == [3, 2, 3, 2]
+    assert all(batch.schema.equals(batches[0].schema) for batch in batches)
+    table = pyarrow.Table.from_batches(batches)
+    assert table.column("low_driver_id").to_pylist() == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+        None,
+        None,
+        None,
+    ]
+
+
+def test_get_historical_features_requires_a_timestamp_field(tmp_path):
+    feature_view = FeatureView(
+        name="driver_stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        schema=[Field(name="conv_rate", dtype=Float32)],
+        source=FileSource(path=str(tmp_path / "driver_stats.parquet")),
+    )
+    config = RepoConfig(
+        registry="registry.db",
+        project="project",
+        provider="local",
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    entity_df = pd.DataFrame(
+        {"driver_id": [1], "event_timestamp": [datetime(2023, 1, 1)]}
+    )
+
+    with pytest.raises(ValueError, match="driver_stats has no timestamp_field"):
+        FileOfflineStore.get_historical_features(
+            config,
+            [feature_view],
+            ["driver_stats:conv_rate"],
+            entity_df,
+            InMemoryRegistry(None, None),
+            "project",
+        )
@@ -1,3 +1,7 @@
+import threading
+import time
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
@@ -8,7 +12,10 @@ from feast.errors import DataSourceNoNameException, SpecifiedFeaturesNotPresentE
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.field import Field
-from feast.inference import update_feature_views_with_inferred_features_and_entities
+from feast.inference import (
+    update_data_sources_with_inferred_event_timestamp_col,
+    update_feature_views_with_inferred_features_and_entities,
+)
 from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
     SparkSource,
 )
@@ -472,3 +479,42 @@ def test_update_feature_services_with_specified_features(simple_dataset_1):
 
 
 # TODO(felixwang9817): Add tests that interact with field mapping.
+
+
+def test_update_data_sources_with_inferred_event_timestamp_col_concurrently():
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def get_table_column_names_and_types(data_source, config):
+        with lock:
+            running.append(data_source)
+            max_running.append(len(running))
+        time.sleep(0.1)
+        with lock:
+            running.remove(data_source)
+        return [("ts", "timestamp[us]"), ("feature", "int64")]
+
+    data_sources = [FileSource(path=f"path/to/{i}.parquet") for i in range(6)]
+    with patch.object(
+        FileSource,
+        "get_table_column_names_and_types",
+        autospec=True,
+        side_effect=get_table_column_names_and_types,
+    ) as get_schema:
+        update_data_sources_with_inferred_event_timestamp_col(
+            # Repeated data sources are only inferred once.
+            data_sources + data_sources[:2],
+            RepoConfig(
+                provider="local",
+                project="test",
+                entity_key_serialization_version=2,
+                inference_max_workers=2,
+            ),
+        )
+
+    assert [data_source.timestamp_field for data_source in data_sources] == [
+        "ts"
+    ] * len(data_sources)
+    assert get_schema.call_count == len(data_sources)
+    assert max(max_running) == 2
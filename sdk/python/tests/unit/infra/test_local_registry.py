@@ -528,3 +528,21 @@ def validate_project_uuid(project_uuid, test_registry):
     assert len(test_registry.cached_registry_proto.project_metadata) == 1
     project_metadata = test_registry.cached_registry_proto.project_metadata[0]
     assert project_metadata.project_uuid == project_uuid
+
+
+def test_cached_reads_reuse_deserialized_objects(local_registry):
+    project = "project"
+    local_registry.apply_entity(Entity(name="driver_car_id"), project)
+
+    entity = local_registry.get_entity("driver_car_id", project, allow_cache=True)
+    assert local_registry.get_entity("driver_car_id", project, allow_cache=True) is entity
+    assert local_registry.list_entities(project, allow_cache=True) == [entity]
+
+    # Any change to the registry discards the deserialized objects.
+    local_registry.apply_entity(
+        Entity(name="driver_car_id", description="Car driver id"), project
+    )
+    entity = local_registry.get_entity("driver_car_id", project, allow_cache=True)
+    assert entity.description == "Car driver id"
+
+    local_registry.teardown()
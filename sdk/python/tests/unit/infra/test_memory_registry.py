@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from feast import FileSource
+from feast.entity import Entity
+from feast.feature_view import FeatureView
+from feast.field import Field
+from feast.infra.registry.memory import InMemoryRegistry
+from feast.types import Float32
+
+
+def _feature_view(name: str, entity: Entity, source: FileSource) -> FeatureView:
+    return FeatureView(
+        name=name,
+        entities=[entity],
+        ttl=timedelta(days=1),
+        schema=[Field(name="conv_rate", dtype=Float32)],
+        source=source,
+    )
+
+
+def test_proto_only_reserializes_changed_objects():
+    project = "project"
+    registry = InMemoryRegistry(None, None)
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(path="driver_stats.parquet", timestamp_field="ts")
+    registry.apply_entity(driver, project)
+    registry.apply_data_source(source, project)
+    registry.apply_feature_view(_feature_view("driver_stats", driver, source), project)
+
+    registry_proto = registry.proto()
+    assert registry.proto() is registry_proto
+    assert [fv.spec.name for fv in registry_proto.feature_views] == ["driver_stats"]
+
+    with patch.object(
+        FeatureView, "to_proto", autospec=True, side_effect=FeatureView.to_proto
+    ) as to_proto:
+        registry.apply_feature_view(
+            _feature_view("driver_hourly_stats", driver, source), project
+        )
+        registry_proto = registry.proto()
+    assert [call.args[0].name for call in to_proto.call_args_list] == [
+        "driver_hourly_stats"
+    ]
+    assert [fv.spec.name for fv in registry_proto.feature_views] == [
+        "driver_stats",
+        "driver_hourly_stats",
+    ]
+    assert len(registry_proto.entities) == 1
+    assert len(registry_proto.project_metadata) == 1
+
+
+def test_proto_reflects_deletes_and_materializations():
+    project = "project"
+    registry = InMemoryRegistry(None, None)
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(path="driver_stats.parquet", timestamp_field="ts")
+    feature_view = _feature_view("driver_stats", driver, source)
+    registry.apply_entity(driver, project)
+    registry.apply_feature_view(feature_view, project)
+    registry.apply_entity(Entity(name="customer"), "other")
+    assert len(registry.proto().entities) == 2
+
+    registry.apply_materialization(
+        feature_view, project, datetime(2023, 1, 1), datetime(2023, 1, 2)
+    )
+    (feature_view_proto,) = registry.proto().feature_views
+    assert len(feature_view_proto.meta.materialization_intervals) == 1
+
+    registry.delete_entity("customer", "other")
+    assert [e.spec.name for e in registry.proto().entities] == ["driver"]
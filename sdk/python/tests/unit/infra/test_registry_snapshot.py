@@ -0,0 +1,140 @@
+import os
+import stat
+from datetime import timedelta
+from tempfile import mkstemp
+
+import pytest
+
+from feast import FileSource
+from feast.entity import Entity
+from feast.errors import (
+    EntityNotFoundException,
+    FeatureViewNotFoundException,
+    ReadOnlyRegistryException,
+)
+from feast.feature_view import FeatureView
+from feast.field import Field
+from feast.infra.registry.registry import Registry
+from feast.infra.registry.snapshot import (
+    RegistrySnapshot,
+    SnapshotRegistry,
+    write_registry_snapshot,
+)
+from feast.repo_config import RegistryConfig
+from feast.types import Float32
+
+
+@pytest.fixture
+def local_registry() -> Registry:
+    fd, registry_path = mkstemp()
+    registry_config = RegistryConfig(path=registry_path, cache_ttl_seconds=600)
+    return Registry(registry_config, None)
+
+
+def _snapshot_registry(registry: Registry) -> SnapshotRegistry:
+    fd, snapshot_path = mkstemp()
+    write_registry_snapshot(registry.proto(), snapshot_path)
+    return Registry(
+        RegistryConfig(registry_type="snapshot", path=snapshot_path), None
+    )
+
+
+def test_snapshot_registry_reads(local_registry):
+    project = "project"
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(path="driver_stats.parquet", timestamp_field="ts")
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[driver],
+        ttl=timedelta(days=1),
+        schema=[Field(name="conv_rate", dtype=Float32)],
+        source=source,
+    )
+    customer = Entity(name="customer", join_keys=["customer_id"])
+    local_registry.apply_entity(driver, project)
+    local_registry.apply_entity(customer, project)
+    local_registry.apply_entity(Entity(name="driver", join_keys=["id"]), "other")
+    local_registry.apply_data_source(source, project)
+    local_registry.apply_feature_view(driver_stats, project)
+
+    snapshot_registry = _snapshot_registry(local_registry)
+    assert isinstance(snapshot_registry, SnapshotRegistry)
+
+    assert snapshot_registry.get_entity("driver", project) == driver
+    assert snapshot_registry.get_entity("driver", "other").join_key == "id"
+    assert sorted(e.name for e in snapshot_registry.list_entities(project)) == [
+        "customer",
+        "driver",
+    ]
+    assert snapshot_registry.get_feature_view("driver_stats", project) == driver_stats
+    assert snapshot_registry.list_data_sources(project) == [source]
+    assert snapshot_registry.list_on_demand_feature_views(project) == []
+    assert len(snapshot_registry.list_project_metadata(project)) == 1
+
+    with pytest.raises(EntityNotFoundException):
+        snapshot_registry.get_entity("merchant", project)
+    with pytest.raises(FeatureViewNotFoundException):
+        snapshot_registry.get_feature_view("driver_stats", "other")
+
+    registry_proto = local_registry.proto()
+    snapshot_proto = snapshot_registry.proto()
+    assert snapshot_proto.version_id == registry_proto.version_id
+    assert sorted(snapshot_proto.entities, key=str) == sorted(
+        registry_proto.entities, key=str
+    )
+
+
+def test_snapshot_registry_is_read_only(local_registry):
+    snapshot_registry = _snapshot_registry(local_registry)
+
+    with pytest.raises(ReadOnlyRegistryException):
+        snapshot_registry.apply_entity(Entity(name="driver"), "project")
+    with pytest.raises(ReadOnlyRegistryException):
+        snapshot_registry.delete_feature_view("driver_stats", "project")
+
+
+def test_snapshot_registry_refresh(local_registry):
+    project = "project"
+    snapshot_registry = _snapshot_registry(local_registry)
+    assert snapshot_registry.list_entities(project) == []
+    version = snapshot_registry.cache_version(project)
+
+    local_registry.apply_entity(Entity(name="driver"), project)
+    write_registry_snapshot(local_registry.proto(), snapshot_registry.path)
+    snapshot_registry.refresh(project)
+
+    assert [e.name for e in snapshot_registry.list_entities(project)] == ["driver"]
+    assert snapshot_registry.cache_version(project) != version
+
+
+def test_snapshot_registry_cache_age(local_registry):
+    snapshot_registry = _snapshot_registry(local_registry)
+    assert snapshot_registry.cache_age_seconds() < 60
+
+    snapshot_registry._opened -= timedelta(hours=1)
+    assert snapshot_registry.cache_age_seconds() > 3600
+    snapshot_registry.refresh()
+    assert snapshot_registry.cache_age_seconds() < 60
+
+
+def test_snapshot_file_is_world_readable(local_registry, tmp_path):
+    path = str(tmp_path / "registry.snapshot")
+    write_registry_snapshot(local_registry.proto(), path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+    os.chmod(path, 0o640)
+    write_registry_snapshot(local_registry.proto(), path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_invalid_snapshot_files_are_rejected(local_registry, tmp_path):
+    path = tmp_path / "registry.snapshot"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="is not a registry snapshot"):
+        RegistrySnapshot(str(path))
+
+    local_registry.apply_entity(Entity(name="driver"), "project")
+    write_registry_snapshot(local_registry.proto(), str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="is truncated"):
+        RegistrySnapshot(str(path))
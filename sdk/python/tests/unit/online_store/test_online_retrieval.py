@@ -1,6 +1,9 @@
+import asyncio
 import os
+import threading
 import time
 from datetime import datetime
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -404,3 +407,193 @@ def test_online_to_df():
         ]
         expected_df = pd.DataFrame({k: reversed(v) for (k, v) in df_dict.items()})
         assert_frame_equal(result_df[ordered_column], expected_df)
+
+
+def test_online_async() -> None:
+    """
+    Test that the async online read path returns the same features as the sync one.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        provider = store._get_provider()
+        for driver_id in range(3):
+            provider.online_write_batch(
+                config=store.config,
+                table=store.get_feature_view(name="driver_locations"),
+                data=[
+                    (
+                        EntityKeyProto(
+                            join_keys=["driver_id"],
+                            entity_values=[ValueProto(int64_val=driver_id)],
+                        ),
+                        {
+                            "lat": ValueProto(double_val=driver_id * 0.1),
+                            "lon": ValueProto(string_val=str(driver_id)),
+                        },
+                        datetime.utcnow(),
+                        datetime.utcnow(),
+                    )
+                ],
+                progress=None,
+            )
+        provider.online_write_batch(
+            config=store.config,
+            table=store.get_feature_view(name="customer_profile"),
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["customer_id"],
+                        entity_values=[ValueProto(string_val="5")],
+                    ),
+                    {
+                        "avg_orders_day": ValueProto(float_val=1.0),
+                        "name": ValueProto(string_val="John"),
+                        "age": ValueProto(int64_val=3),
+                    },
+                    datetime.utcnow(),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+
+        kwargs = dict(
+            features=[
+                "driver_locations:lon",
+                "driver_locations:lat",
+                "customer_profile:name",
+            ],
+            entity_rows=[
+                {"driver_id": 2, "customer_id": "5"},
+                {"driver_id": 7, "customer_id": "5"},
+                {"driver_id": 0, "customer_id": "6"},
+            ],
+        )
+        result = asyncio.run(store.get_online_features_async(**kwargs)).to_dict()
+
+        assert result == store.get_online_features(**kwargs).to_dict()
+        assert result["lon"] == ["2", None, "0"]
+        assert result["name"] == ["John", "John", None]
+
+
+def test_online_concurrent_reads() -> None:
+    """
+    Test that reading feature views concurrently returns the same features as reading them one after another.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        provider = store._get_provider()
+        provider.online_write_batch(
+            config=store.config,
+            table=store.get_feature_view(name="driver_locations"),
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["driver_id"],
+                        entity_values=[ValueProto(int64_val=1)],
+                    ),
+                    {
+                        "lat": ValueProto(double_val=0.1),
+                        "lon": ValueProto(string_val="1"),
+                    },
+                    datetime.utcnow(),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+        provider.online_write_batch(
+            config=store.config,
+            table=store.get_feature_view(name="customer_profile"),
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["customer_id"],
+                        entity_values=[ValueProto(string_val="5")],
+                    ),
+                    {
+                        "avg_orders_day": ValueProto(float_val=1.0),
+                        "name": ValueProto(string_val="John"),
+                        "age": ValueProto(int64_val=3),
+                    },
+                    datetime.utcnow(),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+
+        kwargs = dict(
+            features=[
+                "driver_locations:lon",
+                "customer_profile:name",
+                "customer_profile:age",
+            ],
+            entity_rows=[
+                {"driver_id": 1, "customer_id": "5"},
+                {"driver_id": 2, "customer_id": "6"},
+            ],
+        )
+        sequential = store.get_online_features(**kwargs)
+
+        # Neither read can finish before the other one has started, so serial reads would break the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        online_read = provider.online_read
+
+        def read_together(*args, **kwargs):
+            barrier.wait()
+            return online_read(*args, **kwargs)
+
+        store.config.online_read_max_workers = 4
+        with patch.object(provider, "online_read", side_effect=read_together):
+            concurrent = store.get_online_features(**kwargs)
+
+        assert concurrent.to_dict() == sequential.to_dict()
+        assert concurrent.to_dict()["name"] == ["John", None]
+        assert set(concurrent.read_latencies) == {"driver_locations", "customer_profile"}
+
+        executor = store._online_read_executor
+        store.close()
+        assert store._online_read_executor is None
+        assert executor._shutdown
+
+
+def test_online_request_plan_cache() -> None:
+    """
+    Test that online requests reuse the compiled request plan until the registry changes.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        kwargs = dict(
+            features=["driver_locations:lon", "customer_profile:name"],
+            entity_rows=[{"driver_id": 1, "customer_id": "5"}],
+        )
+        compile_plan = store._compile_online_request_plan
+        compiled = []
+
+        def counting_compile(*args, **kwargs):
+            compiled.append(args)
+            return compile_plan(*args, **kwargs)
+
+        store._compile_online_request_plan = counting_compile
+
+        store.get_online_features(**kwargs)
+        store.get_online_features(**kwargs)
+        assert len(compiled) == 1
+
+        store.get_online_features(**kwargs, full_feature_names=True)
+        assert len(compiled) == 2
+
+        store.apply([store.get_entity("driver")])
+        result = store.get_online_features(**kwargs).to_dict()
+        assert len(compiled) == 3
+        assert result["lon"] == [None]
+
+        store.get_online_features(**kwargs, allow_registry_cache=False)
+        assert len(compiled) == 4
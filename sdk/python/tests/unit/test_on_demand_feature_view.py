@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
+import dill
 import pandas as pd
 
 from feast.feature_view import FeatureView
 from feast.field import Field
 from feast.infra.offline_stores.file_source import FileSource
+from feast.lazy_udf import LazyUdf, _load_udf
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.types import Float32
 
@@ -105,3 +109,42 @@ def test_hash():
         on_demand_feature_view_4,
     }
     assert len(s4) == 3
+
+
+def test_udf_is_deserialized_on_first_call():
+    file_source = FileSource(name="my-file-source", path="test.parquet")
+    feature_view = FeatureView(
+        name="my-feature-view",
+        entities=[],
+        schema=[
+            Field(name="feature1", dtype=Float32),
+            Field(name="feature2", dtype=Float32),
+        ],
+        source=file_source,
+    )
+    on_demand_feature_view = OnDemandFeatureView(
+        name="my-on-demand-feature-view",
+        sources=[feature_view],
+        schema=[
+            Field(name="output1", dtype=Float32),
+            Field(name="output2", dtype=Float32),
+        ],
+        udf=udf2,
+        udf_string="udf2 source code",
+    )
+    proto = on_demand_feature_view.to_proto()
+
+    _load_udf.cache_clear()
+    with patch("dill.loads", wraps=dill.loads) as loads:
+        from_proto = OnDemandFeatureView.from_proto(proto)
+        assert isinstance(from_proto.udf, LazyUdf)
+        # Serializing the feature view again reuses the serialized udf.
+        assert from_proto.to_proto().spec == proto.spec
+        assert loads.call_count == 0
+
+        df = pd.DataFrame({"feature1": [1.0], "feature2": [2.0]})
+        assert from_proto.udf(df)["output1"].tolist() == [101.0]
+        assert from_proto.udf.__code__.co_code == udf2.__code__.co_code
+        # Deserialized udfs are shared.
+        OnDemandFeatureView.from_proto(proto).udf(df)
+        assert loads.call_count == 1
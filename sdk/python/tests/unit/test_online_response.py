@@ -0,0 +1,65 @@
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from feast.feature_view import DUMMY_ENTITY_ID
+from feast.online_response import OnlineFeatureColumn, OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import FieldStatus
+from feast.protos.feast.types.Value_pb2 import Value
+
+
+def _columns():
+    timestamp = Timestamp(seconds=10)
+    return [
+        (
+            "driver_id",
+            OnlineFeatureColumn(
+                values=[Value(int64_val=1), Value(int64_val=2), Value(int64_val=1)],
+                statuses=[FieldStatus.PRESENT] * 3,
+                event_timestamps=[Timestamp()] * 3,
+            ),
+        ),
+        (
+            DUMMY_ENTITY_ID,
+            OnlineFeatureColumn(
+                values=[Value(string_val="")] * 3,
+                statuses=[FieldStatus.PRESENT] * 3,
+                event_timestamps=[Timestamp()] * 3,
+            ),
+        ),
+        (
+            "conv_rate",
+            # One value per unique driver, fanned out to the rows at which each driver appears.
+            OnlineFeatureColumn(
+                values=[Value(double_val=0.5), Value()],
+                statuses=[FieldStatus.PRESENT, FieldStatus.NOT_FOUND],
+                event_timestamps=[timestamp, Timestamp()],
+                indexes=[[0, 2], [1]],
+            ),
+        ),
+    ]
+
+
+def test_columnar_response_to_dict():
+    response = OnlineResponse(columns=_columns())
+
+    assert response._proto is None
+    assert response.to_dict(include_event_timestamps=True) == {
+        "driver_id": [1, 2, 1],
+        "driver_id__ts": [0, 0, 0],
+        "conv_rate": [0.5, None, 0.5],
+        "conv_rate__ts": [10, 0, 10],
+    }
+    assert response._proto is None
+
+
+def test_columnar_response_builds_proto_lazily():
+    response = OnlineResponse(columns=_columns())
+    proto = response.proto
+
+    assert list(proto.metadata.feature_names.val) == ["driver_id", "conv_rate"]
+    assert list(proto.results[1].statuses) == [
+        FieldStatus.PRESENT,
+        FieldStatus.NOT_FOUND,
+        FieldStatus.PRESENT,
+    ]
+    assert response.proto is proto
+    assert OnlineResponse(proto).to_dict() == response.to_dict()
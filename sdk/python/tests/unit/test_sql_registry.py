@@ -15,24 +15,34 @@ import logging
 import os
 import sys
 from datetime import timedelta
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 from pytest_lazyfixture import lazy_fixture
+from sqlalchemy import event
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 
 from feast import FileSource, RequestSource
 from feast.data_format import ParquetFormat
+from feast.diff.property_diff import TransitionType
+from feast.diff.registry_diff import diff_between
 from feast.entity import Entity
-from feast.errors import FeatureViewNotFoundException
+from feast.errors import EntityNotFoundException, FeatureViewNotFoundException
 from feast.feature_view import FeatureView
 from feast.field import Field
 from feast.infra.infra_object import Infra
 from feast.infra.online_stores.sqlite import SqliteTable
-from feast.infra.registry.sql import SqlRegistry
+from feast.infra.registry import proto_registry_utils
+from feast.infra.registry.sql import (
+    SqlRegistry,
+    registry_changes,
+    registry_fingerprints,
+)
 from feast.on_demand_feature_view import on_demand_feature_view
 from feast.repo_config import RegistryConfig
+from feast.repo_contents import RepoContents
 from feast.types import Array, Bytes, Float32, Int32, Int64, String
 from feast.value_type import ValueType
 from tests.integration.feature_repos.universal.entities import driver
@@ -601,3 +611,210 @@ def test_update_infra(sql_registry):
 
     # Try again since second time, infra should be not-empty
     sql_registry.teardown()
+
+
+def test_incremental_refresh():
+    registry_config = RegistryConfig(
+        registry_type="sql",
+        path="sqlite://",
+        incremental_refresh=True,
+    )
+    sql_registry = SqlRegistry(registry_config, None)
+    project = "project"
+
+    def expire_cache():
+        sql_registry.cached_registry_proto_created -= timedelta(days=1)
+
+    driver_entity = Entity(name="driver", join_keys=["driver_id"])
+    customer_entity = Entity(name="customer", join_keys=["customer_id"])
+    sql_registry.apply_entity(driver_entity, project)
+    sql_registry.refresh()
+    cached_driver = sql_registry.get_entity("driver", project, allow_cache=True)
+    cached_registry_proto = sql_registry.cached_registry_proto
+
+    sql_registry.apply_entity(customer_entity, project)
+    expire_cache()
+    with patch.object(sql_registry, "refresh", side_effect=AssertionError):
+        entities = sql_registry.list_entities(project, allow_cache=True)
+        assert {e.name for e in entities} == {"driver", "customer"}
+        # The cached registry proto is patched in place rather than copied.
+        assert sql_registry.cached_registry_proto is cached_registry_proto
+        # Unchanged objects are not reloaded.
+        assert sql_registry.get_entity("driver", project, allow_cache=True) is cached_driver
+        assert len(sql_registry.list_project_metadata(project, allow_cache=True)) == 1
+
+        driver_entity.description = "Driver id"
+        sql_registry.apply_entity(driver_entity, project)
+        sql_registry.delete_entity("customer", project)
+        expire_cache()
+        entities = sql_registry.list_entities(project, allow_cache=True)
+        assert [(e.name, e.description) for e in entities] == [("driver", "Driver id")]
+
+    # A pruned change log can't be replayed, the cache is rebuilt instead.
+    sql_registry.apply_entity(customer_entity, project)
+    with sql_registry.engine.connect() as conn:
+        conn.execute(registry_changes.delete())
+    sql_registry.apply_entity(Entity(name="location"), project)
+    expire_cache()
+    entities = sql_registry.list_entities(project, allow_cache=True)
+    assert {e.name for e in entities} == {"driver", "customer", "location"}
+
+    sql_registry.teardown()
+
+
+def test_refresh_skipped_while_registry_version_unchanged():
+    registry_config = RegistryConfig(
+        registry_type="sql",
+        path="sqlite://",
+        check_version=True,
+    )
+    sql_registry = SqlRegistry(registry_config, None)
+    project = "project"
+
+    def expire_cache():
+        sql_registry.cached_registry_proto_created -= timedelta(days=1)
+
+    sql_registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), project)
+    sql_registry.refresh()
+    registry_version = sql_registry._get_registry_version()
+    cache_version = sql_registry.cache_version(project)
+
+    expire_cache()
+    with patch.object(sql_registry, "proto", side_effect=AssertionError):
+        assert len(sql_registry.list_entities(project, allow_cache=True)) == 1
+    assert sql_registry.cache_version(project) == cache_version
+
+    sql_registry.apply_entity(Entity(name="customer"), project)
+    assert sql_registry._get_registry_version() == registry_version + 1
+    expire_cache()
+    entities = sql_registry.list_entities(project, allow_cache=True)
+    assert {e.name for e in entities} == {"driver", "customer"}
+    assert sql_registry.cache_version(project) > cache_version
+
+    sql_registry.teardown()
+
+
+def test_refresh_after_teardown_drops_cached_objects():
+    registry_config = RegistryConfig(
+        registry_type="sql",
+        path="sqlite://",
+        check_version=True,
+    )
+    sql_registry = SqlRegistry(registry_config, None)
+    project = "project"
+
+    sql_registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), project)
+    sql_registry.refresh()
+    assert len(sql_registry.list_entities(project, allow_cache=True)) == 1
+    registry_version = sql_registry._get_registry_version()
+
+    sql_registry.teardown()
+    assert sql_registry._get_registry_version() == registry_version + 1
+    sql_registry.cached_registry_proto_created -= timedelta(days=1)
+    assert sql_registry.list_entities(project, allow_cache=True) == []
+
+
+def test_apply_objects_in_one_transaction():
+    sql_registry = SqlRegistry(RegistryConfig(registry_type="sql", path="sqlite://"), None)
+    project = "project"
+    batch_source = FileSource(
+        name="my_source",
+        file_format=ParquetFormat(),
+        path="file://feast/*",
+        timestamp_field="ts_col",
+    )
+    entity = Entity(name="my_entity", join_keys=["test"])
+    fv = FeatureView(
+        name="my_feature_view",
+        schema=[Field(name="my_feature", dtype=Int64)],
+        entities=[entity],
+        source=batch_source,
+        ttl=timedelta(minutes=5),
+    )
+    sql_registry.apply_entity(Entity(name="old_entity"), project)
+
+    statements = []
+    event.listen(
+        sql_registry.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    sql_registry.apply_objects(
+        project, [batch_source, entity, fv], objects_to_delete=[Entity(name="old_entity")]
+    )
+    # One select per kind of object, and not several statements per object.
+    assert len(statements) < 17
+
+    assert [e.name for e in sql_registry.list_entities(project)] == ["my_entity"]
+    assert sql_registry.get_feature_view("my_feature_view", project).entities == ["my_entity"]
+    assert sql_registry.get_data_source("my_source", project) == batch_source
+
+    entity.description = "My entity"
+    sql_registry.apply_objects(project, [entity])
+    assert sql_registry.get_entity("my_entity", project).description == "My entity"
+
+    # Nothing is applied if a deletion fails.
+    with pytest.raises(EntityNotFoundException):
+        sql_registry.apply_objects(
+            project,
+            [Entity(name="another_entity")],
+            objects_to_delete=[Entity(name="missing_entity")],
+        )
+    assert [e.name for e in sql_registry.list_entities(project)] == ["my_entity"]
+    # Including the metadata of a new project.
+    with pytest.raises(EntityNotFoundException):
+        sql_registry.apply_objects(
+            "new_project", [], objects_to_delete=[Entity(name="missing_entity")]
+        )
+    assert sql_registry.list_project_metadata("new_project") == []
+
+    sql_registry.teardown()
+
+
+def test_registry_diff_reads_stored_fingerprints():
+    sql_registry = SqlRegistry(RegistryConfig(registry_type="sql", path="sqlite://"), None)
+    project = "project"
+    driver_entity = Entity(name="driver", join_keys=["driver_id"])
+    customer_entity = Entity(name="customer", join_keys=["customer_id"])
+    sql_registry.apply_entity(driver_entity, project)
+    sql_registry.apply_objects(project, [customer_entity])
+    expected_fingerprints = {
+        "driver": proto_registry_utils.fingerprint(driver_entity.to_proto()),
+        "customer": proto_registry_utils.fingerprint(customer_entity.to_proto()),
+    }
+
+    statements = []
+    event.listen(
+        sql_registry.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    assert sql_registry.get_object_fingerprints("entities", project) == expected_fingerprints
+    assert not any("entity_proto" in statement for statement in statements)
+
+    desired_repo_contents = RepoContents(
+        data_sources=[],
+        feature_views=[],
+        on_demand_feature_views=[],
+        request_feature_views=[],
+        stream_feature_views=[],
+        entities=[driver_entity, customer_entity],
+        feature_services=[],
+    )
+    # Unchanged objects are not read from the registry.
+    with patch.object(sql_registry, "list_entities", side_effect=AssertionError):
+        registry_diff = diff_between(sql_registry, project, desired_repo_contents)
+    assert {
+        feast_object_diff.name: feast_object_diff.transition_type
+        for feast_object_diff in registry_diff.feast_object_diffs
+    } == {"driver": TransitionType.UNCHANGED, "customer": TransitionType.UNCHANGED}
+
+    # Objects written without a fingerprint get one computed from their proto.
+    with sql_registry.engine.connect() as conn:
+        conn.execute(registry_fingerprints.delete())
+    assert sql_registry.get_object_fingerprints("entities", project) == expected_fingerprints
+
+    sql_registry.delete_entity("customer", project)
+    assert list(sql_registry.get_object_fingerprints("entities", project)) == ["driver"]
+
+    sql_registry.teardown()
@@ -48,3 +48,32 @@ def test_get_unique_entities():
         {"entity_1": Value(int64_val=2), "entity_2": Value(string_val="2")},
     )
     assert indexes == ([0, 2], [1])
+
+
+def test_get_unique_entities_shares_results_across_feature_views():
+    entity_values = {
+        "entity_1": [Value(int64_val=3), Value(int64_val=1), Value(int64_val=3)],
+    }
+    entity_name_to_join_key_map = {"entity_1": "entity_1"}
+    fv_1, fv_2 = [
+        MockFeatureView(
+            name=name,
+            entities=["entity_1"],
+            projection=MockFeatureViewProjection(join_key_map={}),
+        )
+        for name in ["fv_1", "fv_2"]
+    ]
+    cache: Dict = {}
+
+    first = FeatureStore._get_unique_entities(
+        FeatureStore, fv_1, entity_values, entity_name_to_join_key_map, cache
+    )
+    second = FeatureStore._get_unique_entities(
+        FeatureStore, fv_2, entity_values, entity_name_to_join_key_map, cache
+    )
+
+    assert first == (
+        ({"entity_1": Value(int64_val=3)}, {"entity_1": Value(int64_val=1)}),
+        ([0, 2], [1]),
+    )
+    assert second is first
@@ -127,6 +127,8 @@ CASSANDRA_REQUIRED = [
 
 GE_REQUIRED = ["great_expectations>=0.14.0,<0.15.0"]
 
+DUCKDB_REQUIRED = ["duckdb>=0.7.0,<1"]
+
 GO_REQUIRED = [
     "cffi==1.15.*,<2",
 ]
@@ -196,6 +198,7 @@ CI_REQUIRED = (
     + HBASE_REQUIRED
     + CASSANDRA_REQUIRED
     + AZURE_REQUIRED
+    + DUCKDB_REQUIRED
 )
 
 AFFIRM_REQUIRED = [
@@ -569,6 +572,7 @@ setup(
         "go": GO_REQUIRED,
         "docs": DOCS_REQUIRED,
         "cassandra": CASSANDRA_REQUIRED,
+        "duckdb": DUCKDB_REQUIRED,
     },
     include_package_data=True,
     license="Apache",